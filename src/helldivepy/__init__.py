@@ -1,4 +1,12 @@
-from helldivepy.client import HelldiveAPIClient
+from helldivepy.cache import ResponseCache, SQLiteCache
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.compact import CompactPosition, CompactRegion, CompactStatistics
+from helldivepy.estimate import Estimate, ProgressEstimator
+from helldivepy.graph import GalaxyGraph
+from helldivepy.history import History, Series
+from helldivepy.hooks import Instrumentation, OpenTelemetryHook, RequestStats
+from helldivepy.identity import IdentityMap
+from helldivepy.lazy import LazyCampaign, LazyPlanet
 from helldivepy.models import (
     Assignment,
     Biome,
@@ -20,18 +28,51 @@ from helldivepy.models import (
     Task,
     War,
 )
+from helldivepy.poller import AsyncPoller, Poller, Update
+from helldivepy.ratelimit import RateLimiter
+from helldivepy.retry import RetryPolicy
+from helldivepy.singleflight import SingleFlight
+from helldivepy.snapshot import GalaxySnapshot
+from helldivepy.spatial import SpatialIndex
+from helldivepy.table import PlanetTable
 
 __all__ = [
     "HelldiveAPIClient",
+    "AsyncHelldiveAPIClient",
+    "ResponseCache",
+    "SQLiteCache",
+    "GalaxySnapshot",
+    "GalaxyGraph",
+    "PlanetTable",
+    "SpatialIndex",
+    "History",
+    "Series",
+    "ProgressEstimator",
+    "Estimate",
+    "IdentityMap",
+    "RetryPolicy",
+    "RateLimiter",
+    "SingleFlight",
+    "Instrumentation",
+    "RequestStats",
+    "OpenTelemetryHook",
+    "Poller",
+    "AsyncPoller",
+    "Update",
     "Assignment",
     "Biome",
     "Campaign",
+    "CompactPosition",
+    "CompactRegion",
+    "CompactStatistics",
     "Cost",
     "Dispatch",
     "Event",
     "Hazard",
     "HDMLString",
     "HomeWorld",
+    "LazyCampaign",
+    "LazyPlanet",
     "Planet",
     "Position",
     "Region",
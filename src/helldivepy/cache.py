@@ -0,0 +1,301 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+import httpx
+from pydantic import TypeAdapter
+
+from helldivepy.lazy import validate_json
+
+T = TypeVar("T")
+
+
+class CacheEntry:
+    """A cached response body plus everything needed to revalidate it.
+
+    Validated results are memoized per adapter, so as long as the body bytes do not
+    change a response is validated at most once. Raw results are decoded again on
+    every call, since plain dicts and lists are easily modified by the caller.
+    """
+
+    __slots__ = ("content", "etag", "last_modified", "expires_at", "_results")
+
+    def __init__(
+        self,
+        content: bytes,
+        etag: str | None,
+        last_modified: str | None,
+        expires_at: float,
+    ) -> None:
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self._results: dict[object, Any] = {}
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the entry can be served without contacting the API."""
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that turn the next request into a conditional one."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def result(self, adapter: TypeAdapter[T] | None = None) -> Any:
+        """Return the decoded body, or the body validated by `adapter` if given.
+
+        Lists are returned as a new list on every call, so sorting or appending
+        to one does not affect other callers; the models in it are shared.
+        """
+        if adapter is None:
+            return json.loads(self.content)
+        if adapter not in self._results:
+            self._results[adapter] = validate_json(adapter, self.content)
+        result = self._results[adapter]
+        if isinstance(result, list):
+            return list(cast(list[Any], result))
+        return result
+
+
+class ResponseCache:
+    """In-memory TTL cache with LRU eviction and conditional revalidation.
+
+    Pass an instance to `HelldiveAPIClient(cache=...)` to cache every module
+    call. Fresh entries are served without any request. Stale entries are
+    revalidated with `If-None-Match`/`If-Modified-Since` when the API supplied
+    an `ETag`/`Last-Modified`; a `304` (or an identical body) reuses the
+    already validated models instead of building new ones.
+
+    Entries are keyed by request URL, so one cache can be shared by clients
+    with different `base_url`s.
+
+    Note:
+        Cached models are shared: repeated calls may return the same model
+        instances, so treat them as read-only. Lists and raw results are new
+        objects on every call.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        ttls: Mapping[str, float] | None = None,
+        maxsize: int = 128,
+    ) -> None:
+        """Create a new response cache.
+
+        Args:
+            ttl: Default time-to-live in seconds. `0` revalidates on every call.
+            ttls: Per-endpoint overrides keyed by path prefix, e.g.
+                `{"/v1/steam": 300}`. The longest matching prefix wins.
+            maxsize: Maximum number of cached responses before the least
+                recently used entry is evicted.
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> float:
+        """Return the TTL that applies to `path`."""
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else self.ttl
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the entry for `url`, fresh or stale, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(
+        self, url: str, response: httpx.Response, path: str | None = None
+    ) -> CacheEntry:
+        """Cache a `200` response, keeping parsed results if the body is unchanged.
+
+        Args:
+            url: The request URL the response is cached under.
+            response: The response to cache.
+            path: API path its TTL is looked up for. Defaults to `url`.
+        """
+        entry = CacheEntry(
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            time.monotonic() + self.ttl_for(url if path is None else path),
+        )
+        with self._lock:
+            previous = self._entries.get(url)
+            if previous is not None and previous.content == entry.content:
+                entry._results = previous._results  # pyright: ignore[reportPrivateUsage]
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def revalidate(
+        self,
+        url: str,
+        entry: CacheEntry,
+        response: httpx.Response,
+        path: str | None = None,
+    ) -> CacheEntry:
+        """Extend the lifetime of `entry` after a `304 Not Modified`.
+
+        Args:
+            url: The request URL `entry` is cached under.
+            entry: The revalidated entry.
+            response: The `304` response.
+            path: API path its TTL is looked up for. Defaults to `url`.
+        """
+        entry.etag = response.headers.get("ETag", entry.etag)
+        entry.last_modified = response.headers.get("Last-Modified", entry.last_modified)
+        entry.expires_at = time.monotonic() + self.ttl_for(
+            url if path is None else path
+        )
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory: `$XDG_CACHE_HOME/helldivepy` or `~/.cache/...`."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "helldivepy"
+
+
+class SQLiteCache(ResponseCache):
+    """A `ResponseCache` persisted to an SQLite database on disk.
+
+    Response bodies are stored as they were received, next to their `ETag`,
+    `Last-Modified` and expiry time, so a new process starts warm: a fresh
+    entry written by an earlier run (or by another process sharing the file)
+    is served with a disk read instead of a request. The database runs in WAL
+    mode, so any number of processes on one host can read and write it
+    concurrently. Like in memory, entries are keyed by request URL, so
+    clients of different servers can share the default file.
+
+    Entries are also kept in memory, with the same TTL and LRU rules as
+    `ResponseCache`; the database is only read when the in-memory entry is
+    missing or stale.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        ttl: float = 5.0,
+        ttls: Mapping[str, float] | None = None,
+        maxsize: int = 128,
+    ) -> None:
+        """Open (or create) a persistent response cache.
+
+        Args:
+            path: Database file. Defaults to `cache.sqlite3` in
+                `default_cache_dir()`.
+            ttl: Default time-to-live in seconds. `0` revalidates on every call.
+            ttls: Per-endpoint overrides keyed by path prefix, e.g.
+                `{"/v1/steam": 300}`. The longest matching prefix wins.
+            maxsize: Maximum number of responses kept in memory. The database
+                itself is not size-limited.
+        """
+        super().__init__(ttl, ttls, maxsize)
+        if path is None:
+            path = default_cache_dir() / "cache.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+        self._db_lock = threading.Lock()
+        with self._db_lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, content BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, expires REAL NOT NULL)"
+            )
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the entry for `url`, falling back to the database when stale."""
+        entry = super().get(url)
+        if entry is not None and entry.fresh:
+            return entry
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT content, etag, last_modified, expires FROM responses "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return entry
+        content, etag, last_modified, expires = row
+        # Stored expiry is wall-clock time; entries use the monotonic clock.
+        expires_at = time.monotonic() + (expires - time.time())
+        if entry is not None and expires_at <= entry.expires_at:
+            return entry
+        loaded = CacheEntry(content, etag, last_modified, expires_at)
+        with self._lock:
+            if entry is not None and entry.content == loaded.content:
+                loaded._results = entry._results  # pyright: ignore[reportPrivateUsage]
+            self._entries[url] = loaded
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return loaded
+
+    def store(
+        self, url: str, response: httpx.Response, path: str | None = None
+    ) -> CacheEntry:
+        """Cache a `200` response in memory and on disk."""
+        entry = super().store(url, response, path)
+        self._write(url, entry)
+        return entry
+
+    def revalidate(
+        self,
+        url: str,
+        entry: CacheEntry,
+        response: httpx.Response,
+        path: str | None = None,
+    ) -> CacheEntry:
+        """Extend the lifetime of `entry`, in memory and on disk."""
+        entry = super().revalidate(url, entry, response, path)
+        self._write(url, entry)
+        return entry
+
+    def _write(self, url: str, entry: CacheEntry) -> None:
+        expires = time.time() + (entry.expires_at - time.monotonic())
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (url, entry.content, entry.etag, entry.last_modified, expires),
+            )
+
+    def clear(self) -> None:
+        """Drop every cached response, in memory and on disk."""
+        super().clear()
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            self._db.close()
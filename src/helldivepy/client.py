@@ -1,17 +1,34 @@
+import asyncio
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import get_type_hints
 
 import httpx
 
-from helldivepy.modules import BaseModule
+from helldivepy.cache import ResponseCache
+from helldivepy.hooks import Instrumentation
+from helldivepy.identity import IdentityMap
+from helldivepy.modules import AsyncBaseModule, BaseModule
 
 # Modules
-from helldivepy.modules.assignments import AssignmentsModule
-from helldivepy.modules.campaigns import CampaignModule
-from helldivepy.modules.dispatches import DispatchesModule
-from helldivepy.modules.planets import PlanetModule
-from helldivepy.modules.space_stations import SpaceStationsModule
-from helldivepy.modules.steam import SteamModule
-from helldivepy.modules.war import WarModule
+from helldivepy.modules.assignments import AssignmentsModule, AsyncAssignmentsModule
+from helldivepy.modules.campaigns import AsyncCampaignModule, CampaignModule
+from helldivepy.modules.dispatches import AsyncDispatchesModule, DispatchesModule
+from helldivepy.modules.planets import AsyncPlanetModule, PlanetModule
+from helldivepy.modules.space_stations import (
+    AsyncSpaceStationsModule,
+    SpaceStationsModule,
+)
+from helldivepy.modules.steam import AsyncSteamModule, SteamModule
+from helldivepy.modules.war import AsyncWarModule, WarModule
+from helldivepy.poller import AsyncPoller, Poller
+from helldivepy.ratelimit import RateLimiter
+from helldivepy.retry import RetryPolicy
+from helldivepy.singleflight import SingleFlight
+from helldivepy.snapshot import GalaxySnapshot
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+"""Connection pool limits used unless overridden (the same as httpx's defaults)."""
 
 
 class HelldiveAPIClient:
@@ -28,6 +45,17 @@ class HelldiveAPIClient:
         client: str = "helldivepy",
         contact: str = "github:ajxd2/helldive.py",
         base_url: str = "https://api.helldivers2.dev/api",
+        cache: ResponseCache | None = None,
+        identity_map: IdentityMap | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        single_flight: SingleFlight | None = None,
+        instrumentation: Instrumentation | None = None,
+        http_client: httpx.Client | None = None,
+        transport: httpx.BaseTransport | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout | float | None = 5.0,
+        http2: bool = False,
     ):
         """Create a new API client.
 
@@ -37,17 +65,237 @@ class HelldiveAPIClient:
             contact: Contact info for your app, sent as `X-Super-Contact`. Typically
                 a GitHub URL or email address.
             base_url: API base URL. Override for testing or alternative deployments.
+            cache: Optional response cache shared by every module. Disabled by
+                default; see `ResponseCache`.
+            identity_map: Optional identity map that interns planets, biomes and
+                hazards across responses. Disabled by default; see `IdentityMap`.
+            retry: Optional retry policy for rate-limited, failed or dropped
+                requests. Disabled by default; see `RetryPolicy`.
+            rate_limiter: Optional client-side rate limit applied before every
+                request. Disabled by default; see `RateLimiter`.
+            single_flight: Optional coalescer that makes identical concurrent
+                requests share one HTTP call. Disabled by default; see
+                `SingleFlight`.
+            instrumentation: Optional hooks called with timings, sizes and
+                cache outcome of every module call. Disabled by default; see
+                `Instrumentation`.
+            http_client: A pre-configured `httpx.Client` to send requests with.
+                It is not closed by this client, and the options below are
+                ignored when it is given.
+            transport: Custom httpx transport, e.g. `httpx.MockTransport` for tests
+                or a transport with custom retries/proxies.
+            limits: Connection pool limits (max connections, keep-alive).
+            timeout: Request timeout in seconds, or an `httpx.Timeout` with
+                separate connect/read/write/pool timeouts.
+            http2: Multiplex requests over HTTP/2 connections. Requires the
+                `http2` extra (`pip install helldivepy[http2]`).
         """
         self.base_url = base_url
         self.headers = {"X-Super-Client": client, "X-Super-Contact": contact}
-        self.client = httpx.Client()
+        self.cache = cache
+        self.identity_map = identity_map
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.instrumentation = instrumentation
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.Client(
+            transport=transport,
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+        )
 
         for attr, cls in get_type_hints(type(self)).items():
             if isinstance(cls, type) and issubclass(cls, BaseModule):
                 setattr(self, attr, cls(self))
 
+    def snapshot(self) -> GalaxySnapshot:
+        """Fetch war, planets, campaigns, assignments and space stations at once.
+
+        The five requests run concurrently, so a tick costs as much as the
+        slowest endpoint rather than the sum of all of them.
+
+        Returns:
+            An immutable GalaxySnapshot with deduplicated planets.
+        """
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            war = pool.submit(self.war.get)
+            planets = pool.submit(self.planets.get_all)
+            campaigns = pool.submit(self.campaigns.get_all)
+            assignments = pool.submit(self.assignments.get_all)
+            space_stations = pool.submit(self.space_stations.get_all)
+            return GalaxySnapshot.build(
+                war.result(),
+                planets.result(),
+                campaigns.result(),
+                assignments.result(),
+                space_stations.result(),
+            )
+
+    def poller(
+        self,
+        intervals: Mapping[str, float] | None = None,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+    ) -> Poller:
+        """Create a `Poller` that emits changes of this client's resources.
+
+        Args:
+            intervals: Base interval in seconds per resource to poll, e.g.
+                `{"planets": 10, "dispatches": 60}`. Defaults to every resource
+                at its `DEFAULT_INTERVALS` interval.
+            min_interval: Shortest delay between two polls of one resource.
+            max_interval: Longest delay the back-off can reach.
+            backoff: Interval multiplier applied after a poll without changes.
+        """
+        return Poller(self, intervals, min_interval, max_interval, backoff)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool, unless it was injected."""
+        if self._owns_client:
+            self.client.close()
+
     def __enter__(self) -> "HelldiveAPIClient":
         return self
 
     def __exit__(self, *_: object) -> None:
-        self.client.close()
+        self.close()
+
+
+class AsyncHelldiveAPIClient:
+    """Asyncio counterpart of `HelldiveAPIClient`.
+
+    Exposes the same modules, but every method is a coroutine and requests go
+    through a shared `httpx.AsyncClient`, so many calls can run concurrently on
+    one event loop.
+    """
+
+    war: AsyncWarModule
+    dispatches: AsyncDispatchesModule
+    planets: AsyncPlanetModule
+    assignments: AsyncAssignmentsModule
+    campaigns: AsyncCampaignModule
+    space_stations: AsyncSpaceStationsModule
+    steam: AsyncSteamModule
+
+    def __init__(
+        self,
+        client: str = "helldivepy",
+        contact: str = "github:ajxd2/helldive.py",
+        base_url: str = "https://api.helldivers2.dev/api",
+        cache: ResponseCache | None = None,
+        identity_map: IdentityMap | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        single_flight: SingleFlight | None = None,
+        instrumentation: Instrumentation | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout | float | None = 5.0,
+        http2: bool = False,
+    ):
+        """Create a new asyncio API client.
+
+        Args:
+            client: Your application name, sent as `X-Super-Client`. Identifies your
+                app to the API operators.
+            contact: Contact info for your app, sent as `X-Super-Contact`. Typically
+                a GitHub URL or email address.
+            base_url: API base URL. Override for testing or alternative deployments.
+            cache: Optional response cache shared by every module. Disabled by
+                default; see `ResponseCache`.
+            identity_map: Optional identity map that interns planets, biomes and
+                hazards across responses. Disabled by default; see `IdentityMap`.
+            retry: Optional retry policy for rate-limited, failed or dropped
+                requests. Disabled by default; see `RetryPolicy`.
+            rate_limiter: Optional client-side rate limit applied before every
+                request. Disabled by default; see `RateLimiter`.
+            single_flight: Optional coalescer that makes identical concurrent
+                requests share one HTTP call. Disabled by default; see
+                `SingleFlight`.
+            instrumentation: Optional hooks called with timings, sizes and
+                cache outcome of every module call. Disabled by default; see
+                `Instrumentation`.
+            http_client: A pre-configured `httpx.AsyncClient` to send requests with.
+                It is not closed by this client, and the options below are
+                ignored when it is given.
+            transport: Custom httpx transport, e.g. `httpx.MockTransport` for tests
+                or a transport with custom retries/proxies.
+            limits: Connection pool limits (max connections, keep-alive).
+            timeout: Request timeout in seconds, or an `httpx.Timeout` with
+                separate connect/read/write/pool timeouts.
+            http2: Multiplex requests over HTTP/2 connections. Requires the
+                `http2` extra (`pip install helldivepy[http2]`).
+        """
+        self.base_url = base_url
+        self.headers = {"X-Super-Client": client, "X-Super-Contact": contact}
+        self.cache = cache
+        self.identity_map = identity_map
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.instrumentation = instrumentation
+        self._owns_client = http_client is None
+        self.client = http_client or httpx.AsyncClient(
+            transport=transport,
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+        )
+
+        for attr, cls in get_type_hints(type(self)).items():
+            if isinstance(cls, type) and issubclass(cls, AsyncBaseModule):
+                setattr(self, attr, cls(self))
+
+    async def snapshot(self) -> GalaxySnapshot:
+        """Fetch war, planets, campaigns, assignments and space stations at once.
+
+        The five requests run concurrently, so a tick costs as much as the
+        slowest endpoint rather than the sum of all of them.
+
+        Returns:
+            An immutable GalaxySnapshot with deduplicated planets.
+        """
+        war, planets, campaigns, assignments, space_stations = await asyncio.gather(
+            self.war.get(),
+            self.planets.get_all(),
+            self.campaigns.get_all(),
+            self.assignments.get_all(),
+            self.space_stations.get_all(),
+        )
+        return GalaxySnapshot.build(
+            war, planets, campaigns, assignments, space_stations
+        )
+
+    def poller(
+        self,
+        intervals: Mapping[str, float] | None = None,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+    ) -> AsyncPoller:
+        """Create an `AsyncPoller` that emits changes of this client's resources.
+
+        Args:
+            intervals: Base interval in seconds per resource to poll, e.g.
+                `{"planets": 10, "dispatches": 60}`. Defaults to every resource
+                at its `DEFAULT_INTERVALS` interval.
+            min_interval: Shortest delay between two polls of one resource.
+            max_interval: Longest delay the back-off can reach.
+            backoff: Interval multiplier applied after a poll without changes.
+        """
+        return AsyncPoller(self, intervals, min_interval, max_interval, backoff)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool, unless it was injected."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncHelldiveAPIClient":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
@@ -0,0 +1,100 @@
+"""Compact, immutable stand-ins for the most numerous models.
+
+Each class is a frozen, slotted dataclass: no per-instance `__dict__`, no
+pydantic bookkeeping, just the field values. Use them to keep long histories
+of regions, positions and statistics in memory, and convert back to the
+regular models with `to_model()` when you need them.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Self
+
+from helldivepy.enums import RegionSize
+from helldivepy.models import APIModel, Position, Region, Statistics
+
+
+@dataclass(frozen=True, slots=True)
+class _Compact:
+    _model: ClassVar[type[APIModel]]
+
+    @classmethod
+    def from_model(cls, model: Any) -> Self:
+        """Copy every field of `model` into a new compact instance."""
+        return cls(*(getattr(model, f.name) for f in fields(cls)))
+
+    def to_model(self) -> Any:
+        # Values were validated when the source model was built, so skip
+        # validation; optional fields that are None count as unset, as they do
+        # when absent from the API payload.
+        model_fields = self._model.model_fields
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        fields_set = {
+            name
+            for name, value in values.items()
+            if value is not None or model_fields[name].is_required()
+        }
+        return self._model.model_construct(_fields_set=fields_set, **values)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactPosition(_Compact):
+    """Compact `Position`."""
+
+    _model: ClassVar[type[APIModel]] = Position
+
+    x: float
+    y: float
+
+    def to_model(self) -> Position:
+        """Convert back into a regular `Position`."""
+        return _Compact.to_model(self)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactRegion(_Compact):
+    """Compact `Region`."""
+
+    _model: ClassVar[type[APIModel]] = Region
+
+    id: int
+    hash: int
+    name: str | None
+    description: str | None
+    health: int | None
+    max_health: int
+    size: RegionSize
+    regen_per_second: float | None
+    availability_factor: float | None
+    is_available: bool
+    players: int
+
+    def to_model(self) -> Region:
+        """Convert back into a regular `Region`."""
+        return _Compact.to_model(self)
+
+
+@dataclass(frozen=True, slots=True)
+class CompactStatistics(_Compact):
+    """Compact `Statistics`."""
+
+    _model: ClassVar[type[APIModel]] = Statistics
+
+    missions_won: int
+    missions_lost: int
+    mission_time: int
+    terminid_kills: int
+    automaton_kills: int
+    illuminate_kills: int
+    bullets_fired: int
+    bullets_hit: int
+    time_played: int
+    deaths: int
+    revives: int
+    friendlies: int
+    mission_success_rate: float
+    accuracy: float
+    player_count: int
+
+    def to_model(self) -> Statistics:
+        """Convert back into a regular `Statistics`."""
+        return _Compact.to_model(self)
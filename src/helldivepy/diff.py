@@ -0,0 +1,267 @@
+"""Compute what changed between two polls of the API.
+
+Every `diff_*` function takes the old and the new result of a module call (or
+`diff_snapshots()` two whole `GalaxySnapshot`s) and returns a list of typed
+change records. Objects are matched by `index`/`id`. Each object is reduced
+once to a fingerprint, a tuple of just the fields a diff reports on, and pairs
+that are the same instance (e.g. served from a `ResponseCache` or interned by
+an `IdentityMap`) or have the same fingerprint are skipped without comparing
+the models themselves.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from helldivepy.enums import Factions
+from helldivepy.models import Assignment, Campaign, Dispatch, Event, Planet
+from helldivepy.snapshot import GalaxySnapshot
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """Base class of every change record."""
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetAdded(Change):
+    """A planet appeared in the galaxy."""
+
+    planet: Planet
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetRemoved(Change):
+    """A planet disappeared. `planet` is its last known state."""
+
+    planet: Planet
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetOwnerChanged(Change):
+    """A planet was captured or liberated."""
+
+    index: int
+    old: Factions
+    new: Factions
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetHealthChanged(Change):
+    """A planet's health moved."""
+
+    index: int
+    old: int
+    new: int
+
+    @property
+    def delta(self) -> int:
+        return self.new - self.old
+
+
+@dataclass(frozen=True, slots=True)
+class EventStarted(Change):
+    """An event (e.g. a defense) started on a planet."""
+
+    index: int
+    event: Event
+
+
+@dataclass(frozen=True, slots=True)
+class EventEnded(Change):
+    """An event ended on a planet. `event` is its last known state."""
+
+    index: int
+    event: Event
+
+
+@dataclass(frozen=True, slots=True)
+class RegionAvailabilityChanged(Change):
+    """A region became playable, or stopped being playable."""
+
+    planet_index: int
+    region_id: int
+    is_available: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignStarted(Change):
+    """A new campaign appeared."""
+
+    campaign: Campaign
+
+
+@dataclass(frozen=True, slots=True)
+class CampaignEnded(Change):
+    """A campaign disappeared. `campaign` is its last known state."""
+
+    campaign: Campaign
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentIssued(Change):
+    """A new assignment (Major Order) was issued."""
+
+    assignment: Assignment
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentEnded(Change):
+    """An assignment disappeared. `assignment` is its last known state."""
+
+    assignment: Assignment
+
+
+@dataclass(frozen=True, slots=True)
+class TaskProgressChanged(Change):
+    """Progress of one task of an assignment moved."""
+
+    assignment_id: int
+    task: int
+    """Position of the task in `Assignment.tasks`."""
+    old: int
+    new: int
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchPublished(Change):
+    """A new dispatch was published."""
+
+    dispatch: Dispatch
+
+
+def _match(
+    old: Iterable[T],
+    new: Iterable[T],
+    key: Callable[[T], K],
+    fingerprint: Callable[[T], Hashable] | None = None,
+) -> tuple[list[T], list[T], list[tuple[T, T]]]:
+    """Split two results into (added, removed, changed pairs), in new order.
+
+    Pairs are only compared, by `fingerprint`, when one is given; otherwise no
+    changed pairs are returned.
+    """
+    before = {key(item): item for item in old}
+    added: list[T] = []
+    changed: list[tuple[T, T]] = []
+    for item in new:
+        previous = before.pop(key(item), None)
+        if previous is None:
+            added.append(item)
+        elif (
+            fingerprint is not None
+            and previous is not item
+            and fingerprint(previous) != fingerprint(item)
+        ):
+            changed.append((previous, item))
+    return added, list(before.values()), changed
+
+
+def _planet_fingerprint(planet: Planet) -> tuple[Any, ...]:
+    # Everything `_planet_changes()` looks at.
+    event = planet.event
+    return (
+        planet.current_owner,
+        planet.health,
+        None if event is None else event.id,
+        tuple((region.id, region.is_available) for region in planet.regions),
+    )
+
+
+def _planet_changes(old: Planet, new: Planet) -> Iterator[Change]:
+    if old.current_owner != new.current_owner:
+        yield PlanetOwnerChanged(new.index, old.current_owner, new.current_owner)
+    if old.health != new.health:
+        yield PlanetHealthChanged(new.index, old.health, new.health)
+    old_event, new_event = old.event, new.event
+    if old_event is not None and (new_event is None or new_event.id != old_event.id):
+        yield EventEnded(new.index, old_event)
+    if new_event is not None and (old_event is None or old_event.id != new_event.id):
+        yield EventStarted(new.index, new_event)
+    if old.regions is not new.regions:
+        was_available = {r.id: r.is_available for r in old.regions}
+        for region in new.regions:
+            if was_available.get(region.id, False) != region.is_available:
+                yield RegionAvailabilityChanged(
+                    new.index, region.id, region.is_available
+                )
+
+
+def diff_planets(old: Iterable[Planet], new: Iterable[Planet]) -> list[Change]:
+    """Planets added or removed, owner flips, health changes, events and regions.
+
+    Returns:
+        `PlanetRemoved`, `PlanetAdded`, `PlanetOwnerChanged`,
+        `PlanetHealthChanged`, `EventStarted`, `EventEnded` and
+        `RegionAvailabilityChanged` records.
+    """
+    added, removed, changed = _match(old, new, lambda p: p.index, _planet_fingerprint)
+    return [
+        *(PlanetRemoved(planet) for planet in removed),
+        *(PlanetAdded(planet) for planet in added),
+        *(change for pair in changed for change in _planet_changes(*pair)),
+    ]
+
+
+def diff_campaigns(old: Iterable[Campaign], new: Iterable[Campaign]) -> list[Change]:
+    """Campaigns that started or ended.
+
+    Returns:
+        `CampaignStarted` and `CampaignEnded` records.
+    """
+    added, removed, _ = _match(old, new, lambda c: c.id)
+    return [
+        *(CampaignEnded(campaign) for campaign in removed),
+        *(CampaignStarted(campaign) for campaign in added),
+    ]
+
+
+def diff_assignments(
+    old: Iterable[Assignment], new: Iterable[Assignment]
+) -> list[Change]:
+    """Assignments issued or ended, and task progress.
+
+    Returns:
+        `AssignmentIssued`, `AssignmentEnded` and `TaskProgressChanged`
+        records.
+    """
+    added, removed, changed = _match(
+        old, new, lambda a: a.id, lambda a: tuple(a.progress)
+    )
+    changes: list[Change] = [AssignmentEnded(assignment) for assignment in removed]
+    changes.extend(AssignmentIssued(assignment) for assignment in added)
+    for before, after in changed:
+        for task, (was, now) in enumerate(
+            zip(before.progress, after.progress, strict=False)
+        ):
+            if was != now:
+                changes.append(TaskProgressChanged(after.id, task, was, now))
+    return changes
+
+
+def diff_dispatches(old: Iterable[Dispatch], new: Iterable[Dispatch]) -> list[Change]:
+    """Dispatches published since the old result.
+
+    Returns:
+        `DispatchPublished` records.
+    """
+    added, _, _ = _match(old, new, lambda d: d.id)
+    return [DispatchPublished(dispatch) for dispatch in added]
+
+
+def diff_snapshots(old: GalaxySnapshot, new: GalaxySnapshot) -> list[Change]:
+    """Everything that changed between two snapshots.
+
+    Returns:
+        The planet changes, then the campaign changes, then the assignment
+        changes (see `diff_planets()`, `diff_campaigns()` and
+        `diff_assignments()`).
+    """
+    return [
+        *diff_planets(old.planets, new.planets),
+        *diff_campaigns(old.campaigns, new.campaigns),
+        *diff_assignments(old.assignments, new.assignments),
+    ]
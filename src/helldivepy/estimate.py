@@ -0,0 +1,323 @@
+"""Project liberation, defense and Major Order progress from successive polls."""
+
+from collections import deque
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import sqrt
+from statistics import NormalDist
+from typing import TypeVar
+
+from helldivepy.enums import Factions
+from helldivepy.models import Assignment, PlanetLike, War
+from helldivepy.snapshot import GalaxySnapshot
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass(frozen=True, slots=True)
+class Estimate:
+    """Where some progress is heading, as fitted over the estimator's window."""
+
+    progress: float
+    """Last observed progress, in percent."""
+    rate: float
+    """Current net progress rate, in percentage points per hour. Negative when
+    the enemy is winning."""
+    eta: datetime | None
+    """When progress is projected to reach 100%, or None if it isn't
+    progressing."""
+    earliest: datetime | None
+    """Early end of the confidence band of `eta`, or None without one."""
+    latest: datetime | None
+    """Late end of the confidence band of `eta`. None if the slow end of the
+    band doesn't progress at all, or without a band."""
+    deadline: datetime | None
+    """When the event ends or the assignment expires, None for planets."""
+    samples: int
+    """Number of observations the fit is based on."""
+
+    @property
+    def on_track(self) -> bool | None:
+        """Whether `eta` is before `deadline`. None without a deadline."""
+        if self.deadline is None:
+            return None
+        return self.eta is not None and self.eta <= self.deadline
+
+
+class _Track:
+    """Rolling least-squares fit of progress against multiplier-weighted time.
+
+    Two things make raw progress a poor straight line: players' impact scales
+    with `War.impact_multiplier`, which changes over time, and planets
+    regenerate at `regen_per_second` whether anyone is fighting or not. So the
+    regression is over `x`, the time integral of the multiplier, and `y`, the
+    progress with all regeneration so far added back. Its slope is the
+    progress per unit of multiplier-weighted time, and the net rate now is
+    `slope * multiplier - decay`.
+
+    Sums are kept incrementally and old samples leave the window one by one,
+    so each observation costs O(1).
+    """
+
+    __slots__ = (
+        "key",
+        "deadline",
+        "samples",
+        "time",
+        "x",
+        "regenerated",
+        "multiplier",
+        "decay",
+        "progress",
+        "n",
+        "sx",
+        "sy",
+        "sxx",
+        "sxy",
+        "syy",
+    )
+
+    def __init__(self, key: Hashable, deadline: datetime | None) -> None:
+        self.key = key
+        self.deadline = deadline
+        self.samples: deque[tuple[float, float, float]] = deque()
+        self.time: float | None = None
+        self.x = self.regenerated = 0.0
+        self.multiplier = self.decay = self.progress = 0.0
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = self.syy = 0.0
+
+    def add(
+        self, time: float, progress: float, multiplier: float, decay: float
+    ) -> None:
+        if self.time is not None:
+            elapsed = time - self.time
+            # Both held since the previous observation.
+            self.x += self.multiplier * elapsed
+            self.regenerated += self.decay * elapsed
+        self.time, self.multiplier, self.decay = time, multiplier, decay
+        self.progress = progress
+        x, y = self.x, progress + self.regenerated
+        self.samples.append((time, x, y))
+        self._sum(x, y, 1)
+
+    def expire(self, before: float) -> None:
+        while len(self.samples) > 2 and self.samples[0][0] < before:
+            _, x, y = self.samples.popleft()
+            self._sum(x, y, -1)
+
+    def _sum(self, x: float, y: float, sign: int) -> None:
+        self.n += sign
+        self.sx += sign * x
+        self.sy += sign * y
+        self.sxx += sign * x * x
+        self.sxy += sign * x * y
+        self.syy += sign * y * y
+
+    def estimate(self, now: datetime, z: float) -> Estimate | None:
+        n = self.n
+        if n < 2:
+            return None
+        sxx = self.sxx - self.sx * self.sx / n
+        if sxx <= 0:
+            return None
+        sxy = self.sxy - self.sx * self.sy / n
+        slope = sxy / sxx
+        rate = slope * self.multiplier - self.decay
+        remaining = 100.0 - self.progress
+
+        def eta(rate: float) -> datetime | None:
+            if remaining <= 0:
+                return now
+            if rate <= 0:
+                return None
+            return now + timedelta(seconds=remaining / rate)
+
+        earliest = latest = None
+        if n > 2:
+            residual = max(self.syy - self.sy * self.sy / n - slope * sxy, 0.0)
+            error = z * sqrt(residual / (n - 2) / sxx) * self.multiplier
+            earliest, latest = eta(rate + error), eta(rate - error)
+        return Estimate(
+            progress=self.progress,
+            rate=rate * 3600,
+            eta=eta(rate),
+            earliest=earliest,
+            latest=latest,
+            deadline=self.deadline,
+            samples=n,
+        )
+
+
+class ProgressEstimator:
+    """Estimates rates and ETAs of planet liberations, defenses and tasks.
+
+    Feed it every poll with `update()` (or `update_snapshot()`); it keeps a
+    rolling linear fit per planet, per event and per assignment task over the
+    last `window` seconds of `War.now`, at O(1) cost per item and update.
+
+    - Planets not held by the Humans: liberation, `100 * (1 - health /
+      max_health)`, accounting for `regen_per_second`.
+    - Events (defenses): `100 * (1 - health / max_health)` of the event,
+      projected against its `end_time`.
+    - Assignment tasks with a goal: `Task.progress_perc`, projected against
+      `Assignment.expiration`.
+
+    Planet and event rates account for changes of `War.impact_multiplier`:
+    the fit normalizes past progress by the multiplier in effect at the time,
+    and projects with the current one.
+    """
+
+    def __init__(self, window: float = 3600.0, confidence: float = 0.9) -> None:
+        """Create a new estimator.
+
+        Args:
+            window: Seconds of history each fit is based on.
+            confidence: Probability covered by the `earliest`/`latest` band
+                of an estimate.
+
+        Raises:
+            ValueError: If `window` is not positive or `confidence` is not
+                between 0 and 1.
+        """
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+        self.window = window
+        self.confidence = confidence
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self._now: datetime | None = None
+        self._planets: dict[int, _Track] = {}
+        self._events: dict[int, _Track] = {}
+        self._tasks: dict[tuple[int, int], _Track] = {}
+
+    def update(
+        self,
+        war: War,
+        planets: Iterable[PlanetLike] = (),
+        assignments: Iterable[Assignment] = (),
+    ) -> bool:
+        """Add one poll of the galaxy.
+
+        Items absent from this poll (liberated planets, ended events and
+        expired assignments) are dropped.
+
+        Args:
+            war: The output of `war.get()`; `war.now` timestamps the poll.
+            planets: The planets, e.g. the output of `planets.get_all()`.
+            assignments: The assignments, e.g. the output of
+                `assignments.get_all()`.
+
+        Returns:
+            False, without updating anything, if `war.now` is not later than
+            that of the previous update.
+        """
+        now = war.now
+        if self._now is not None and now <= self._now:
+            return False
+        self._now = now
+        time = now.timestamp()
+        multiplier = war.impact_multiplier
+
+        planet_tracks: dict[int, _Track] = {}
+        event_tracks: dict[int, _Track] = {}
+        for planet in planets:
+            if planet.current_owner != Factions.Humans and planet.max_health:
+                # Owners and max health change on capture; start over then.
+                key = (planet.current_owner, planet.max_health)
+                track = self._planets.get(planet.index)
+                if track is None or track.key != key:
+                    track = _Track(key, None)
+                decay = 100 * planet.regen_per_second / planet.max_health
+                progress = 100 * (1 - planet.health / planet.max_health)
+                track.add(time, progress, multiplier, decay)
+                planet_tracks[planet.index] = track
+            event = planet.event
+            if event is not None and event.max_health:
+                track = self._events.get(event.id) or _Track(event.id, event.end_time)
+                progress = 100 * (1 - event.health / event.max_health)
+                track.add(time, progress, multiplier, 0.0)
+                event_tracks[event.id] = track
+
+        task_tracks: dict[tuple[int, int], _Track] = {}
+        for assignment in assignments:
+            for number, task in enumerate(assignment.tasks):
+                progress = task.progress_perc
+                if progress is None:
+                    continue
+                key = (assignment.id, number)
+                track = self._tasks.get(key) or _Track(key, assignment.expiration)
+                track.add(time, progress, 1.0, 0.0)
+                task_tracks[key] = track
+
+        before = time - self.window
+        for tracks in (planet_tracks, event_tracks, task_tracks):
+            for track in tracks.values():
+                track.expire(before)
+        self._planets, self._events, self._tasks = (
+            planet_tracks,
+            event_tracks,
+            task_tracks,
+        )
+        return True
+
+    def update_snapshot(self, snapshot: GalaxySnapshot) -> bool:
+        """Add a `GalaxySnapshot`: its war, planets and assignments."""
+        return self.update(snapshot.war, snapshot.planets, snapshot.assignments)
+
+    def _estimate(self, track: _Track | None) -> Estimate | None:
+        if track is None or self._now is None:
+            return None
+        return track.estimate(self._now, self._z)
+
+    def planet(self, index: int) -> Estimate | None:
+        """Liberation estimate of a planet.
+
+        Returns:
+            None until the planet has been seen in two updates, or if it is
+            held by the Humans.
+        """
+        return self._estimate(self._planets.get(index))
+
+    def event(self, event_id: int) -> Estimate | None:
+        """Defense estimate of an event, by `Event.id`.
+
+        Returns:
+            None until the event has been seen in two updates.
+        """
+        return self._estimate(self._events.get(event_id))
+
+    def task(self, assignment_id: int, task: int) -> Estimate | None:
+        """Progress estimate of one task of an assignment.
+
+        Args:
+            assignment_id: `Assignment.id`.
+            task: Position of the task in `Assignment.tasks`.
+
+        Returns:
+            None until the task has been seen in two updates, or if it has no
+            goal.
+        """
+        return self._estimate(self._tasks.get((assignment_id, task)))
+
+    def planets(self) -> dict[int, Estimate]:
+        """Liberation estimates of every tracked planet, by index."""
+        return self._estimates(self._planets)
+
+    def events(self) -> dict[int, Estimate]:
+        """Defense estimates of every tracked event, by id."""
+        return self._estimates(self._events)
+
+    def tasks(self) -> dict[tuple[int, int], Estimate]:
+        """Estimates of every tracked task, by `(assignment_id, task)`."""
+        return self._estimates(self._tasks)
+
+    def _estimates(self, tracks: dict[K, _Track]) -> dict[K, Estimate]:
+        estimates: dict[K, Estimate] = {}
+        for key, track in tracks.items():
+            estimate = self._estimate(track)
+            if estimate is not None:
+                estimates[key] = estimate
+        return estimates
@@ -0,0 +1,262 @@
+"""Supply-line graph of the galaxy, built from `Planet.waypoints`."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable, Sequence
+from itertools import accumulate, chain
+
+from helldivepy.enums import Factions
+from helldivepy.models import PlanetLike
+
+
+def _csr(adjacency: Sequence[Iterable[int]]) -> tuple[array[int], array[int]]:
+    # Compressed sparse rows: the neighbours of row r are
+    # targets[offsets[r]:offsets[r + 1]].
+    rows = [sorted(set(neighbours)) for neighbours in adjacency]
+    offsets = array("q", accumulate((len(row) for row in rows), initial=0))
+    targets = array("q", chain.from_iterable(rows))
+    return offsets, targets
+
+
+class GalaxyGraph:
+    """The galaxy's supply lines and attacks as compact adjacency arrays.
+
+    Supply lines (`Planet.waypoints`) are undirected; attacks
+    (`Planet.attacking`) are directed from the attacker to its target. Both
+    are stored in compressed sparse row form, so neighbour lookups are slices
+    of a contiguous array and every traversal is O(planets + edges).
+
+    Build it once with `GalaxyGraph(planets)` and call `update()` with each new
+    planet list: owners are refreshed in place and the adjacency arrays are
+    only rebuilt when the supply lines or attacks actually changed.
+    """
+
+    def __init__(self, planets: Iterable[PlanetLike] = ()) -> None:
+        """Create a graph from a planet list.
+
+        Args:
+            planets: The planets, e.g. the output of `planets.get_all()`.
+        """
+        self._indices: list[int] = []
+        self._rows: dict[int, int] = {}
+        self._owners: list[Factions] = []
+        self._waypoints: list[tuple[int, ...]] = []
+        self._attacking: list[tuple[int, ...]] = []
+        self._supply = (array("q", [0]), array("q"))
+        self._attacks = (array("q", [0]), array("q"))
+        self._attacked = (array("q", [0]), array("q"))
+        self._components: dict[Factions, list[list[int]]] = {}
+        self.update(planets)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self._rows
+
+    def update(self, planets: Iterable[PlanetLike]) -> bool:
+        """Apply a new planet list to the graph.
+
+        Planets not seen before are added. Planets missing from `planets` keep
+        their previous state.
+
+        Args:
+            planets: The planets, e.g. the planets of a new snapshot.
+
+        Returns:
+            True if the supply lines or attacks changed, False if only owners
+            (or nothing) did.
+        """
+        supply_changed = attacks_changed = owners_changed = False
+        for planet in planets:
+            waypoints = tuple(planet.waypoints)
+            attacking = tuple(planet.attacking)
+            row = self._rows.get(planet.index)
+            if row is None:
+                self._rows[planet.index] = len(self._indices)
+                self._indices.append(planet.index)
+                self._owners.append(planet.current_owner)
+                self._waypoints.append(waypoints)
+                self._attacking.append(attacking)
+                supply_changed = attacks_changed = owners_changed = True
+                continue
+            if self._owners[row] != planet.current_owner:
+                self._owners[row] = planet.current_owner
+                owners_changed = True
+            if self._waypoints[row] != waypoints:
+                self._waypoints[row] = waypoints
+                supply_changed = True
+            if self._attacking[row] != attacking:
+                self._attacking[row] = attacking
+                attacks_changed = True
+        if supply_changed:
+            self._supply = self._build_supply()
+        if attacks_changed:
+            self._attacks, self._attacked = self._build_attacks()
+        if supply_changed or owners_changed:
+            self._components.clear()
+        return supply_changed or attacks_changed
+
+    def _build_supply(self) -> tuple[array[int], array[int]]:
+        adjacency: list[list[int]] = [[] for _ in self._indices]
+        for row, waypoints in enumerate(self._waypoints):
+            for index in waypoints:
+                other = self._rows.get(index)
+                if other is not None and other != row:
+                    adjacency[row].append(other)
+                    adjacency[other].append(row)
+        return _csr(adjacency)
+
+    def _build_attacks(
+        self,
+    ) -> tuple[tuple[array[int], array[int]], tuple[array[int], array[int]]]:
+        forward: list[list[int]] = [[] for _ in self._indices]
+        reverse: list[list[int]] = [[] for _ in self._indices]
+        for row, attacking in enumerate(self._attacking):
+            for index in attacking:
+                other = self._rows.get(index)
+                if other is not None:
+                    forward[row].append(other)
+                    reverse[other].append(row)
+        return _csr(forward), _csr(reverse)
+
+    def _row(self, index: int) -> int:
+        try:
+            return self._rows[index]
+        except KeyError:
+            raise KeyError(f"Unknown planet index: {index}") from None
+
+    def _slice(self, csr: tuple[array[int], array[int]], row: int) -> array[int]:
+        offsets, targets = csr
+        return targets[offsets[row] : offsets[row + 1]]
+
+    def owner(self, index: int) -> Factions:
+        """Current owner of the planet with index `index`."""
+        return self._owners[self._row(index)]
+
+    def neighbors(self, index: int) -> list[int]:
+        """Planets directly connected to `index` by a supply line."""
+        return [self._indices[r] for r in self._slice(self._supply, self._row(index))]
+
+    def path(
+        self, source: int, target: int, owner: Factions | None = None
+    ) -> list[int] | None:
+        """Shortest supply path between two planets, by number of hops.
+
+        Args:
+            source: Index of the starting planet.
+            target: Index of the destination planet.
+            owner: If given, only travel through planets held by this faction
+                (the endpoints included).
+
+        Returns:
+            The planet indices from `source` to `target`, both included, or
+            None if they are not connected.
+
+        Raises:
+            KeyError: If either planet is not part of the graph.
+        """
+        start, goal = self._row(source), self._row(target)
+        if owner is not None and not self._owners[start] == owner == self._owners[goal]:
+            return None
+        offsets, targets = self._supply
+        parents = {start: start}
+        queue = deque([start])
+        while queue:
+            row = queue.popleft()
+            if row == goal:
+                path = [row]
+                while row != start:
+                    row = parents[row]
+                    path.append(row)
+                return [self._indices[r] for r in reversed(path)]
+            for neighbour in targets[offsets[row] : offsets[row + 1]]:
+                if neighbour in parents:
+                    continue
+                if owner is not None and self._owners[neighbour] != owner:
+                    continue
+                parents[neighbour] = row
+                queue.append(neighbour)
+        return None
+
+    def neighborhood(self, index: int, hops: int) -> dict[int, int]:
+        """Planets within `hops` supply lines of `index`.
+
+        Args:
+            index: Index of the center planet.
+            hops: Maximum number of supply lines to follow.
+
+        Returns:
+            A mapping of planet index to its distance in hops, the center
+            planet included at distance 0, in breadth-first order.
+        """
+        offsets, targets = self._supply
+        start = self._row(index)
+        distances = {start: 0}
+        frontier = [start]
+        for distance in range(1, hops + 1):
+            reached: list[int] = []
+            for row in frontier:
+                for neighbour in targets[offsets[row] : offsets[row + 1]]:
+                    if neighbour not in distances:
+                        distances[neighbour] = distance
+                        reached.append(neighbour)
+            if not reached:
+                break
+            frontier = reached
+        return {self._indices[row]: d for row, d in distances.items()}
+
+    def components(self, faction: Factions) -> list[list[int]]:
+        """Groups of planets held by `faction` that are linked by supply lines.
+
+        Supply lines through planets held by other factions don't count.
+        Results are cached until the owners or the supply lines change.
+
+        Returns:
+            The connected components, largest first, each as a sorted list of
+            planet indices.
+        """
+        if faction not in self._components:
+            offsets, targets = self._supply
+            seen: set[int] = set()
+            components: list[list[int]] = []
+            for start, start_owner in enumerate(self._owners):
+                if start_owner != faction or start in seen:
+                    continue
+                seen.add(start)
+                stack = [start]
+                component: list[int] = []
+                while stack:
+                    row = stack.pop()
+                    component.append(self._indices[row])
+                    for neighbour in targets[offsets[row] : offsets[row + 1]]:
+                        if neighbour not in seen and self._owners[neighbour] == faction:
+                            seen.add(neighbour)
+                            stack.append(neighbour)
+                components.append(sorted(component))
+            components.sort(key=len, reverse=True)
+            self._components[faction] = components
+        return [list(component) for component in self._components[faction]]
+
+    def attacking(self, index: int) -> list[int]:
+        """Planets that `index` is attacking."""
+        return [self._indices[r] for r in self._slice(self._attacks, self._row(index))]
+
+    def attackers(self, index: int) -> list[int]:
+        """Planets attacking `index`."""
+        return [self._indices[r] for r in self._slice(self._attacked, self._row(index))]
+
+    def under_attack(self, faction: Factions) -> list[int]:
+        """Planets under attack from any planet held by `faction`.
+
+        Returns:
+            Sorted planet indices.
+        """
+        offsets, targets = self._attacks
+        rows: set[int] = set()
+        for row, owner in enumerate(self._owners):
+            if owner == faction:
+                rows.update(targets[offsets[row] : offsets[row + 1]])
+        return sorted(self._indices[row] for row in rows)
@@ -0,0 +1,445 @@
+"""Append-only, delta-encoded time series of planet and war statistics."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from helldivepy.models import PlanetLike, Statistics, War
+
+PLANET_COLUMNS: tuple[str, ...] = (
+    "health",
+    "players",
+    "regen_per_second",
+    "terminid_kills",
+    "automaton_kills",
+    "illuminate_kills",
+)
+"""Series recorded for every planet."""
+
+WAR_COLUMNS: tuple[str, ...] = (
+    "players",
+    "terminid_kills",
+    "automaton_kills",
+    "illuminate_kills",
+)
+"""Series recorded for the whole war, from `War.statistics`."""
+
+_FLOAT_COLUMNS = frozenset({"regen_per_second"})
+_VERSION = 1
+# Block header: typecode of the packed values, length of the compressed payload.
+_HEADER = struct.Struct("<BI")
+_SWAP = sys.byteorder == "big"
+
+
+def _millis(moment: datetime) -> int:
+    return int(moment.timestamp() * 1000)
+
+
+def _statistic(column: str, statistics: Statistics) -> int:
+    if column == "players":
+        return statistics.player_count
+    return getattr(statistics, column)
+
+
+def _planet_value(column: str, planet: PlanetLike) -> int | float:
+    if column == "health":
+        return planet.health
+    if column == "regen_per_second":
+        return planet.regen_per_second
+    return _statistic(column, planet.statistics)
+
+
+def _float_bits(value: float) -> int:
+    # Floats are stored as their IEEE 754 bits, so unchanged values have a
+    # zero delta like integers do.
+    return array("q", array("d", [value]).tobytes())[0]
+
+
+def _wrap(value: int) -> int:
+    # Two's complement int64 arithmetic: the difference of two float bit
+    # patterns can exceed 64 bits, but wraps back when the deltas are added up.
+    return (value + (1 << 63)) % (1 << 64) - (1 << 63)
+
+
+def _floats(bits: Sequence[int]) -> array[float]:
+    return array("d", array("q", bits).tobytes())
+
+
+def _encode(values: Sequence[int]) -> bytes:
+    low, high = min(values, default=0), max(values, default=0)
+    typecode = "q"
+    for candidate in "bhi":
+        limit = 1 << (array(candidate).itemsize * 8 - 1)
+        if -limit <= low and high < limit:
+            typecode = candidate
+            break
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    payload = zlib.compress(packed.tobytes())
+    return _HEADER.pack(ord(typecode), len(payload)) + payload
+
+
+def _offset(data: bytes, blocks: int) -> int:
+    """Byte offset of block number `blocks`, found by hopping over headers."""
+    offset = 0
+    for _ in range(blocks):
+        offset += _HEADER.size + _HEADER.unpack_from(data, offset)[1]
+    return offset
+
+
+def _blocks(data: bytes, first: int) -> Iterator[array[int]]:
+    """Decode the blocks of a column file, starting at block number `first`."""
+    offset = _offset(data, first)
+    while offset < len(data):
+        typecode, length = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        block: array[int] = array(chr(typecode))
+        block.frombytes(zlib.decompress(data[offset : offset + length]))
+        if _SWAP:
+            block.byteswap()
+        offset += length
+        yield block
+
+
+def _read(path: Path, typecode: str) -> array[Any]:
+    values: array[Any] = array(typecode)
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return values
+    values.frombytes(data[: len(data) - len(data) % values.itemsize])
+    if _SWAP:
+        values.byteswap()
+    return values
+
+
+def _append(path: Path, values: array[Any]) -> None:
+    if _SWAP:
+        values = array(values.typecode, values)
+        values.byteswap()
+    with open(path, "ab") as file:
+        file.write(values.tobytes())
+
+
+@dataclass(frozen=True, slots=True)
+class Series:
+    """Values of some columns over time, one entry per recorded sample."""
+
+    time: array[float]
+    """`War.now` of every sample, as POSIX timestamps."""
+    columns: dict[str, array[Any]]
+    """Values of every requested column, aligned with `time`."""
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, column: str) -> array[Any]:
+        return self.columns[column]
+
+    def datetimes(self) -> list[datetime]:
+        """`time` as timezone-aware datetimes."""
+        return [datetime.fromtimestamp(t, UTC) for t in self.time]
+
+
+class _Writer:
+    # What `record()` needs to encode the next sample.
+    def __init__(self, times: array[int], indices: array[int]) -> None:
+        self.last = times[-1] if times else None
+        self.count = len(times)
+        self.slots = {index: slot for slot, index in enumerate(indices)}
+        self.previous: dict[str, list[int]] = {}
+
+
+class History:
+    """Records successive planet and war results to an on-disk time series.
+
+    Only numbers are kept: health, players, regeneration and kills per planet
+    (see `PLANET_COLUMNS`), and players and kills for the whole war (see
+    `WAR_COLUMNS`). Every sample is keyed by `War.now`.
+
+    Each column lives in its own append-only file, so a query only reads the
+    columns it asks for. A sample is stored as the difference to the previous
+    one, packed into the narrowest integer type that fits and compressed;
+    planets that nothing happened on cost almost nothing. Every
+    `keyframe_interval` samples the full values are stored instead, so a time
+    range query starts decoding at the keyframe just before it rather than at
+    the beginning of the history.
+
+    One process should record into a directory at a time. Others may query it
+    meanwhile: a sample only becomes visible once it is completely written.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], keyframe_interval: int = 64
+    ) -> None:
+        """Open a history directory, creating it if needed.
+
+        Args:
+            path: Directory holding the history files.
+            keyframe_interval: Number of samples between two full copies of
+                the values. Only used when creating a new history; an existing
+                one keeps its own.
+
+        Raises:
+            ValueError: If `keyframe_interval` is not positive, or the
+                directory holds a history in an unsupported format.
+        """
+        if keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be positive")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta = self.path / "meta.json"
+        if meta.exists():
+            settings = json.loads(meta.read_text())
+            if settings.get("version") != _VERSION:
+                raise ValueError(f"Unsupported history format in {self.path}")
+            keyframe_interval = settings["keyframe_interval"]
+        else:
+            meta.write_text(
+                json.dumps(
+                    {"version": _VERSION, "keyframe_interval": keyframe_interval}
+                )
+            )
+        self.keyframe_interval: int = keyframe_interval
+        self._writer: _Writer | None = None
+
+    def _file(self, scope: str, column: str) -> Path:
+        return self.path / f"{scope}.{column}.bin"
+
+    def _samples(self) -> tuple[array[int], array[int]]:
+        # `time.bin` is appended last, so it decides which samples are complete.
+        times = _read(self.path / "time.bin", "q")
+        counts = _read(self.path / "slots.bin", "I")
+        del times[len(counts) :]
+        del counts[len(times) :]
+        return times, counts
+
+    def __len__(self) -> int:
+        """Number of recorded samples."""
+        return len(self._samples()[0])
+
+    def planet_indices(self) -> list[int]:
+        """Indices of every planet ever recorded."""
+        _, counts = self._samples()
+        indices = _read(self.path / "planets.bin", "q")
+        return list(indices[: counts[-1] if counts else 0])
+
+    def record(self, war: War, planets: Iterable[PlanetLike]) -> bool:
+        """Append one sample.
+
+        Planets missing from `planets` keep their previous values.
+
+        Args:
+            war: The output of `war.get()`; `war.now` keys the sample.
+            planets: The planets, e.g. the output of `planets.get_all()`.
+
+        Returns:
+            False, without recording anything, if `war.now` is not later than
+            the last recorded sample, e.g. when polling returned the same
+            cached response twice.
+        """
+        writer = self._open_writer()
+        now = _millis(war.now)
+        if writer.last is not None and now <= writer.last:
+            return False
+        planets = list(planets)
+        new = array("q")
+        for planet in planets:
+            if planet.index not in writer.slots:
+                writer.slots[planet.index] = len(writer.slots)
+                new.append(planet.index)
+        keyframe = writer.count % self.keyframe_interval == 0
+        size = len(writer.slots)
+
+        for column in PLANET_COLUMNS:
+            previous = writer.previous.get(column, [])
+            current = previous + [0] * (size - len(previous))
+            for planet in planets:
+                value = _planet_value(column, planet)
+                if column in _FLOAT_COLUMNS:
+                    value = _float_bits(value)
+                current[writer.slots[planet.index]] = int(value)
+            self._write_block("planet", column, current, previous, keyframe)
+            writer.previous[column] = current
+        for column in WAR_COLUMNS:
+            current = [_statistic(column, war.statistics)]
+            previous = writer.previous.get(f"war.{column}", [])
+            self._write_block("war", column, current, previous, keyframe)
+            writer.previous[f"war.{column}"] = current
+
+        if new:
+            _append(self.path / "planets.bin", new)
+        _append(self.path / "slots.bin", array("I", [size]))
+        _append(self.path / "time.bin", array("q", [now]))
+        writer.last = now
+        writer.count += 1
+        return True
+
+    def _write_block(
+        self,
+        scope: str,
+        column: str,
+        current: list[int],
+        previous: list[int],
+        keyframe: bool,
+    ) -> None:
+        if not keyframe:
+            current = [
+                _wrap(value - (previous[slot] if slot < len(previous) else 0))
+                for slot, value in enumerate(current)
+            ]
+        with open(self._file(scope, column), "ab") as file:
+            file.write(_encode(current))
+
+    def _open_writer(self) -> _Writer:
+        if self._writer is not None:
+            return self._writer
+        times, counts = self._samples()
+        indices = _read(self.path / "planets.bin", "q")
+        size = counts[-1] if counts else 0
+        # Drop whatever an interrupted `record()` left past the last sample.
+        for name, length in (
+            ("time.bin", len(times) * times.itemsize),
+            ("slots.bin", len(counts) * counts.itemsize),
+            ("planets.bin", size * indices.itemsize),
+        ):
+            path = self.path / name
+            if path.exists():
+                os.truncate(path, length)
+        writer = _Writer(times, indices[:size])
+        # Replay from the last keyframe already written. When the next sample
+        # is due to be a keyframe, that is a whole interval back, not `count`.
+        key = max(writer.count - 1, 0)
+        key -= key % self.keyframe_interval
+        columns = [("planet", c) for c in PLANET_COLUMNS]
+        columns += [("war", c) for c in WAR_COLUMNS]
+        for scope, column in columns:
+            path = self._file(scope, column)
+            data = path.read_bytes() if path.exists() else b""
+            if data:
+                os.truncate(path, _offset(data, writer.count))
+            current: list[int] = []
+            for sample, block in zip(
+                range(key, writer.count), _blocks(data, key), strict=False
+            ):
+                if sample % self.keyframe_interval == 0:
+                    current = list(block)
+                    continue
+                current += [0] * (len(block) - len(current))
+                current = [
+                    _wrap(value + delta)
+                    for value, delta in zip(current, block, strict=True)
+                ]
+            name = column if scope == "planet" else f"war.{column}"
+            writer.previous[name] = current
+        self._writer = writer
+        return writer
+
+    def planet(
+        self,
+        index: int,
+        columns: Iterable[str] = PLANET_COLUMNS,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Series:
+        """Series of one planet.
+
+        Args:
+            index: Index of the planet.
+            columns: Columns to load, from `PLANET_COLUMNS`. Only their files
+                are read.
+            start: Earliest `War.now` to include. None starts at the first
+                sample.
+            end: Latest `War.now` to include. None ends at the last sample.
+
+        Returns:
+            The samples in `[start, end]` recorded after the planet was first
+            seen.
+
+        Raises:
+            KeyError: If the planet was never recorded.
+            ValueError: If a column is unknown.
+        """
+        indices = _read(self.path / "planets.bin", "q")
+        try:
+            slot = indices.index(index)
+        except ValueError:
+            raise KeyError(f"Planet {index} was never recorded") from None
+        return self._query("planet", PLANET_COLUMNS, columns, slot, start, end)
+
+    def war(
+        self,
+        columns: Iterable[str] = WAR_COLUMNS,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Series:
+        """Series of the whole war.
+
+        Args:
+            columns: Columns to load, from `WAR_COLUMNS`. Only their files are
+                read.
+            start: Earliest `War.now` to include. None starts at the first
+                sample.
+            end: Latest `War.now` to include. None ends at the last sample.
+
+        Raises:
+            ValueError: If a column is unknown.
+        """
+        return self._query("war", WAR_COLUMNS, columns, 0, start, end)
+
+    def _query(
+        self,
+        scope: str,
+        known: tuple[str, ...],
+        columns: Iterable[str],
+        slot: int,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> Series:
+        columns = list(columns)
+        for column in columns:
+            if column not in known:
+                raise ValueError(f"Unknown column: {column!r}")
+        times, counts = self._samples()
+        if scope == "war":
+            counts = array("I", [1]) * len(times)
+        low = 0 if start is None else bisect_left(times, _millis(start))
+        high = len(times) if end is None else bisect_right(times, _millis(end))
+        # Skip the samples from before the planet was first recorded.
+        while low < high and counts[low] <= slot:
+            low += 1
+        key = low - low % self.keyframe_interval
+
+        result: dict[str, array[Any]] = {}
+        for column in columns:
+            path = self._file(scope, column)
+            data = path.read_bytes() if path.exists() else b""
+            values: list[int] = []
+            value = 0
+            for sample, block in zip(
+                range(key, high), _blocks(data, key), strict=False
+            ):
+                delta = block[slot] if slot < len(block) else 0
+                if sample % self.keyframe_interval == 0:
+                    value = delta
+                else:
+                    value = _wrap(value + delta)
+                if sample >= low:
+                    values.append(value)
+            if column in _FLOAT_COLUMNS and scope == "planet":
+                result[column] = _floats(values)
+            else:
+                result[column] = array("q", values)
+        return Series(array("d", (t / 1000 for t in times[low:high])), result)
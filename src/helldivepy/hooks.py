@@ -0,0 +1,280 @@
+"""Per-call measurements of module requests, for metrics and tracing."""
+
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+Hook = Callable[["RequestStats"], None]
+
+
+@dataclass(slots=True)
+class RequestStats:
+    """What one module call did and where its time went.
+
+    A module call is e.g. one `planets.get_all()`: it may be answered from the
+    cache, or take several attempts when retried. Durations are in seconds and
+    summed over attempts; phases that didn't happen stay at zero.
+    """
+
+    path: str
+    """API path, e.g. `"/v1/planets"`."""
+    started_at: float
+    """Wall-clock start of the call, as a POSIX timestamp."""
+    duration: float = 0.0
+    """Total time of the call."""
+    streamed: bool = False
+    """Whether items were yielded while the body downloaded (`iter_*()`
+    methods). `duration` then includes the time spent by the consumer."""
+    cache: str | None = None
+    """`"hit"`, `"miss"` or `"revalidated"` (a `304` extended the entry), or
+    None without a cache."""
+    status_code: int | None = None
+    """Status code of the last response."""
+    attempts: int = 0
+    """Number of HTTP requests sent."""
+    rate_limit_wait: float = 0.0
+    """Time spent waiting for the `RateLimiter`."""
+    retry_wait: float = 0.0
+    """Time spent sleeping between retries."""
+    connect: float = 0.0
+    """Time spent opening connections (TCP and TLS). Zero when a pooled
+    connection was reused, or with transports that don't report it."""
+    ttfb: float = 0.0
+    """Time from sending the request to receiving the response headers,
+    excluding `connect`."""
+    download: float = 0.0
+    """Time spent receiving the response body."""
+    decode: float = 0.0
+    """Time spent parsing JSON on its own (raw results and streamed items)."""
+    validate: float = 0.0
+    """Time spent building models. Model results are parsed and validated in
+    one pass by pydantic, so this includes their JSON parsing."""
+    response_bytes: int = 0
+    """Size of the response body, or of the cached body on a cache hit."""
+    error: BaseException | None = None
+    """The exception the call raised, if any."""
+
+
+class Instrumentation:
+    """Measures every module call and reports it to hooks.
+
+    Pass an instance to `HelldiveAPIClient(instrumentation=...)`. After each
+    call, every hook is called with its `RequestStats`, in the calling thread
+    (or task), so keep hooks cheap. Without instrumentation, the clients skip
+    all measurements.
+    """
+
+    def __init__(self, *hooks: Hook) -> None:
+        """Create a new instrumentation.
+
+        Args:
+            *hooks: Functions called with the `RequestStats` of every call.
+        """
+        self.hooks: list[Hook] = list(hooks)
+
+    def add_hook(self, hook: Hook) -> None:
+        """Also call `hook` with the stats of every call."""
+        self.hooks.append(hook)
+
+    def start(self, path: str, streamed: bool = False) -> RequestStats:
+        """Begin measuring a call; pass the stats to `finish()` when it ends."""
+        stats = RequestStats(path, time.time(), streamed=streamed)
+        stats.duration = -time.perf_counter()
+        return stats
+
+    def finish(self, stats: RequestStats) -> None:
+        """Stop measuring a call and report it to every hook."""
+        stats.duration += time.perf_counter()
+        for hook in self.hooks:
+            hook(stats)
+
+    @contextmanager
+    def measure(self, path: str) -> Generator[RequestStats]:
+        """Measure the module call running inside the `with` block."""
+        stats = self.start(path)
+        token = _current.set(stats)
+        try:
+            yield stats
+        except Exception as e:
+            stats.error = e
+            raise
+        finally:
+            _current.reset(token)
+            self.finish(stats)
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("helldivepy_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    """Stats of the module call being measured in this context, if any."""
+    return _current.get()
+
+
+def timed(
+    stats: RequestStats | None, phase: str, fn: Callable[..., T], *args: Any
+) -> T:
+    """Call `fn(*args)`, adding its duration to `phase` of `stats` if given."""
+    if stats is None:
+        return fn(*args)
+    start = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        setattr(stats, phase, getattr(stats, phase) + time.perf_counter() - start)
+
+
+async def atimed(
+    stats: RequestStats | None, phase: str, fn: Callable[..., Awaitable[T]], *args: Any
+) -> T:
+    """Like `timed()`, awaiting `fn(*args)`."""
+    if stats is None:
+        return await fn(*args)
+    start = time.perf_counter()
+    try:
+        return await fn(*args)
+    finally:
+        setattr(stats, phase, getattr(stats, phase) + time.perf_counter() - start)
+
+
+def headers_received(
+    stats: RequestStats, response: httpx.Response, sent: float, connect: float
+) -> None:
+    """Record the response headers of one attempt.
+
+    Args:
+        stats: Stats of the call.
+        response: The response, before its body is read.
+        sent: `time.perf_counter()` when the request was sent.
+        connect: `stats.connect` when the request was sent.
+    """
+    stats.attempts += 1
+    stats.status_code = response.status_code
+    stats.ttfb += time.perf_counter() - sent - (stats.connect - connect)
+
+
+def downloaded(stats: RequestStats, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Yield `chunks`, adding their download time and size to `stats`."""
+    stats.response_bytes = 0
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        stats.download += time.perf_counter() - start
+        if chunk is None:
+            return
+        stats.response_bytes += len(chunk)
+        yield chunk
+
+
+async def adownloaded(
+    stats: RequestStats, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    """Like `downloaded()`, for an async iterator."""
+    stats.response_bytes = 0
+    while True:
+        start = time.perf_counter()
+        chunk = await anext(chunks, None)
+        stats.download += time.perf_counter() - start
+        if chunk is None:
+            return
+        stats.response_bytes += len(chunk)
+        yield chunk
+
+
+_CONNECT_PHASES = frozenset({"connection.connect_tcp", "connection.start_tls"})
+
+
+def trace_extension(stats: RequestStats) -> Callable[[str, dict[str, Any]], None]:
+    """An httpx `trace` request extension adding connection setup to `stats`."""
+    started = 0.0
+
+    def trace(event: str, info: dict[str, Any]) -> None:
+        nonlocal started
+        phase, _, state = event.rpartition(".")
+        if phase in _CONNECT_PHASES:
+            if state == "started":
+                started = time.perf_counter()
+            elif state == "complete":
+                stats.connect += time.perf_counter() - started
+
+    return trace
+
+
+def async_trace_extension(
+    stats: RequestStats,
+) -> Callable[[str, dict[str, Any]], Awaitable[None]]:
+    """Like `trace_extension()`, for `httpx.AsyncClient`."""
+    trace = trace_extension(stats)
+
+    async def atrace(event: str, info: dict[str, Any]) -> None:
+        trace(event, info)
+
+    return atrace
+
+
+class _Span(Protocol):
+    def set_attribute(self, key: str, value: Any) -> Any: ...
+    def record_exception(self, exception: BaseException) -> Any: ...
+    def end(self, end_time: int | None = None) -> Any: ...
+
+
+class _Tracer(Protocol):
+    def start_span(
+        self, name: str, *, start_time: int | None = ..., attributes: Any = ...
+    ) -> Any: ...
+
+
+class OpenTelemetryHook:
+    """A hook that turns every call into an OpenTelemetry span.
+
+    Works with any tracer following the OpenTelemetry API, e.g.
+    `opentelemetry.trace.get_tracer("helldivepy")`; this package doesn't
+    depend on OpenTelemetry itself. Spans are named `GET <path>` and carry the
+    phases of `RequestStats` as `helldivepy.*` attributes.
+    """
+
+    def __init__(self, tracer: _Tracer) -> None:
+        """Create a new hook.
+
+        Args:
+            tracer: The tracer spans are started with.
+        """
+        self.tracer = tracer
+
+    def __call__(self, stats: RequestStats) -> None:
+        start = int(stats.started_at * 1e9)
+        attributes: dict[str, Any] = {
+            "http.request.method": "GET",
+            "url.path": stats.path,
+            "http.response.body.size": stats.response_bytes,
+            "helldivepy.attempts": stats.attempts,
+            "helldivepy.streamed": stats.streamed,
+        }
+        if stats.status_code is not None:
+            attributes["http.response.status_code"] = stats.status_code
+        if stats.cache is not None:
+            attributes["helldivepy.cache"] = stats.cache
+        for phase in (
+            "rate_limit_wait",
+            "retry_wait",
+            "connect",
+            "ttfb",
+            "download",
+            "decode",
+            "validate",
+        ):
+            attributes[f"helldivepy.{phase}"] = getattr(stats, phase)
+        span: _Span = self.tracer.start_span(
+            f"GET {stats.path}", start_time=start, attributes=attributes
+        )
+        if stats.error is not None:
+            span.set_attribute("error.type", type(stats.error).__qualname__)
+            span.record_exception(stats.error)
+        span.end(end_time=start + int(stats.duration * 1e9))
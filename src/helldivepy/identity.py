@@ -0,0 +1,84 @@
+import threading
+from typing import Any, cast
+
+from helldivepy.models import Biome, Campaign, Hazard, Planet, SpaceStation
+
+
+class IdentityMap:
+    """Interns planets, biomes and hazards across responses.
+
+    Pass an instance to `HelldiveAPIClient(identity_map=...)` (it can be shared
+    with an `AsyncHelldiveAPIClient`). Every planet returned by any module, on
+    its own or embedded in a `Campaign`/`SpaceStation`, is checked against the
+    last planet seen with the same `index`: if they are equal the existing
+    instance is returned and the duplicate is dropped. `Biome` and `Hazard`
+    objects are shared by value, since the same few repeat across the galaxy.
+
+    Note:
+        Interned objects are shared between results, so treat them as
+        read-only.
+    """
+
+    def __init__(self) -> None:
+        self._planets: dict[int, Planet] = {}
+        self._biomes: dict[tuple[str, str], Biome] = {}
+        self._hazards: dict[tuple[str, str], Hazard] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._planets)
+
+    def get(self, index: int) -> Planet | None:
+        """Return the canonical planet for `index`, if one has been seen."""
+        return self._planets.get(index)
+
+    def biome(self, biome: Biome) -> Biome:
+        """Return the shared instance equal to `biome`."""
+        with self._lock:
+            return self._biomes.setdefault((biome.name, biome.description), biome)
+
+    def hazard(self, hazard: Hazard) -> Hazard:
+        """Return the shared instance equal to `hazard`."""
+        with self._lock:
+            return self._hazards.setdefault((hazard.name, hazard.description), hazard)
+
+    def planet(self, planet: Planet) -> Planet:
+        """Return the canonical instance for `planet`.
+
+        An equal, previously seen planet is returned in its place. Otherwise
+        `planet` becomes the canonical instance for its index, with its biome
+        and hazards replaced by shared instances.
+        """
+        with self._lock:
+            existing = self._planets.get(planet.index)
+            if existing is planet:
+                return planet
+            if existing is not None and existing == planet:
+                return existing
+            planet.biome = self.biome(planet.biome)
+            planet.hazards = [self.hazard(hazard) for hazard in planet.hazards]
+            self._planets[planet.index] = planet
+            return planet
+
+    def intern(self, result: Any) -> Any:
+        """Intern every planet reachable from a module result.
+
+        Lists are updated in place and returned; other values pass through.
+        """
+        if isinstance(result, list):
+            items = cast(list[Any], result)
+            for i, item in enumerate(items):
+                items[i] = self.intern(item)
+            return items
+        if isinstance(result, Planet):
+            return self.planet(result)
+        if isinstance(result, Campaign | SpaceStation):
+            result.planet = self.planet(result.planet)
+        return result
+
+    def clear(self) -> None:
+        """Forget every interned object."""
+        with self._lock:
+            self._planets.clear()
+            self._biomes.clear()
+            self._hazards.clear()
@@ -0,0 +1,293 @@
+import json
+from contextvars import ContextVar
+from typing import Any, Self, TypeVar, cast
+
+from pydantic import PrivateAttr, TypeAdapter
+
+from helldivepy.enums import CampaignType, Factions
+from helldivepy.models import (
+    APIModel,
+    Biome,
+    Campaign,
+    Event,
+    Hazard,
+    Planet,
+    Position,
+    Region,
+    Statistics,
+)
+
+T = TypeVar("T")
+
+_BIOME = TypeAdapter(Biome)
+_HAZARDS = TypeAdapter(list[Hazard])
+_POSITION = TypeAdapter(Position)
+_EVENT = TypeAdapter[Event | None](Event | None)
+_STATISTICS = TypeAdapter(Statistics)
+_REGIONS = TypeAdapter(list[Region])
+
+_PAYLOAD = "helldivepy.lazy.payload"
+"""Validation context key of the `_Payload` lazy models are validated from."""
+
+
+class _Payload:
+    """A payload shared by the lazy models validated from it.
+
+    A JSON body is decoded the first time any of them reads a nested field.
+    Only a single model, or a list of them, can be validated from a payload:
+    models are matched to their data by the order they were validated in.
+    """
+
+    __slots__ = ("content", "_data", "_claimed")
+
+    def __init__(self, payload: Any) -> None:
+        if isinstance(payload, str | bytes | bytearray):
+            self.content, self._data = payload, None
+        else:
+            self.content, self._data = None, payload
+        self._claimed = 0
+
+    def claim(self) -> int:
+        """Return the position of the next top-level lazy model in the payload."""
+        self._claimed += 1
+        return self._claimed - 1
+
+    def item(self, position: int) -> Any:
+        """Return the object at `position` of a list payload, or the payload.
+
+        Raises:
+            ValueError: If the payload is neither a list nor a single model.
+        """
+        if self._data is None and self.content is not None:
+            self._data = json.loads(self.content)
+        data: Any = self._data
+        if isinstance(data, list):
+            items = cast(list[Any], data)
+            if position < len(items):
+                return items[position]
+        elif position == 0 and self._claimed == 1:
+            return data
+        raise ValueError(
+            "Lazy models can only be validated on their own or in a top-level list"
+        )
+
+
+def lazy_context(payload: Any) -> dict[str, Any]:
+    """Return the context for validating lazy models from `payload`.
+
+    Args:
+        payload: The JSON body, or already decoded data, being validated, e.g.
+            `TypeAdapter(list[LazyPlanet]).validate_json(body,
+            context=lazy_context(body))`.
+    """
+    return {_PAYLOAD: _Payload(payload)}
+
+
+def validate_json(adapter: TypeAdapter[T], content: str | bytes | bytearray) -> T:
+    """Validate `content` with `adapter`, letting lazy models keep the body."""
+    return adapter.validate_json(content, context=lazy_context(content))
+
+
+# The values passed to `model_construct()`, which calls `model_post_init(None)`.
+_CONSTRUCTED: ContextVar[_Payload | None] = ContextVar(
+    "helldivepy.lazy.constructed", default=None
+)
+
+
+class LazyModel(APIModel):
+    """Base for lazy models: keeps the raw payload, validates nested parts on demand.
+
+    Only the fields declared on the model are validated up front. Nested
+    sub-models are validated from the raw payload the first time they are
+    accessed and then cached on the instance.
+
+    From JSON, nested parts are skipped rather than decoded: models keep a
+    reference to the body they came from, which is decoded once, for all of
+    them, when the first nested field is read. `model_validate()` and
+    `model_validate_json()` pass their input along by themselves; validate
+    through a `TypeAdapter` with `context=lazy_context(payload)`, either for
+    a single model or a top-level list of them.
+
+    Lazy loading only pays off when most nested fields go unread: the first
+    nested read decodes the whole body, and each sub-model is then validated
+    on its own, so reading one on every model of a list costs more than
+    validating the list eagerly. `model_dump()` only includes the declared
+    fields, never the nested parts, read or not; dump the regular model from
+    `to_planet()`/`to_campaign()` instead.
+
+    Two lazy models are equal when their fields and raw payloads are.
+    """
+
+    _payload: _Payload | None = PrivateAttr(None)
+    _position: int = PrivateAttr(0)
+    # Created on first use: default factories add to the cost of validation.
+    _nested_cache: dict[str, Any] | None = PrivateAttr(None)
+
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:
+        kwargs.setdefault("context", lazy_context(obj))
+        return super().model_validate(obj, **kwargs)
+
+    @classmethod
+    def model_validate_json(
+        cls, json_data: str | bytes | bytearray, **kwargs: Any
+    ) -> Self:
+        kwargs.setdefault("context", lazy_context(json_data))
+        return super().model_validate_json(json_data, **kwargs)
+
+    def __init__(self, /, **data: Any) -> None:
+        self.__pydantic_validator__.validate_python(
+            data, self_instance=self, context=lazy_context(data)
+        )
+
+    # Still validate through the generated schema, not by calling `__init__`.
+    __init__.__pydantic_base_init__ = True  # pyright: ignore[reportFunctionMemberAccess]
+
+    @classmethod
+    def model_construct(
+        cls, _fields_set: set[str] | None = None, **values: Any
+    ) -> Self:
+        # `super()` pops the fields out of `values`, so keep a copy for `_raw`.
+        token = _CONSTRUCTED.set(_Payload(dict(values)))
+        try:
+            return super().model_construct(_fields_set, **values)
+        finally:
+            _CONSTRUCTED.reset(token)
+
+    def model_post_init(self, context: Any) -> None:
+        # Not a wrap validator: that would see JSON input only once it has been
+        # decoded in full, which costs as much as validating the nested models.
+        payload = cast(dict[str, Any], context or {}).get(_PAYLOAD)
+        if payload is None and context is None:
+            payload = _CONSTRUCTED.get()
+        if not isinstance(payload, _Payload):
+            raise ValueError(
+                f"{type(self).__name__} is validated with "
+                "`context=lazy_context(payload)`"
+            )
+        self._payload = payload
+        # Top-level lazy models are validated in document order.
+        self._position = payload.claim()
+
+    def __eq__(self, other: object) -> bool:
+        # The payload reference and the nested-model cache are not compared.
+        if not isinstance(other, LazyModel) or type(other) is not type(self):
+            return NotImplemented
+        return self.__dict__ == other.__dict__ and self._raw == other._raw
+
+    @property
+    def _raw(self) -> dict[str, Any]:
+        payload = self._payload
+        if payload is None:
+            return {}
+        raw = payload.item(self._position)
+        # The first field (`index`, `id`) tells whether the right item was found.
+        name, field = next(iter(type(self).model_fields.items()))
+        if not isinstance(raw, dict) or cast(dict[str, Any], raw).get(
+            field.alias or name, cast(dict[str, Any], raw).get(name)
+        ) != getattr(self, name):
+            raise ValueError(
+                f"{type(self).__name__} was validated from a payload that is "
+                "neither a single model nor a top-level list"
+            )
+        return cast(dict[str, Any], raw)
+
+    def _nested(self, key: str, adapter: TypeAdapter[T], default: Any = None) -> T:
+        if self._nested_cache is None:
+            self._nested_cache = {}
+        if key not in self._nested_cache:
+            value = self._raw.get(key, default)
+            self._nested_cache[key] = adapter.validate_python(
+                value, context=lazy_context(value)
+            )
+        return self._nested_cache[key]
+
+
+class LazyPlanet(LazyModel):
+    """A `Planet` that validates its nested sub-models only on first access.
+
+    Biome, hazards, position, event, statistics and regions stay raw until read.
+    Use it when you mostly read top-level fields such as `health` or
+    `current_owner`; call `to_planet()` for a fully validated `Planet`. Helpers
+    that read `position`, `statistics` or `event` of every planet
+    (`PlanetTable`, `SpatialIndex`, `History`, `ProgressEstimator`) are faster
+    with regular planets.
+    """
+
+    index: int
+    """ArrowHead planet identifier."""
+    name: str
+    sector: str
+    """Geographic sector classification."""
+    hash: int
+    """ArrowHead internal identifier."""
+    waypoints: list[int]
+    """Connected planet indices."""
+    max_health: int
+    """Liberation capacity."""
+    health: int
+    """Current liberation status."""
+    disabled: bool
+    """Whether the planet is currently inactive."""
+    initial_owner: Factions
+    current_owner: Factions
+    regen_per_second: float
+    """Uncontested enemy regeneration rate."""
+    attacking: list[int]
+    """Target planet indices this planet is attacking."""
+
+    @property
+    def biome(self) -> Biome:
+        return self._nested("biome", _BIOME)
+
+    @property
+    def hazards(self) -> list[Hazard]:
+        return self._nested("hazards", _HAZARDS, [])
+
+    @property
+    def position(self) -> Position:
+        """Map coordinates."""
+        return self._nested("position", _POSITION)
+
+    @property
+    def event(self) -> Event | None:
+        """Active occurrence, if any."""
+        return self._nested("event", _EVENT)
+
+    @property
+    def statistics(self) -> Statistics:
+        """Planetary warfare metrics."""
+        return self._nested("statistics", _STATISTICS)
+
+    @property
+    def regions(self) -> list[Region]:
+        """Subdivisions with individual health and availability status."""
+        return self._nested("regions", _REGIONS, [])
+
+    def to_planet(self) -> Planet:
+        """Validate the full payload into a regular `Planet`."""
+        return Planet.model_validate(self._raw)
+
+
+_LAZY_PLANET = TypeAdapter(LazyPlanet)
+
+
+class LazyCampaign(LazyModel):
+    """A `Campaign` whose planet is validated, lazily, only when first accessed."""
+
+    id: int
+    type: CampaignType
+    """Operation classification."""
+    count: int
+    """Historical occurrence count for this planet."""
+    faction: Factions
+    """Enemy faction being fought."""
+
+    @property
+    def planet(self) -> LazyPlanet:
+        """Theater of operations."""
+        return self._nested("planet", _LAZY_PLANET)
+
+    def to_campaign(self) -> Campaign:
+        """Validate the full payload into a regular `Campaign`."""
+        return Campaign.model_validate(self._raw)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Protocol
 
 from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler, model_validator
 from pydantic.alias_generators import to_camel
@@ -221,6 +222,40 @@ class Planet(APIModel):
     """Subdivisions with individual health and availability status."""
 
 
+class PlanetLike(Protocol):
+    """The planet fields shared by `Planet` and `lazy.LazyPlanet`.
+
+    The analysis helpers (`PlanetTable`, `GalaxyGraph`, `SpatialIndex`,
+    `History` and `ProgressEstimator`) accept either, though all but
+    `GalaxyGraph` read nested fields and so run faster on regular planets.
+    """
+
+    @property
+    def index(self) -> int: ...
+    @property
+    def waypoints(self) -> list[int]: ...
+    @property
+    def max_health(self) -> int: ...
+    @property
+    def health(self) -> int: ...
+    @property
+    def disabled(self) -> bool: ...
+    @property
+    def initial_owner(self) -> Factions: ...
+    @property
+    def current_owner(self) -> Factions: ...
+    @property
+    def regen_per_second(self) -> float: ...
+    @property
+    def attacking(self) -> list[int]: ...
+    @property
+    def position(self) -> Position: ...
+    @property
+    def event(self) -> Event | None: ...
+    @property
+    def statistics(self) -> Statistics: ...
+
+
 class Campaign(APIModel):
     """Ongoing planetary warfare operation."""
 
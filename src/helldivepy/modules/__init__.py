@@ -1,9 +1,48 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import time
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Hashable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, closing
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+from pydantic import TypeAdapter
+
+from helldivepy.hooks import (
+    Instrumentation,
+    RequestStats,
+    adownloaded,
+    async_trace_extension,
+    atimed,
+    current_stats,
+    downloaded,
+    headers_received,
+    timed,
+    trace_extension,
+)
+from helldivepy.lazy import validate_json
+from helldivepy.streaming import JSONArrayDecoder
 
 if TYPE_CHECKING:
-    from helldivepy.client import HelldiveAPIClient
+    from helldivepy.cache import CacheEntry, ResponseCache
+    from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+    from helldivepy.singleflight import SingleFlight
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+_SEND_OPTIONS = ("auth", "follow_redirects")
+"""`httpx.Client.get()` options taken by `send()` rather than `build_request()`."""
 
 
 class BaseModule:
@@ -13,9 +52,488 @@ class BaseModule:
     def _url(self, path: str) -> str:
         return self._client.base_url.rstrip("/") + "/" + path.lstrip("/")
 
-    def _get(self, path: str, **kwargs: Any) -> Any:
-        response = self._client.client.get(
-            self._url(path), headers=self._client.headers, **kwargs
+    def _get(
+        self, path: str, adapter: TypeAdapter[Any] | None = None, **kwargs: Any
+    ) -> Any:
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            result = self._fetch(path, adapter, **kwargs)
+        else:
+            with instrumentation.measure(path):
+                result = self._fetch(path, adapter, **kwargs)
+        identity_map = self._client.identity_map
+        if identity_map is None or adapter is None:
+            return result
+        return identity_map.intern(result)
+
+    def _fetch(self, path: str, adapter: TypeAdapter[Any] | None, **kwargs: Any) -> Any:
+        cache = self._client.cache
+        if cache is None or kwargs:
+            response = self._response(path, **kwargs)
+            if adapter is None:
+                return timed(current_stats(), "decode", response.json)
+            return timed(
+                current_stats(), "validate", validate_json, adapter, response.content
+            )
+        entry = self._cached(cache, path)
+        phase = "decode" if adapter is None else "validate"
+        return timed(current_stats(), phase, entry.result, adapter)
+
+    def _get_bytes(self, path: str) -> bytes:
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            return self._bytes(path)
+        with instrumentation.measure(path):
+            return self._bytes(path)
+
+    def _bytes(self, path: str) -> bytes:
+        cache = self._client.cache
+        if cache is None:
+            return self._response(path).content
+        return self._cached(cache, path).content
+
+    def _response(self, path: str, **kwargs: Any) -> httpx.Response:
+        # A successful response, shared with identical requests in flight.
+        flight = self._client.single_flight
+        if flight is None or kwargs:
+            return self._checked(path, **kwargs)
+        key = ("response", self._url(path))
+        return flight.do(key, lambda: self._checked(path))
+
+    def _checked(self, path: str, **kwargs: Any) -> httpx.Response:
+        response = self._send(path, self._client.headers, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def _cached(self, cache: ResponseCache, path: str) -> CacheEntry:
+        entry = cache.get(self._url(path))
+        stats = current_stats()
+        if entry is not None and entry.fresh:
+            if stats is not None:
+                stats.cache, stats.response_bytes = "hit", len(entry.content)
+            return entry
+        if stats is not None:
+            stats.cache = "miss"
+        flight = self._client.single_flight
+        if flight is None:
+            return self._refresh(cache, path, entry)
+        # Apart from `_response()` calls and other caches sharing the flight.
+        key = ("cache", id(cache), self._url(path))
+        return flight.do(key, lambda: self._refresh_locked(flight, cache, path))
+
+    def _refresh_locked(
+        self, flight: SingleFlight, cache: ResponseCache, path: str
+    ) -> CacheEntry:
+        with flight.lock(self._url(path)):
+            # Another thread or process may have refreshed it while we waited.
+            entry = cache.get(self._url(path))
+            if entry is not None and entry.fresh:
+                stats = current_stats()
+                if stats is not None:
+                    stats.cache, stats.response_bytes = "hit", len(entry.content)
+                return entry
+            return self._refresh(cache, path, entry)
+
+    def _refresh(
+        self, cache: ResponseCache, path: str, entry: CacheEntry | None
+    ) -> CacheEntry:
+        headers = self._client.headers
+        if entry is not None:
+            headers = {**headers, **entry.conditional_headers()}
+        response = self._send(path, headers)
+        if entry is not None and response.status_code == 304:
+            stats = current_stats()
+            if stats is not None:
+                stats.cache, stats.response_bytes = "revalidated", len(entry.content)
+            return cache.revalidate(self._url(path), entry, response, path)
+        response.raise_for_status()
+        return cache.store(self._url(path), response, path)
+
+    def _send(
+        self, path: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        policy = self._client.retry
+        limiter = self._client.rate_limiter
+        stats = current_stats()
+        attempt = 1
+        while True:
+            if limiter is not None:
+                timed(stats, "rate_limit_wait", limiter.acquire)
+            try:
+                if stats is None:
+                    response = self._client.client.get(
+                        self._url(path), headers=headers, **kwargs
+                    )
+                else:
+                    response = self._measured_get(stats, path, headers, **kwargs)
+            except httpx.TransportError as e:
+                if policy is None or not policy.should_retry(attempt, error=e):
+                    raise
+                timed(stats, "retry_wait", time.sleep, policy.delay(attempt))
+            else:
+                if limiter is not None:
+                    limiter.update(response)
+                if policy is None or not policy.should_retry(attempt, response):
+                    return response
+                timed(stats, "retry_wait", time.sleep, policy.delay(attempt, response))
+            attempt += 1
+
+    def _measured_get(
+        self, stats: RequestStats, path: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        # Streams the body to time the headers and the download separately.
+        client = self._client.client
+        options = {name: kwargs.pop(name) for name in _SEND_OPTIONS if name in kwargs}
+        request = client.build_request(
+            "GET",
+            self._url(path),
+            headers=headers,
+            extensions={"trace": trace_extension(stats)},
+            **kwargs,
+        )
+        connect, sent = stats.connect, time.perf_counter()
+        response = client.send(request, stream=True, **options)
+        headers_received(stats, response, sent, connect)
+        received = time.perf_counter()
+        try:
+            response.read()
+        finally:
+            response.close()
+        stats.download += time.perf_counter() - received
+        stats.response_bytes = len(response.content)
+        return response
+
+    def _stream(self, path: str, adapter: TypeAdapter[T]) -> Generator[T, None, None]:
+        # Not cached or retried: items are yielded while the body downloads.
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            return self._stream_items(path, adapter, None)
+        return self._measured_stream(instrumentation, path, adapter)
+
+    def _measured_stream(
+        self, instrumentation: Instrumentation, path: str, adapter: TypeAdapter[T]
+    ) -> Generator[T, None, None]:
+        # Not measured through the context, which would leak out at each yield.
+        stats = instrumentation.start(path, streamed=True)
+        try:
+            yield from self._stream_items(path, adapter, stats)
+        except Exception as e:
+            stats.error = e
+            raise
+        finally:
+            instrumentation.finish(stats)
+
+    def _stream_items(
+        self, path: str, adapter: TypeAdapter[T], stats: RequestStats | None
+    ) -> Generator[T, None, None]:
+        limiter = self._client.rate_limiter
+        if limiter is not None:
+            timed(stats, "rate_limit_wait", limiter.acquire)
+        identity_map = self._client.identity_map
+        decoder = JSONArrayDecoder()
+        extensions = None if stats is None else {"trace": trace_extension(stats)}
+        sent = time.perf_counter()
+        with self._client.client.stream(
+            "GET", self._url(path), headers=self._client.headers, extensions=extensions
+        ) as response:
+            if stats is not None:
+                headers_received(stats, response, sent, 0.0)
+            if limiter is not None:
+                limiter.update(response)
+            response.raise_for_status()
+            if stats is None:
+                for chunk in response.iter_bytes():
+                    for data in decoder.feed(chunk):
+                        item = adapter.validate_python(data)
+                        if identity_map is not None:
+                            item = identity_map.intern(item)
+                        yield item
+            else:
+                for chunk in downloaded(stats, response.iter_bytes()):
+                    for data in timed(stats, "decode", decoder.feed, chunk):
+                        item = timed(stats, "validate", adapter.validate_python, data)
+                        if identity_map is not None:
+                            item = identity_map.intern(item)
+                        yield item
+        decoder.close()
+
+    def _stream_while(
+        self, path: str, adapter: TypeAdapter[T], keep: Callable[[T], bool]
+    ) -> Iterator[T]:
+        # For newest-first lists: stops reading, and closes the connection, at
+        # the first item that is not kept.
+        with closing(self._stream(path, adapter)) as items:
+            for item in items:
+                if not keep(item):
+                    return
+                yield item
+
+    def _get_many(
+        self,
+        keys: Sequence[K],
+        get: Callable[[K], T | None],
+        get_all: Callable[[], list[T]],
+        key_of: Callable[[T], K],
+        max_concurrency: int,
+        bulk_threshold: int | None,
+    ) -> list[T | None]:
+        # Fetch each distinct key once, either with one bulk `get_all()` call or
+        # fanned out over a bounded thread pool sharing the client's connections.
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+        if bulk_threshold is not None and len(unique) >= bulk_threshold:
+            found = {key_of(item): item for item in get_all()}
+        else:
+            workers = max(1, min(max_concurrency, len(unique)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                found = dict(zip(unique, pool.map(get, unique), strict=True))
+        return [found.get(key) for key in keys]
+
+
+class AsyncBaseModule:
+    def __init__(self, client: AsyncHelldiveAPIClient) -> None:
+        self._client = client
+
+    def _url(self, path: str) -> str:
+        return self._client.base_url.rstrip("/") + "/" + path.lstrip("/")
+
+    async def _get(
+        self, path: str, adapter: TypeAdapter[Any] | None = None, **kwargs: Any
+    ) -> Any:
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            result = await self._fetch(path, adapter, **kwargs)
+        else:
+            with instrumentation.measure(path):
+                result = await self._fetch(path, adapter, **kwargs)
+        identity_map = self._client.identity_map
+        if identity_map is None or adapter is None:
+            return result
+        return identity_map.intern(result)
+
+    async def _fetch(
+        self, path: str, adapter: TypeAdapter[Any] | None, **kwargs: Any
+    ) -> Any:
+        cache = self._client.cache
+        if cache is None or kwargs:
+            response = await self._response(path, **kwargs)
+            if adapter is None:
+                return timed(current_stats(), "decode", response.json)
+            return timed(
+                current_stats(), "validate", validate_json, adapter, response.content
+            )
+        entry = await self._cached(cache, path)
+        phase = "decode" if adapter is None else "validate"
+        return timed(current_stats(), phase, entry.result, adapter)
+
+    async def _get_bytes(self, path: str) -> bytes:
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            return await self._bytes(path)
+        with instrumentation.measure(path):
+            return await self._bytes(path)
+
+    async def _bytes(self, path: str) -> bytes:
+        cache = self._client.cache
+        if cache is None:
+            return (await self._response(path)).content
+        return (await self._cached(cache, path)).content
+
+    async def _response(self, path: str, **kwargs: Any) -> httpx.Response:
+        flight = self._client.single_flight
+        if flight is None or kwargs:
+            return await self._checked(path, **kwargs)
+        key = ("response", self._url(path))
+        return await flight.do_async(key, lambda: self._checked(path))
+
+    async def _checked(self, path: str, **kwargs: Any) -> httpx.Response:
+        response = await self._send(path, self._client.headers, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def _cached(self, cache: ResponseCache, path: str) -> CacheEntry:
+        entry = cache.get(self._url(path))
+        stats = current_stats()
+        if entry is not None and entry.fresh:
+            if stats is not None:
+                stats.cache, stats.response_bytes = "hit", len(entry.content)
+            return entry
+        if stats is not None:
+            stats.cache = "miss"
+        flight = self._client.single_flight
+        if flight is None:
+            return await self._refresh(cache, path, entry)
+        key = ("cache", id(cache), self._url(path))
+        return await flight.do_async(
+            key, lambda: self._refresh_locked(flight, cache, path)
         )
+
+    async def _refresh_locked(
+        self, flight: SingleFlight, cache: ResponseCache, path: str
+    ) -> CacheEntry:
+        async with flight.lock_async(self._url(path)):
+            entry = cache.get(self._url(path))
+            if entry is not None and entry.fresh:
+                stats = current_stats()
+                if stats is not None:
+                    stats.cache, stats.response_bytes = "hit", len(entry.content)
+                return entry
+            return await self._refresh(cache, path, entry)
+
+    async def _refresh(
+        self, cache: ResponseCache, path: str, entry: CacheEntry | None
+    ) -> CacheEntry:
+        headers = self._client.headers
+        if entry is not None:
+            headers = {**headers, **entry.conditional_headers()}
+        response = await self._send(path, headers)
+        if entry is not None and response.status_code == 304:
+            stats = current_stats()
+            if stats is not None:
+                stats.cache, stats.response_bytes = "revalidated", len(entry.content)
+            return cache.revalidate(self._url(path), entry, response, path)
         response.raise_for_status()
-        return response.json()
+        return cache.store(self._url(path), response, path)
+
+    async def _send(
+        self, path: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        policy = self._client.retry
+        limiter = self._client.rate_limiter
+        stats = current_stats()
+        attempt = 1
+        while True:
+            if limiter is not None:
+                await atimed(stats, "rate_limit_wait", limiter.acquire_async)
+            try:
+                if stats is None:
+                    response = await self._client.client.get(
+                        self._url(path), headers=headers, **kwargs
+                    )
+                else:
+                    response = await self._measured_get(stats, path, headers, **kwargs)
+            except httpx.TransportError as e:
+                if policy is None or not policy.should_retry(attempt, error=e):
+                    raise
+                await atimed(stats, "retry_wait", asyncio.sleep, policy.delay(attempt))
+            else:
+                if limiter is not None:
+                    limiter.update(response)
+                if policy is None or not policy.should_retry(attempt, response):
+                    return response
+                delay = policy.delay(attempt, response)
+                await atimed(stats, "retry_wait", asyncio.sleep, delay)
+            attempt += 1
+
+    async def _measured_get(
+        self, stats: RequestStats, path: str, headers: dict[str, str], **kwargs: Any
+    ) -> httpx.Response:
+        client = self._client.client
+        options = {name: kwargs.pop(name) for name in _SEND_OPTIONS if name in kwargs}
+        request = client.build_request(
+            "GET",
+            self._url(path),
+            headers=headers,
+            extensions={"trace": async_trace_extension(stats)},
+            **kwargs,
+        )
+        connect, sent = stats.connect, time.perf_counter()
+        response = await client.send(request, stream=True, **options)
+        headers_received(stats, response, sent, connect)
+        received = time.perf_counter()
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        stats.download += time.perf_counter() - received
+        stats.response_bytes = len(response.content)
+        return response
+
+    def _stream(self, path: str, adapter: TypeAdapter[T]) -> AsyncGenerator[T, None]:
+        instrumentation = self._client.instrumentation
+        if instrumentation is None:
+            return self._stream_items(path, adapter, None)
+        return self._measured_stream(instrumentation, path, adapter)
+
+    async def _measured_stream(
+        self, instrumentation: Instrumentation, path: str, adapter: TypeAdapter[T]
+    ) -> AsyncGenerator[T, None]:
+        stats = instrumentation.start(path, streamed=True)
+        try:
+            async with aclosing(self._stream_items(path, adapter, stats)) as items:
+                async for item in items:
+                    yield item
+        except Exception as e:
+            stats.error = e
+            raise
+        finally:
+            instrumentation.finish(stats)
+
+    async def _stream_items(
+        self, path: str, adapter: TypeAdapter[T], stats: RequestStats | None
+    ) -> AsyncGenerator[T, None]:
+        limiter = self._client.rate_limiter
+        if limiter is not None:
+            await atimed(stats, "rate_limit_wait", limiter.acquire_async)
+        identity_map = self._client.identity_map
+        decoder = JSONArrayDecoder()
+        extensions = None if stats is None else {"trace": async_trace_extension(stats)}
+        sent = time.perf_counter()
+        async with self._client.client.stream(
+            "GET", self._url(path), headers=self._client.headers, extensions=extensions
+        ) as response:
+            if stats is not None:
+                headers_received(stats, response, sent, 0.0)
+            if limiter is not None:
+                limiter.update(response)
+            response.raise_for_status()
+            if stats is None:
+                async for chunk in response.aiter_bytes():
+                    for data in decoder.feed(chunk):
+                        item = adapter.validate_python(data)
+                        if identity_map is not None:
+                            item = identity_map.intern(item)
+                        yield item
+            else:
+                async for chunk in adownloaded(stats, response.aiter_bytes()):
+                    for data in timed(stats, "decode", decoder.feed, chunk):
+                        item = timed(stats, "validate", adapter.validate_python, data)
+                        if identity_map is not None:
+                            item = identity_map.intern(item)
+                        yield item
+        decoder.close()
+
+    async def _stream_while(
+        self, path: str, adapter: TypeAdapter[T], keep: Callable[[T], bool]
+    ) -> AsyncGenerator[T, None]:
+        async with aclosing(self._stream(path, adapter)) as items:
+            async for item in items:
+                if not keep(item):
+                    return
+                yield item
+
+    async def _get_many(
+        self,
+        keys: Sequence[K],
+        get: Callable[[K], Awaitable[T | None]],
+        get_all: Callable[[], Awaitable[list[T]]],
+        key_of: Callable[[T], K],
+        max_concurrency: int,
+        bulk_threshold: int | None,
+    ) -> list[T | None]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+        if bulk_threshold is not None and len(unique) >= bulk_threshold:
+            found = {key_of(item): item for item in await get_all()}
+        else:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def bounded(key: K) -> T | None:
+                async with semaphore:
+                    return await get(key)
+
+            results = await asyncio.gather(*(bounded(key) for key in unique))
+            found = dict(zip(unique, results, strict=True))
+        return [found.get(key) for key in keys]
@@ -1,7 +1,15 @@
+from collections.abc import Iterable
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
 from helldivepy.models import Assignment
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawAssignment
+
+_ASSIGNMENT = TypeAdapter(Assignment)
+_ASSIGNMENT_LIST = TypeAdapter(list[Assignment])
 
 
 class AssignmentsModule(BaseModule):
@@ -13,8 +21,7 @@ class AssignmentsModule(BaseModule):
         Returns:
             A list of all currently active Major Orders.
         """
-        data = self._get("/v1/assignments")
-        return [Assignment.model_validate(assignment) for assignment in data]
+        return self._get("/v1/assignments", _ASSIGNMENT_LIST)
 
     def get(self, index: int) -> Assignment | None:
         """Fetch a specific assignment by ID.
@@ -26,8 +33,160 @@ class AssignmentsModule(BaseModule):
             The matching Assignment, or None if not found.
         """
         try:
-            return Assignment.model_validate(self._get(f"/v1/assignments/{index}"))
+            return self._get(f"/v1/assignments/{index}", _ASSIGNMENT)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 2,
+    ) -> list[Assignment | None]:
+        """Fetch several assignments at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    def get_all_raw(self) -> list[RawAssignment]:
+        """Fetch all active assignments as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawAssignment payloads with the API's camelCase keys.
+        """
+        return self._get("/v1/assignments")
+
+    def get_raw(self, index: int) -> RawAssignment | None:
+        """Fetch a specific assignment as decoded JSON, skipping model validation.
+
+        Args:
+            index: The assignment ID.
+
+        Returns:
+            The matching RawAssignment payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v1/assignments/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all active assignments as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v1/assignments")
+
+
+class AsyncAssignmentsModule(AsyncBaseModule):
+    """Access Major Orders (assignments) issued by high command (asyncio)."""
+
+    async def get_all(self) -> list[Assignment]:
+        """Fetch all active assignments.
+
+        Returns:
+            A list of all currently active Major Orders.
+        """
+        return await self._get("/v1/assignments", _ASSIGNMENT_LIST)
+
+    async def get(self, index: int) -> Assignment | None:
+        """Fetch a specific assignment by ID.
+
+        Args:
+            index: The assignment ID.
+
+        Returns:
+            The matching Assignment, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/assignments/{index}", _ASSIGNMENT)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
+
+    async def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 2,
+    ) -> list[Assignment | None]:
+        """Fetch several assignments at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_all_raw(self) -> list[RawAssignment]:
+        """Fetch all active assignments as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawAssignment payloads with the API's camelCase keys.
+        """
+        return await self._get("/v1/assignments")
+
+    async def get_raw(self, index: int) -> RawAssignment | None:
+        """Fetch a specific assignment as decoded JSON, skipping model validation.
+
+        Args:
+            index: The assignment ID.
+
+        Returns:
+            The matching RawAssignment payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/assignments/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all active assignments as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v1/assignments")
@@ -1,7 +1,17 @@
+from collections.abc import AsyncGenerator, Generator, Iterable
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
+from helldivepy.lazy import LazyCampaign
 from helldivepy.models import Campaign
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawCampaign
+
+_CAMPAIGN = TypeAdapter(Campaign)
+_CAMPAIGN_LIST = TypeAdapter(list[Campaign])
+_LAZY_CAMPAIGN_LIST = TypeAdapter(list[LazyCampaign])
 
 
 class CampaignModule(BaseModule):
@@ -13,7 +23,33 @@ class CampaignModule(BaseModule):
         Returns:
             A list of all ongoing campaigns.
         """
-        return [Campaign.model_validate(d) for d in self._get("/v1/campaigns")]
+        return self._get("/v1/campaigns", _CAMPAIGN_LIST)
+
+    def get_all_lazy(self) -> list[LazyCampaign]:
+        """Fetch all campaigns, deferring validation of nested sub-models.
+
+        Nested parts of the response are not even decoded until one is read,
+        which makes this faster than `get_all()` as long as only top-level
+        fields are used. The first nested read decodes the whole body, and
+        reading `planet` on every campaign ends up several times slower than
+        `get_all()`; see `LazyCampaign`.
+
+        Returns:
+            A list of LazyCampaign objects.
+        """
+        return self._get("/v1/campaigns", _LAZY_CAMPAIGN_LIST)
+
+    def iter_all(self) -> Generator[Campaign, None, None]:
+        """Stream all campaigns, yielding each one as soon as it has been received.
+
+        Unlike `get_all()`, the response is never buffered as a whole, so peak
+        memory stays flat and processing can start before the download ends.
+        Streamed requests bypass the response cache and retry policy.
+
+        Yields:
+            Each Campaign in API order.
+        """
+        return self._stream("/v1/campaigns", _CAMPAIGN)
 
     def get(self, index: int) -> Campaign | None:
         """Fetch a specific campaign by ID.
@@ -25,8 +61,186 @@ class CampaignModule(BaseModule):
             The matching Campaign, or None if not found.
         """
         try:
-            return Campaign.model_validate(self._get(f"/v1/campaigns/{index}"))
+            return self._get(f"/v1/campaigns/{index}", _CAMPAIGN)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 4,
+    ) -> list[Campaign | None]:
+        """Fetch several campaigns at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    def get_all_raw(self) -> list[RawCampaign]:
+        """Fetch all active campaigns as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawCampaign payloads with the API's camelCase keys.
+        """
+        return self._get("/v1/campaigns")
+
+    def get_raw(self, index: int) -> RawCampaign | None:
+        """Fetch a specific campaign as decoded JSON, skipping model validation.
+
+        Args:
+            index: The campaign ID.
+
+        Returns:
+            The matching RawCampaign payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v1/campaigns/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all active campaigns as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v1/campaigns")
+
+
+class AsyncCampaignModule(AsyncBaseModule):
+    """Access active planetary campaigns (asyncio)."""
+
+    async def get_all(self) -> list[Campaign]:
+        """Fetch all active campaigns.
+
+        Returns:
+            A list of all ongoing campaigns.
+        """
+        return await self._get("/v1/campaigns", _CAMPAIGN_LIST)
+
+    async def get_all_lazy(self) -> list[LazyCampaign]:
+        """Fetch all campaigns, deferring validation of nested sub-models.
+
+        Nested parts of the response are not even decoded until one is read,
+        which makes this faster than `get_all()` as long as only top-level
+        fields are used. The first nested read decodes the whole body, and
+        reading `planet` on every campaign ends up several times slower than
+        `get_all()`; see `LazyCampaign`.
+
+        Returns:
+            A list of LazyCampaign objects.
+        """
+        return await self._get("/v1/campaigns", _LAZY_CAMPAIGN_LIST)
+
+    def iter_all(self) -> AsyncGenerator[Campaign, None]:
+        """Stream all campaigns, yielding each one as soon as it has been received.
+
+        Unlike `get_all()`, the response is never buffered as a whole, so peak
+        memory stays flat and processing can start before the download ends.
+        Streamed requests bypass the response cache and retry policy.
+
+        Yields:
+            Each Campaign in API order.
+        """
+        return self._stream("/v1/campaigns", _CAMPAIGN)
+
+    async def get(self, index: int) -> Campaign | None:
+        """Fetch a specific campaign by ID.
+
+        Args:
+            index: The campaign ID.
+
+        Returns:
+            The matching Campaign, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/campaigns/{index}", _CAMPAIGN)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 4,
+    ) -> list[Campaign | None]:
+        """Fetch several campaigns at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_all_raw(self) -> list[RawCampaign]:
+        """Fetch all active campaigns as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawCampaign payloads with the API's camelCase keys.
+        """
+        return await self._get("/v1/campaigns")
+
+    async def get_raw(self, index: int) -> RawCampaign | None:
+        """Fetch a specific campaign as decoded JSON, skipping model validation.
+
+        Args:
+            index: The campaign ID.
+
+        Returns:
+            The matching RawCampaign payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/campaigns/{index}")
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all active campaigns as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v1/campaigns")
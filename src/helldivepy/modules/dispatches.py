@@ -1,19 +1,70 @@
+from collections.abc import AsyncGenerator, Generator, Iterable
+from contextlib import aclosing
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
 from helldivepy.models import Dispatch
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawDispatch
+
+_DISPATCH = TypeAdapter(Dispatch)
+_DISPATCH_LIST = TypeAdapter(list[Dispatch])
 
 
 class DispatchesModule(BaseModule):
     """Access in-game dispatches (high-command broadcasts)."""
 
+    cursor: int | None = None
+    """ID of the newest dispatch yielded by `iter_new()`."""
+
     def get_all(self) -> list[Dispatch]:
         """Fetch all available dispatches.
 
         Returns:
             A list of all dispatches, most recent first.
         """
-        return [Dispatch.model_validate(d) for d in self._get("/v2/dispatches")]
+        return self._get("/v2/dispatches", _DISPATCH_LIST)
+
+    def get_since(self, last_id: int) -> list[Dispatch]:
+        """Fetch only the dispatches published after `last_id`.
+
+        The response is streamed and parsing stops at the first dispatch with
+        an ID of `last_id` or lower, since the API lists them newest first.
+        Streamed requests bypass the response cache and retry policy.
+
+        Args:
+            last_id: ID of the newest dispatch already seen.
+
+        Returns:
+            The newer dispatches, most recent first.
+        """
+        return list(
+            self._stream_while("/v2/dispatches", _DISPATCH, lambda d: d.id > last_id)
+        )
+
+    def iter_new(self) -> Generator[Dispatch, None, None]:
+        """Yield the dispatches published since the previous `iter_new()` call.
+
+        The module keeps the newest ID seen in `cursor` (set it to resume from
+        a saved position). The first call yields every dispatch. The cursor
+        only advances once the iteration completes, so breaking out early
+        yields the same dispatches again next time.
+
+        Yields:
+            Each new Dispatch, most recent first.
+        """
+        cursor = self.cursor
+        newest: int | None = None
+        for dispatch in self._stream_while(
+            "/v2/dispatches", _DISPATCH, lambda d: cursor is None or d.id > cursor
+        ):
+            if newest is None:
+                newest = dispatch.id
+            yield dispatch
+        if newest is not None:
+            self.cursor = newest
 
     def get(self, index: int) -> Dispatch | None:
         """Fetch a specific dispatch by ID.
@@ -25,8 +76,205 @@ class DispatchesModule(BaseModule):
             The matching Dispatch, or None if not found.
         """
         try:
-            return Dispatch.model_validate(self._get(f"/v2/dispatches/{index}"))
+            return self._get(f"/v2/dispatches/{index}", _DISPATCH)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 8,
+    ) -> list[Dispatch | None]:
+        """Fetch several dispatches at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    def get_all_raw(self) -> list[RawDispatch]:
+        """Fetch all dispatches as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawDispatch payloads with the API's camelCase keys.
+        """
+        return self._get("/v2/dispatches")
+
+    def get_raw(self, index: int) -> RawDispatch | None:
+        """Fetch a specific dispatch as decoded JSON, skipping model validation.
+
+        Args:
+            index: The dispatch ID.
+
+        Returns:
+            The matching RawDispatch payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v2/dispatches/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all dispatches as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v2/dispatches")
+
+
+class AsyncDispatchesModule(AsyncBaseModule):
+    """Access in-game dispatches (high-command broadcasts) (asyncio)."""
+
+    cursor: int | None = None
+    """ID of the newest dispatch yielded by `iter_new()`."""
+
+    async def get_all(self) -> list[Dispatch]:
+        """Fetch all available dispatches.
+
+        Returns:
+            A list of all dispatches, most recent first.
+        """
+        return await self._get("/v2/dispatches", _DISPATCH_LIST)
+
+    async def get_since(self, last_id: int) -> list[Dispatch]:
+        """Fetch only the dispatches published after `last_id`.
+
+        The response is streamed and parsing stops at the first dispatch with
+        an ID of `last_id` or lower, since the API lists them newest first.
+        Streamed requests bypass the response cache and retry policy.
+
+        Args:
+            last_id: ID of the newest dispatch already seen.
+
+        Returns:
+            The newer dispatches, most recent first.
+        """
+        stream = self._stream_while(
+            "/v2/dispatches", _DISPATCH, lambda d: d.id > last_id
+        )
+        return [dispatch async for dispatch in stream]
+
+    async def iter_new(self) -> AsyncGenerator[Dispatch, None]:
+        """Yield the dispatches published since the previous `iter_new()` call.
+
+        The module keeps the newest ID seen in `cursor` (set it to resume from
+        a saved position). The first call yields every dispatch. The cursor
+        only advances once the iteration completes, so breaking out early
+        yields the same dispatches again next time.
+
+        Yields:
+            Each new Dispatch, most recent first.
+        """
+        cursor = self.cursor
+        newest: int | None = None
+        stream = self._stream_while(
+            "/v2/dispatches", _DISPATCH, lambda d: cursor is None or d.id > cursor
+        )
+        async with aclosing(stream) as dispatches:
+            async for dispatch in dispatches:
+                if newest is None:
+                    newest = dispatch.id
+                yield dispatch
+        if newest is not None:
+            self.cursor = newest
+
+    async def get(self, index: int) -> Dispatch | None:
+        """Fetch a specific dispatch by ID.
+
+        Args:
+            index: The dispatch ID.
+
+        Returns:
+            The matching Dispatch, or None if not found.
+        """
+        try:
+            return await self._get(f"/v2/dispatches/{index}", _DISPATCH)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
+
+    async def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 8,
+    ) -> list[Dispatch | None]:
+        """Fetch several dispatches at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_all_raw(self) -> list[RawDispatch]:
+        """Fetch all dispatches as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawDispatch payloads with the API's camelCase keys.
+        """
+        return await self._get("/v2/dispatches")
+
+    async def get_raw(self, index: int) -> RawDispatch | None:
+        """Fetch a specific dispatch as decoded JSON, skipping model validation.
+
+        Args:
+            index: The dispatch ID.
+
+        Returns:
+            The matching RawDispatch payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v2/dispatches/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all dispatches as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v2/dispatches")
@@ -1,7 +1,17 @@
+from collections.abc import AsyncGenerator, Generator, Iterable
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
+from helldivepy.lazy import LazyPlanet
 from helldivepy.models import Planet
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawPlanet
+
+_PLANET = TypeAdapter(Planet)
+_PLANET_LIST = TypeAdapter(list[Planet])
+_LAZY_PLANET_LIST = TypeAdapter(list[LazyPlanet])
 
 
 class PlanetModule(BaseModule):
@@ -13,7 +23,33 @@ class PlanetModule(BaseModule):
         Returns:
             A list of all planets in the galaxy.
         """
-        return [Planet.model_validate(p) for p in self._get("/v1/planets")]
+        return self._get("/v1/planets", _PLANET_LIST)
+
+    def get_all_lazy(self) -> list[LazyPlanet]:
+        """Fetch all planets, deferring validation of nested sub-models.
+
+        Nested parts of the response are not even decoded until one is read,
+        which halves the time `get_all()` takes as long as only top-level fields
+        are used. The first nested read decodes the whole body, and reading a
+        nested field such as `position` or `regions` on every planet ends up
+        slower than `get_all()`; see `LazyPlanet`.
+
+        Returns:
+            A list of LazyPlanet objects.
+        """
+        return self._get("/v1/planets", _LAZY_PLANET_LIST)
+
+    def iter_all(self) -> Generator[Planet, None, None]:
+        """Stream all planets, yielding each one as soon as it has been received.
+
+        Unlike `get_all()`, the response is never buffered as a whole, so peak
+        memory stays flat and processing can start before the download ends.
+        Streamed requests bypass the response cache and retry policy.
+
+        Yields:
+            Each Planet in API order.
+        """
+        return self._stream("/v1/planets", _PLANET)
 
     def get(self, index: int) -> Planet | None:
         """Fetch a specific planet by index.
@@ -25,16 +61,202 @@ class PlanetModule(BaseModule):
             The matching Planet, or None if not found.
         """
         try:
-            return Planet.model_validate(self._get(f"/v1/planets/{index}"))
+            return self._get(f"/v1/planets/{index}", _PLANET)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
 
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 16,
+    ) -> list[Planet | None]:
+        """Fetch several planets at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("index"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
     def get_events(self) -> list[Planet]:
         """Fetch all planets with an active event (e.g. defense campaigns).
 
         Returns:
             A list of active Events across all planets.
         """
-        return [Planet.model_validate(e) for e in self._get("/v1/planet-events")]
+        return self._get("/v1/planet-events", _PLANET_LIST)
+
+    def get_all_raw(self) -> list[RawPlanet]:
+        """Fetch all planets as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawPlanet payloads with the API's camelCase keys.
+        """
+        return self._get("/v1/planets")
+
+    def get_raw(self, index: int) -> RawPlanet | None:
+        """Fetch a specific planet as decoded JSON, skipping model validation.
+
+        Args:
+            index: The planet's ArrowHead index.
+
+        Returns:
+            The matching RawPlanet payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v1/planets/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all planets as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v1/planets")
+
+
+class AsyncPlanetModule(AsyncBaseModule):
+    """Access planet data and active planetary events (asyncio)."""
+
+    async def get_all(self) -> list[Planet]:
+        """Fetch all planets.
+
+        Returns:
+            A list of all planets in the galaxy.
+        """
+        return await self._get("/v1/planets", _PLANET_LIST)
+
+    async def get_all_lazy(self) -> list[LazyPlanet]:
+        """Fetch all planets, deferring validation of nested sub-models.
+
+        Nested parts of the response are not even decoded until one is read,
+        which halves the time `get_all()` takes as long as only top-level fields
+        are used. The first nested read decodes the whole body, and reading a
+        nested field such as `position` or `regions` on every planet ends up
+        slower than `get_all()`; see `LazyPlanet`.
+
+        Returns:
+            A list of LazyPlanet objects.
+        """
+        return await self._get("/v1/planets", _LAZY_PLANET_LIST)
+
+    def iter_all(self) -> AsyncGenerator[Planet, None]:
+        """Stream all planets, yielding each one as soon as it has been received.
+
+        Unlike `get_all()`, the response is never buffered as a whole, so peak
+        memory stays flat and processing can start before the download ends.
+        Streamed requests bypass the response cache and retry policy.
+
+        Yields:
+            Each Planet in API order.
+        """
+        return self._stream("/v1/planets", _PLANET)
+
+    async def get(self, index: int) -> Planet | None:
+        """Fetch a specific planet by index.
+
+        Args:
+            index: The planet's ArrowHead index.
+
+        Returns:
+            The matching Planet, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/planets/{index}", _PLANET)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 16,
+    ) -> list[Planet | None]:
+        """Fetch several planets at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("index"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_events(self) -> list[Planet]:
+        """Fetch all planets with an active event (e.g. defense campaigns).
+
+        Returns:
+            A list of active Events across all planets.
+        """
+        return await self._get("/v1/planet-events", _PLANET_LIST)
+
+    async def get_all_raw(self) -> list[RawPlanet]:
+        """Fetch all planets as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawPlanet payloads with the API's camelCase keys.
+        """
+        return await self._get("/v1/planets")
+
+    async def get_raw(self, index: int) -> RawPlanet | None:
+        """Fetch a specific planet as decoded JSON, skipping model validation.
+
+        Args:
+            index: The planet's ArrowHead index.
+
+        Returns:
+            The matching RawPlanet payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/planets/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all planets as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v1/planets")
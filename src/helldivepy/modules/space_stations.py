@@ -1,7 +1,15 @@
+from collections.abc import Iterable
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
 from helldivepy.models import SpaceStation
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawSpaceStation
+
+_SPACE_STATION = TypeAdapter(SpaceStation)
+_SPACE_STATION_LIST = TypeAdapter(list[SpaceStation])
 
 
 class SpaceStationsModule(BaseModule):
@@ -13,7 +21,7 @@ class SpaceStationsModule(BaseModule):
         Returns:
             A list of all space stations and their current state.
         """
-        return [SpaceStation.model_validate(d) for d in self._get("/v2/space-stations")]
+        return self._get("/v2/space-stations", _SPACE_STATION_LIST)
 
     def get(self, index: int) -> SpaceStation | None:
         """Fetch a specific space station by ID.
@@ -25,8 +33,160 @@ class SpaceStationsModule(BaseModule):
             The matching SpaceStation, or None if not found.
         """
         try:
-            return SpaceStation.model_validate(self._get(f"/v2/space-stations/{index}"))
+            return self._get(f"/v2/space-stations/{index}", _SPACE_STATION)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 2,
+    ) -> list[SpaceStation | None]:
+        """Fetch several space stations at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id32"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    def get_all_raw(self) -> list[RawSpaceStation]:
+        """Fetch all space stations as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawSpaceStation payloads with the API's camelCase keys.
+        """
+        return self._get("/v2/space-stations")
+
+    def get_raw(self, index: int) -> RawSpaceStation | None:
+        """Fetch a specific space station as decoded JSON, skipping model validation.
+
+        Args:
+            index: The station's 32-bit ArrowHead ID.
+
+        Returns:
+            The matching RawSpaceStation payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v2/space-stations/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all space stations as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v2/space-stations")
+
+
+class AsyncSpaceStationsModule(AsyncBaseModule):
+    """Access the Democracy Space Station (DSS) and its tactical actions (asyncio)."""
+
+    async def get_all(self) -> list[SpaceStation]:
+        """Fetch all space stations.
+
+        Returns:
+            A list of all space stations and their current state.
+        """
+        return await self._get("/v2/space-stations", _SPACE_STATION_LIST)
+
+    async def get(self, index: int) -> SpaceStation | None:
+        """Fetch a specific space station by ID.
+
+        Args:
+            index: The station's 32-bit ArrowHead ID.
+
+        Returns:
+            The matching SpaceStation, or None if not found.
+        """
+        try:
+            return await self._get(f"/v2/space-stations/{index}", _SPACE_STATION)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
+
+    async def get_many(
+        self,
+        indices: Iterable[int],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 2,
+    ) -> list[SpaceStation | None]:
+        """Fetch several space stations at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            indices: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(indices),
+            self.get,
+            self.get_all,
+            attrgetter("id32"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_all_raw(self) -> list[RawSpaceStation]:
+        """Fetch all space stations as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawSpaceStation payloads with the API's camelCase keys.
+        """
+        return await self._get("/v2/space-stations")
+
+    async def get_raw(self, index: int) -> RawSpaceStation | None:
+        """Fetch a specific space station as decoded JSON, skipping model validation.
+
+        Args:
+            index: The station's 32-bit ArrowHead ID.
+
+        Returns:
+            The matching RawSpaceStation payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v2/space-stations/{index}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all space stations as the undecoded response body, for passthrough.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v2/space-stations")
@@ -1,19 +1,75 @@
+from collections.abc import AsyncGenerator, Generator, Iterable
+from contextlib import aclosing
+from datetime import datetime
+from operator import attrgetter
+
 import httpx
+from pydantic import TypeAdapter
 
 from helldivepy.models import SteamNews
-from helldivepy.modules import BaseModule
+from helldivepy.modules import AsyncBaseModule, BaseModule
+from helldivepy.raw import RawSteamNews
+
+_STEAM_NEWS = TypeAdapter(SteamNews)
+_STEAM_NEWS_LIST = TypeAdapter(list[SteamNews])
 
 
 class SteamModule(BaseModule):
     """Access the Helldivers 2 Steam news feed."""
 
+    cursor: datetime | None = None
+    """Publication time of the newest article yielded by `iter_new()`."""
+
     def get_all(self) -> list[SteamNews]:
         """Fetch all Steam news articles for Helldivers 2.
 
         Returns:
             A list of Steam news articles, most recent first.
         """
-        return [SteamNews.model_validate(d) for d in self._get("/v1/steam")]
+        return self._get("/v1/steam", _STEAM_NEWS_LIST)
+
+    def get_since(self, published_at: datetime) -> list[SteamNews]:
+        """Fetch only the articles published after `published_at`.
+
+        The response is streamed and parsing stops at the first article
+        published at or before `published_at`, since the API lists them newest
+        first. Streamed requests bypass the response cache and retry policy.
+
+        Args:
+            published_at: Publication time of the newest article already seen.
+
+        Returns:
+            The newer articles, most recent first.
+        """
+        return list(
+            self._stream_while(
+                "/v1/steam", _STEAM_NEWS, lambda n: n.published_at > published_at
+            )
+        )
+
+    def iter_new(self) -> Generator[SteamNews, None, None]:
+        """Yield the articles published since the previous `iter_new()` call.
+
+        The module keeps the newest publication time seen in `cursor` (set it
+        to resume from a saved position). The first call yields every article.
+        The cursor only advances once the iteration completes, so breaking out
+        early yields the same articles again next time.
+
+        Yields:
+            Each new SteamNews article, most recent first.
+        """
+        cursor = self.cursor
+        newest: datetime | None = None
+        for news in self._stream_while(
+            "/v1/steam",
+            _STEAM_NEWS,
+            lambda n: cursor is None or n.published_at > cursor,
+        ):
+            if newest is None:
+                newest = news.published_at
+            yield news
+        if newest is not None:
+            self.cursor = newest
 
     def get(self, gid: str) -> SteamNews | None:
         """Fetch a specific Steam news article by its global ID.
@@ -25,8 +81,207 @@ class SteamModule(BaseModule):
             The matching SteamNews article, or None if not found.
         """
         try:
-            return SteamNews.model_validate(self._get(f"/v1/steam/{gid}"))
+            return self._get(f"/v1/steam/{gid}", _STEAM_NEWS)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_many(
+        self,
+        gids: Iterable[str],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 8,
+    ) -> list[SteamNews | None]:
+        """Fetch several Steam news articles at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            gids: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return self._get_many(
+            list(gids),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    def get_all_raw(self) -> list[RawSteamNews]:
+        """Fetch all Steam news articles as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawSteamNews payloads with the API's camelCase keys.
+        """
+        return self._get("/v1/steam")
+
+    def get_raw(self, gid: str) -> RawSteamNews | None:
+        """Fetch a specific Steam news article as decoded JSON, without validation.
+
+        Args:
+            gid: The Steam article global ID.
+
+        Returns:
+            The matching RawSteamNews payload, or None if not found.
+        """
+        try:
+            return self._get(f"/v1/steam/{gid}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    def get_all_bytes(self) -> bytes:
+        """Fetch all Steam news articles as the undecoded response body.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v1/steam")
+
+
+class AsyncSteamModule(AsyncBaseModule):
+    """Access the Helldivers 2 Steam news feed (asyncio)."""
+
+    cursor: datetime | None = None
+    """Publication time of the newest article yielded by `iter_new()`."""
+
+    async def get_all(self) -> list[SteamNews]:
+        """Fetch all Steam news articles for Helldivers 2.
+
+        Returns:
+            A list of Steam news articles, most recent first.
+        """
+        return await self._get("/v1/steam", _STEAM_NEWS_LIST)
+
+    async def get_since(self, published_at: datetime) -> list[SteamNews]:
+        """Fetch only the articles published after `published_at`.
+
+        The response is streamed and parsing stops at the first article
+        published at or before `published_at`, since the API lists them newest
+        first. Streamed requests bypass the response cache and retry policy.
+
+        Args:
+            published_at: Publication time of the newest article already seen.
+
+        Returns:
+            The newer articles, most recent first.
+        """
+        stream = self._stream_while(
+            "/v1/steam", _STEAM_NEWS, lambda n: n.published_at > published_at
+        )
+        return [news async for news in stream]
+
+    async def iter_new(self) -> AsyncGenerator[SteamNews, None]:
+        """Yield the articles published since the previous `iter_new()` call.
+
+        The module keeps the newest publication time seen in `cursor` (set it
+        to resume from a saved position). The first call yields every article.
+        The cursor only advances once the iteration completes, so breaking out
+        early yields the same articles again next time.
+
+        Yields:
+            Each new SteamNews article, most recent first.
+        """
+        cursor = self.cursor
+        newest: datetime | None = None
+        stream = self._stream_while(
+            "/v1/steam",
+            _STEAM_NEWS,
+            lambda n: cursor is None or n.published_at > cursor,
+        )
+        async with aclosing(stream) as articles:
+            async for news in articles:
+                if newest is None:
+                    newest = news.published_at
+                yield news
+        if newest is not None:
+            self.cursor = newest
+
+    async def get(self, gid: str) -> SteamNews | None:
+        """Fetch a specific Steam news article by its global ID.
+
+        Args:
+            gid: The Steam article global ID.
+
+        Returns:
+            The matching SteamNews article, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/steam/{gid}", _STEAM_NEWS)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
             raise
+
+    async def get_many(
+        self,
+        gids: Iterable[str],
+        max_concurrency: int = 8,
+        bulk_threshold: int | None = 8,
+    ) -> list[SteamNews | None]:
+        """Fetch several Steam news articles at once.
+
+        Distinct IDs are fetched concurrently, at most `max_concurrency` at a
+        time. When at least `bulk_threshold` distinct IDs are requested a single
+        `get_all()` call is made and filtered instead.
+
+        Args:
+            gids: The IDs to fetch. Duplicates are fetched once.
+            max_concurrency: Maximum number of requests in flight.
+            bulk_threshold: Distinct-ID count at which to switch to `get_all()`,
+                or None to always fetch individually.
+
+        Returns:
+            One entry per requested ID, in input order; None where not found.
+        """
+        return await self._get_many(
+            list(gids),
+            self.get,
+            self.get_all,
+            attrgetter("id"),
+            max_concurrency,
+            bulk_threshold,
+        )
+
+    async def get_all_raw(self) -> list[RawSteamNews]:
+        """Fetch all Steam news articles as decoded JSON, skipping model validation.
+
+        Returns:
+            A list of RawSteamNews payloads with the API's camelCase keys.
+        """
+        return await self._get("/v1/steam")
+
+    async def get_raw(self, gid: str) -> RawSteamNews | None:
+        """Fetch a specific Steam news article as decoded JSON, without validation.
+
+        Args:
+            gid: The Steam article global ID.
+
+        Returns:
+            The matching RawSteamNews payload, or None if not found.
+        """
+        try:
+            return await self._get(f"/v1/steam/{gid}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+
+    async def get_all_bytes(self) -> bytes:
+        """Fetch all Steam news articles as the undecoded response body.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v1/steam")
@@ -1,6 +1,11 @@
+from pydantic import TypeAdapter
+
 from helldivepy.models import War
+from helldivepy.raw import RawWar
+
+from . import AsyncBaseModule, BaseModule
 
-from . import BaseModule
+_WAR = TypeAdapter(War)
 
 
 class WarModule(BaseModule):
@@ -12,4 +17,48 @@ class WarModule(BaseModule):
         Returns:
             The current War state including statistics and active factions.
         """
-        return War.model_validate(self._get("/v1/war"))
+        return self._get("/v1/war", _WAR)
+
+    def get_raw(self) -> RawWar:
+        """Fetch the current war status as decoded JSON, skipping model validation.
+
+        Returns:
+            The RawWar payload with the API's camelCase keys.
+        """
+        return self._get("/v1/war")
+
+    def get_bytes(self) -> bytes:
+        """Fetch the current war status as the undecoded response body.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return self._get_bytes("/v1/war")
+
+
+class AsyncWarModule(AsyncBaseModule):
+    """Access the global war state (asyncio)."""
+
+    async def get(self) -> War:
+        """Fetch the current war status snapshot.
+
+        Returns:
+            The current War state including statistics and active factions.
+        """
+        return await self._get("/v1/war", _WAR)
+
+    async def get_raw(self) -> RawWar:
+        """Fetch the current war status as decoded JSON, skipping model validation.
+
+        Returns:
+            The RawWar payload with the API's camelCase keys.
+        """
+        return await self._get("/v1/war")
+
+    async def get_bytes(self) -> bytes:
+        """Fetch the current war status as the undecoded response body.
+
+        Returns:
+            The JSON body exactly as sent by the API.
+        """
+        return await self._get_bytes("/v1/war")
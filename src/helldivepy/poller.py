@@ -0,0 +1,389 @@
+"""Poll the API and emit only what changed, with adaptive per-resource intervals."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, cast
+
+import httpx
+
+from helldivepy.models import Assignment, Campaign, Planet, SpaceStation, War
+
+if TYPE_CHECKING:
+    from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+
+DEFAULT_INTERVALS: dict[str, float] = {
+    "war": 10.0,
+    "planets": 10.0,
+    "campaigns": 10.0,
+    "assignments": 30.0,
+    "dispatches": 60.0,
+    "steam": 300.0,
+    "space_stations": 30.0,
+}
+"""Base polling interval of every resource, in seconds."""
+
+
+def _key(resource: str, item: Any) -> Hashable:
+    if resource == "planets":
+        return item.index
+    if resource == "space_stations":
+        return item.id32
+    if resource == "war":
+        return None
+    return item.id
+
+
+def _same(old: Any, new: Any) -> bool:
+    if old is new:
+        return True
+    if isinstance(new, War):
+        # `now` is the server time and changes with every request.
+        return old.model_copy(update={"now": new.now}) == new
+    return old == new
+
+
+def _deadlines(items: Iterable[Any]) -> Iterator[datetime]:
+    """Times at which the state of `items` is known to change."""
+    for item in items:
+        if isinstance(item, Planet) and item.event is not None:
+            yield item.event.end_time
+        elif isinstance(item, Campaign) and item.planet.event is not None:
+            yield item.planet.event.end_time
+        elif isinstance(item, Assignment):
+            yield item.expiration
+        elif isinstance(item, SpaceStation):
+            yield item.election_end
+
+
+@dataclass(frozen=True, slots=True)
+class Update:
+    """What changed in one resource since it was last polled."""
+
+    resource: str
+    """Resource name, e.g. `"planets"`."""
+    changed: tuple[Any, ...]
+    """New or modified items. On the first poll, every item."""
+    removed: tuple[Any, ...]
+    """Items that are no longer returned, in their last known state."""
+
+
+@dataclass(slots=True)
+class _Schedule:
+    base: float
+    interval: float
+    due: float = 0.0
+    previous: dict[Hashable, Any] | None = None
+
+
+class _PollerBase:
+    def __init__(
+        self,
+        intervals: Mapping[str, float] | None,
+        min_interval: float,
+        max_interval: float,
+        backoff: float,
+    ) -> None:
+        if intervals is None:
+            intervals = DEFAULT_INTERVALS
+        unknown = set(intervals) - set(DEFAULT_INTERVALS)
+        if unknown:
+            raise ValueError(f"Unknown resources: {', '.join(sorted(unknown))}")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._schedules = {
+            resource: _Schedule(base, max(base, min_interval))
+            for resource, base in intervals.items()
+        }
+
+    @property
+    def resources(self) -> list[str]:
+        """Names of the polled resources."""
+        return list(self._schedules)
+
+    def next_poll(self, resource: str) -> float:
+        """Seconds until `resource` is polled next."""
+        return max(0.0, self._schedules[resource].due - time.monotonic())
+
+    def _next_due(self) -> tuple[str, float]:
+        resource = min(self._schedules, key=lambda r: self._schedules[r].due)
+        return resource, self._schedules[resource].due - time.monotonic()
+
+    def _apply(self, resource: str, result: Any) -> Update | None:
+        """Record a fetched result, reschedule the resource and return its update."""
+        schedule = self._schedules[resource]
+        items: list[Any]
+        if result is None:
+            items = []
+        elif isinstance(result, list):
+            items = cast(list[Any], result)
+        else:
+            items = [result]
+        current = {_key(resource, item): item for item in items}
+        previous = schedule.previous
+        schedule.previous = current
+        if previous is None:
+            changed, removed = items, []
+        else:
+            changed = [
+                item
+                for key, item in current.items()
+                if key not in previous or not _same(previous[key], item)
+            ]
+            removed = [item for key, item in previous.items() if key not in current]
+
+        # Reset to the base interval on change, back off while nothing changes.
+        if changed or removed:
+            schedule.interval = max(schedule.base, self.min_interval)
+        else:
+            self._back_off(schedule)
+        delay = schedule.interval
+        now = datetime.now(UTC)
+        upcoming = [d for d in _deadlines(items) if d > now]
+        if upcoming:
+            # Poll right after the next known state change.
+            until = (min(upcoming) - now).total_seconds() + 1.0
+            delay = min(delay, max(until, self.min_interval))
+        schedule.due = time.monotonic() + delay
+
+        if not changed and not removed:
+            return None
+        return Update(resource, tuple(changed), tuple(removed))
+
+    def _failed(self, resource: str) -> None:
+        """Reschedule a resource whose poll failed, backing off its interval."""
+        schedule = self._schedules[resource]
+        self._back_off(schedule)
+        schedule.due = time.monotonic() + schedule.interval
+
+    def _back_off(self, schedule: _Schedule) -> None:
+        schedule.interval = min(
+            schedule.interval * self.backoff, max(self.max_interval, schedule.base)
+        )
+
+
+class Poller(_PollerBase):
+    """Polls resources of a `HelldiveAPIClient` and emits what changed.
+
+    Each resource (`war`, `planets`, `campaigns`, `assignments`, `dispatches`,
+    `steam`, `space_stations`) is polled on its own schedule. An interval is
+    reset to its base value whenever the resource changes and multiplied by
+    `backoff` (up to `max_interval`) whenever it doesn't. Known state changes,
+    event ends, assignment expirations and space station elections, pull
+    the next poll forward to just after they happen.
+
+    Create one with `client.poller()`, then either iterate over it or register
+    callbacks and call `run()`. Both block until `stop()` is called.
+
+    A poll that fails with an `httpx.HTTPError` (a network error, or an error
+    status left after any `RetryPolicy`) doesn't stop polling: the resource
+    is backed off like an unchanged one, the error is passed to the
+    `on_error()` callbacks, and the other resources carry on.
+    """
+
+    def __init__(
+        self,
+        client: HelldiveAPIClient,
+        intervals: Mapping[str, float] | None = None,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+    ) -> None:
+        """Create a new poller.
+
+        Args:
+            client: The client to poll with.
+            intervals: Base interval in seconds per resource to poll. Only the
+                resources listed are polled. Defaults to `DEFAULT_INTERVALS`.
+            min_interval: Shortest delay between two polls of one resource.
+            max_interval: Longest delay the back-off can reach.
+            backoff: Interval multiplier applied after a poll without changes.
+
+        Raises:
+            ValueError: If `intervals` names an unknown resource.
+        """
+        super().__init__(intervals, min_interval, max_interval, backoff)
+        self._client = client
+        self._callbacks: dict[str, list[Callable[[Update], None]]] = {}
+        self._error_callbacks: list[Callable[[str, httpx.HTTPError], None]] = []
+        self._stopped = threading.Event()
+
+    def on(self, resource: str, callback: Callable[[Update], None]) -> None:
+        """Call `callback` with every update of `resource` during `run()`."""
+        if resource not in self._schedules:
+            raise ValueError(f"{resource!r} is not polled")
+        self._callbacks.setdefault(resource, []).append(callback)
+
+    def on_error(self, callback: Callable[[str, httpx.HTTPError], None]) -> None:
+        """Call `callback` with the resource and error of every failed poll.
+
+        Errors are reported while iterating as well as during `run()`.
+        Without any error callback, failed polls are only rescheduled.
+        """
+        self._error_callbacks.append(callback)
+
+    def poll(self, resource: str) -> Update | None:
+        """Poll `resource` now.
+
+        Returns:
+            Its update, or None if nothing changed.
+
+        Raises:
+            httpx.HTTPError: If the request failed. The resource is
+                rescheduled with back-off first.
+        """
+        module = getattr(self._client, resource)
+        try:
+            result = module.get() if resource == "war" else module.get_all()
+        except httpx.HTTPError:
+            self._failed(resource)
+            raise
+        return self._apply(resource, result)
+
+    def __iter__(self) -> Iterator[Update]:
+        self._stopped.clear()
+        while True:
+            resource, wait = self._next_due()
+            if self._stopped.wait(max(wait, 0.0)):
+                return
+            try:
+                update = self.poll(resource)
+            except httpx.HTTPError as e:
+                for callback in self._error_callbacks:
+                    callback(resource, e)
+                continue
+            if update is not None:
+                yield update
+
+    def run(self) -> None:
+        """Poll and dispatch updates to the registered callbacks until `stop()`."""
+        for update in self:
+            for callback in self._callbacks.get(update.resource, ()):
+                callback(update)
+
+    def stop(self) -> None:
+        """Stop iterating (or `run()`), from a callback or another thread."""
+        self._stopped.set()
+
+
+class AsyncPoller(_PollerBase):
+    """Polls resources of an `AsyncHelldiveAPIClient` and emits what changed.
+
+    The asyncio counterpart of `Poller`: iterate over it with `async for`, or
+    register callbacks (plain functions or coroutine functions) and await
+    `run()`. Failed polls are handled as by `Poller`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncHelldiveAPIClient,
+        intervals: Mapping[str, float] | None = None,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+    ) -> None:
+        """Create a new poller.
+
+        Args:
+            client: The client to poll with.
+            intervals: Base interval in seconds per resource to poll. Only the
+                resources listed are polled. Defaults to `DEFAULT_INTERVALS`.
+            min_interval: Shortest delay between two polls of one resource.
+            max_interval: Longest delay the back-off can reach.
+            backoff: Interval multiplier applied after a poll without changes.
+
+        Raises:
+            ValueError: If `intervals` names an unknown resource.
+        """
+        super().__init__(intervals, min_interval, max_interval, backoff)
+        self._client = client
+        self._callbacks: dict[
+            str, list[Callable[[Update], Awaitable[None] | None]]
+        ] = {}
+        self._error_callbacks: list[
+            Callable[[str, httpx.HTTPError], Awaitable[None] | None]
+        ] = []
+        self._stopped = asyncio.Event()
+
+    def on(
+        self, resource: str, callback: Callable[[Update], Awaitable[None] | None]
+    ) -> None:
+        """Call (and await, if needed) `callback` with every update during `run()`."""
+        if resource not in self._schedules:
+            raise ValueError(f"{resource!r} is not polled")
+        self._callbacks.setdefault(resource, []).append(callback)
+
+    def on_error(
+        self, callback: Callable[[str, httpx.HTTPError], Awaitable[None] | None]
+    ) -> None:
+        """Call (and await, if needed) `callback` with every failed poll."""
+        self._error_callbacks.append(callback)
+
+    async def poll(self, resource: str) -> Update | None:
+        """Poll `resource` now.
+
+        Returns:
+            Its update, or None if nothing changed.
+
+        Raises:
+            httpx.HTTPError: If the request failed. The resource is
+                rescheduled with back-off first.
+        """
+        module = getattr(self._client, resource)
+        try:
+            result = await (module.get() if resource == "war" else module.get_all())
+        except httpx.HTTPError:
+            self._failed(resource)
+            raise
+        return self._apply(resource, result)
+
+    async def __aiter__(self) -> AsyncIterator[Update]:
+        self._stopped.clear()
+        while True:
+            resource, wait = self._next_due()
+            if self._stopped.is_set():
+                return
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), wait)
+                except TimeoutError:
+                    pass
+                else:
+                    return
+            try:
+                update = await self.poll(resource)
+            except httpx.HTTPError as e:
+                for callback in self._error_callbacks:
+                    result = callback(resource, e)
+                    if inspect.isawaitable(result):
+                        await result
+                continue
+            if update is not None:
+                yield update
+
+    async def run(self) -> None:
+        """Poll and dispatch updates to the registered callbacks until `stop()`."""
+        async for update in self:
+            for callback in self._callbacks.get(update.resource, ()):
+                result = callback(update)
+                if inspect.isawaitable(result):
+                    await result
+
+    def stop(self) -> None:
+        """Stop iterating (or `run()`)."""
+        self._stopped.set()
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+
+class RateLimiter:
+    """Client-side token bucket enforced before every request.
+
+    Pass an instance to `HelldiveAPIClient(rate_limiter=...)`. One limiter can
+    be shared by several clients, sync and async alike, and by any number of
+    threads and coroutines: waiting callers reserve their slot up front, so
+    they are released one by one at the configured rate instead of all at once.
+
+    The bucket also follows the server's view of the quota. An
+    `X-RateLimit-Remaining` lower than the local token count (e.g. because other
+    processes share the same quota) drains the bucket to match, and a `429`
+    with `Retry-After` pauses every caller for that long.
+    """
+
+    def __init__(
+        self, requests: int = 5, per: float = 10.0, burst: int | None = None
+    ) -> None:
+        """Create a new rate limiter.
+
+        Args:
+            requests: Requests allowed per window. The default matches the
+                public API's limit of 5 requests per 10 seconds.
+            per: Window length in seconds.
+            burst: Maximum number of requests that may be sent back to back
+                after an idle period. Defaults to `requests`.
+        """
+        self.rate = requests / per
+        self.burst = burst if burst is not None else requests
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before sending."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block the calling thread until a request may be sent.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait, without blocking the event loop, until a request may be sent.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def update(self, response: httpx.Response) -> None:
+        """Adjust the bucket to the quota reported by the server."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        retry_after = (
+            response.headers.get("Retry-After") if response.status_code == 429 else None
+        )
+        with self._lock:
+            self._refill(time.monotonic())
+            if remaining is not None and remaining.isdigit():
+                self._tokens = min(self._tokens, float(remaining))
+            if retry_after is not None:
+                try:
+                    seconds = float(retry_after)
+                except ValueError:
+                    seconds = 1 / self.rate
+                # Going into debt makes every later reservation wait it out.
+                self._tokens = min(self._tokens, 1 - seconds * self.rate)
@@ -0,0 +1,176 @@
+"""TypedDicts describing the API's JSON payloads, as returned by the `*_raw()` APIs.
+
+Keys are the API's own camelCase names; values are plain JSON types (timestamps
+are ISO 8601 strings, enums are their raw values). Use the pydantic models in
+`helldivepy.models` when you need parsing and validation.
+"""
+
+from typing import TypedDict
+
+
+class RawStatistics(TypedDict):
+    missionsWon: int
+    missionsLost: int
+    missionTime: int
+    terminidKills: int
+    automatonKills: int
+    illuminateKills: int
+    bulletsFired: int
+    bulletsHit: int
+    timePlayed: int
+    deaths: int
+    revives: int
+    friendlies: int
+    missionSuccessRate: float
+    accuracy: float
+    playerCount: int
+
+
+class RawWar(TypedDict):
+    started: str
+    ended: str
+    now: str
+    clientVersion: str
+    factions: list[str]
+    impactMultiplier: float
+    statistics: RawStatistics
+
+
+class RawDispatch(TypedDict):
+    id: int
+    published: str
+    type: int
+    message: str
+
+
+class RawRegion(TypedDict):
+    id: int
+    hash: int
+    name: str | None
+    description: str | None
+    health: int | None
+    maxHealth: int
+    size: str
+    regenPerSecond: float | None
+    availabilityFactor: float | None
+    isAvailable: bool
+    players: int
+
+
+class RawBiome(TypedDict):
+    name: str
+    description: str
+
+
+class RawHazard(TypedDict):
+    name: str
+    description: str
+
+
+class RawPosition(TypedDict):
+    x: float
+    y: float
+
+
+class RawEvent(TypedDict):
+    id: int
+    eventType: int
+    faction: str
+    health: int
+    maxHealth: int
+    startTime: str
+    endTime: str
+    campaignId: int
+    jointOperationIds: list[int]
+
+
+class RawPlanet(TypedDict):
+    index: int
+    name: str
+    sector: str
+    biome: RawBiome
+    hazards: list[RawHazard]
+    hash: int
+    position: RawPosition
+    waypoints: list[int]
+    maxHealth: int
+    health: int
+    disabled: bool
+    initialOwner: str
+    currentOwner: str
+    regenPerSecond: float
+    event: RawEvent | None
+    statistics: RawStatistics
+    attacking: list[int]
+    regions: list[RawRegion]
+
+
+class RawCampaign(TypedDict):
+    id: int
+    planet: RawPlanet
+    type: int
+    count: int
+    faction: str
+
+
+class RawTask(TypedDict):
+    type: int
+    values: list[int]
+    valueTypes: list[int]
+
+
+class RawReward(TypedDict):
+    type: int
+    amount: int
+
+
+class RawAssignment(TypedDict):
+    id: int
+    progress: list[int]
+    title: str
+    briefing: str
+    description: str | None
+    tasks: list[RawTask]
+    reward: RawReward | None
+    rewards: list[RawReward]
+    expiration: str
+    flags: int
+
+
+class RawCost(TypedDict):
+    id: str
+    itemMixId: int
+    targetValue: int
+    currentValue: float
+    deltaPerSecond: float
+    maxDonationAmmount: int
+    maxDonationPeriodSeconds: int
+
+
+class RawTacticalAction(TypedDict):
+    id32: int
+    mediaId32: int
+    name: str
+    description: str
+    strategicDescription: str
+    status: int
+    statusExpire: str
+    costs: list[RawCost]
+    effectIds: list[int]
+
+
+class RawSpaceStation(TypedDict):
+    id32: int
+    planet: RawPlanet
+    electionEnd: str
+    flags: int
+    tacticalActions: list[RawTacticalAction]
+
+
+class RawSteamNews(TypedDict):
+    id: str
+    title: str
+    url: str
+    author: str
+    content: str
+    publishedAt: str
@@ -0,0 +1,92 @@
+import random
+import time
+from collections.abc import Collection
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+"""Status codes retried by default: rate limiting and transient server errors."""
+
+
+def _header_delay(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait, from `Retry-After`/`X-RateLimit-*`."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            when: datetime = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return max(0.0, when.timestamp() - time.time())
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = response.headers.get("X-RateLimit-Reset")
+        try:
+            value = float(reset) if reset is not None else None
+        except ValueError:
+            value = None
+        if value is not None:
+            # Large values are epoch timestamps, small ones are seconds to wait.
+            return max(0.0, value - time.time() if value > 1e9 else value)
+    return None
+
+
+class RetryPolicy:
+    """Retry failed requests with capped exponential backoff and full jitter.
+
+    Pass an instance to `HelldiveAPIClient(retry=...)` to apply it to every
+    module. Rate-limited (`429`) and transient server errors are retried, as are
+    network errors. When the API says how long to wait (`Retry-After`, or
+    `X-RateLimit-Reset` once `X-RateLimit-Remaining` hits zero) that wait is
+    used if it is longer than the backoff.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        retry_statuses: Collection[int] = RETRY_STATUSES,
+        retry_network_errors: bool = True,
+    ) -> None:
+        """Create a new retry policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first one.
+            backoff_base: Backoff ceiling in seconds for the first retry; it
+                doubles with every further attempt.
+            backoff_cap: Upper bound in seconds for the backoff ceiling.
+            retry_statuses: HTTP status codes that trigger a retry.
+            retry_network_errors: Whether to retry `httpx.TransportError`s such as
+                timeouts and dropped connections.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_network_errors = retry_network_errors
+
+    def should_retry(
+        self,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """Whether attempt number `attempt` (1-based) should be followed by another."""
+        if attempt >= self.max_attempts:
+            return False
+        if error is not None:
+            return self.retry_network_errors and isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait after attempt number `attempt` (1-based) failed."""
+        ceiling = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        backoff = random.uniform(0, ceiling)
+        requested = _header_delay(response) if response is not None else None
+        return backoff if requested is None else max(backoff, requested)
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import os
+import sys
+import threading
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Hashable
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _lock_file(file: IO[bytes]) -> None:
+    if sys.platform == "win32":
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock_file(file: IO[bytes]) -> None:
+    if sys.platform == "win32":
+        import msvcrt
+
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces identical concurrent requests into one HTTP call.
+
+    Pass an instance to `HelldiveAPIClient(single_flight=...)` (it can be
+    shared between clients, sync and async). While a request for a URL is in
+    flight, other threads or coroutines asking for the same URL wait for it and
+    get its result, instead of sending their own.
+
+    With `lock_dir`, refreshes of a cached response are also serialized across
+    processes by a lock file per URL. Combined with a shared `SQLiteCache`,
+    exactly one process fetches an expired response; the others wait for the
+    lock and then read the fresh entry it wrote to the cache.
+    """
+
+    def __init__(self, lock_dir: str | os.PathLike[str] | None = None) -> None:
+        """Create a new request coalescer.
+
+        Args:
+            lock_dir: Directory for the cross-process lock files, shared by
+                every process that should coalesce. None (the default) only
+                coalesces within this process.
+        """
+        self.lock_dir = Path(lock_dir) if lock_dir is not None else None
+        if self.lock_dir is not None:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._async_calls: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], _AsyncCall
+        ] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run `fn`, unless a call with the same `key` is already in flight.
+
+        Returns:
+            The result of `fn`, or of the in-flight call it joined.
+
+        Raises:
+            Exception: Whatever `fn` (or the joined call) raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn()`, unless a call with the same `key` is already in flight.
+
+        Calls are only coalesced within one event loop. `fn()` runs in its own
+        task, so cancelling one caller doesn't affect the others; the call
+        itself is only cancelled once every caller waiting for it is.
+
+        Returns:
+            The result of `fn()`, or of the in-flight call it joined.
+        """
+        loop = asyncio.get_running_loop()
+        slot = (loop, key)
+        call = self._async_calls.get(slot)
+        if call is None or call.task.done():
+            call = self._async_calls[slot] = _AsyncCall(asyncio.ensure_future(fn()))
+
+            def forget(_: "asyncio.Future[Any]") -> None:
+                if self._async_calls.get(slot) is call:
+                    del self._async_calls[slot]
+
+            call.task.add_done_callback(forget)
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # Free the slot right away: the task only finishes cancelling
+                # later, and a new caller must not join it in the meantime.
+                if self._async_calls.get(slot) is call:
+                    del self._async_calls[slot]
+                call.task.cancel()
+
+    def _lock_path(self, key: Hashable) -> Path | None:
+        if self.lock_dir is None:
+            return None
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()[:32]
+        return self.lock_dir / f"{digest}.lock"
+
+    @contextmanager
+    def lock(self, key: Hashable) -> Generator[None]:
+        """Hold the cross-process lock for `key` (a no-op without `lock_dir`)."""
+        path = self._lock_path(key)
+        if path is None:
+            yield
+            return
+        with open(path, "a+b") as file:
+            _lock_file(file)
+            try:
+                yield
+            finally:
+                _unlock_file(file)
+
+    @asynccontextmanager
+    async def lock_async(self, key: Hashable) -> AsyncGenerator[None]:
+        """Like `lock()`, waiting for the lock in a worker thread."""
+        path = self._lock_path(key)
+        if path is None:
+            yield
+            return
+        with open(path, "a+b") as file:
+            await asyncio.to_thread(_lock_file, file)
+            try:
+                yield
+            finally:
+                _unlock_file(file)
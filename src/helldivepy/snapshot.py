@@ -0,0 +1,68 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from helldivepy.models import Assignment, Campaign, Planet, SpaceStation, War
+
+
+@dataclass(frozen=True, slots=True)
+class GalaxySnapshot:
+    """The whole galaxy at one point in time, as returned by `client.snapshot()`.
+
+    Planets are shared: the `Planet` embedded in each campaign and space station
+    is the same instance as the one in `planets`.
+    """
+
+    timestamp: datetime
+    """Server time of the snapshot (`War.now`)."""
+    war: War
+    planets: tuple[Planet, ...]
+    campaigns: tuple[Campaign, ...]
+    assignments: tuple[Assignment, ...]
+    space_stations: tuple[SpaceStation, ...]
+    _by_index: dict[int, Planet] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_by_index", {p.index: p for p in self.planets})
+
+    def planet(self, index: int) -> Planet | None:
+        """Look up a planet by its ArrowHead index.
+
+        Args:
+            index: The planet's ArrowHead index.
+
+        Returns:
+            The matching Planet, or None if it is not part of the snapshot.
+        """
+        return self._by_index.get(index)
+
+    @classmethod
+    def build(
+        cls,
+        war: War,
+        planets: Iterable[Planet],
+        campaigns: Iterable[Campaign],
+        assignments: Iterable[Assignment],
+        space_stations: Iterable[SpaceStation],
+    ) -> "GalaxySnapshot":
+        """Assemble a snapshot, pointing embedded planets at the planet list.
+
+        Campaigns and space stations are shallow-copied rather than mutated, so
+        module results (which may be shared through a cache) are left untouched.
+        """
+        planets = tuple(planets)
+        by_index = {p.index: p for p in planets}
+        return cls(
+            timestamp=war.now,
+            war=war,
+            planets=planets,
+            campaigns=tuple(
+                c.model_copy(update={"planet": by_index.get(c.planet.index, c.planet)})
+                for c in campaigns
+            ),
+            assignments=tuple(assignments),
+            space_stations=tuple(
+                s.model_copy(update={"planet": by_index.get(s.planet.index, s.planet)})
+                for s in space_stations
+            ),
+        )
@@ -0,0 +1,209 @@
+"""Uniform-grid spatial index over planet map positions."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from array import array
+from collections.abc import Iterable
+
+from helldivepy.models import PlanetLike
+
+
+class SpatialIndex:
+    """Nearest-neighbour, radius and bounding-box queries over planet positions.
+
+    Planets are bucketed into a uniform grid of square cells. A query only
+    visits the cells it overlaps (or, for `nearest()`, rings of cells around
+    the query point until no closer planet can remain), so it costs about the
+    size of its result instead of a scan over the whole galaxy.
+
+    Positions barely move between snapshots: `update()` only re-buckets the
+    planets whose position actually changed.
+    """
+
+    def __init__(
+        self, planets: Iterable[PlanetLike] = (), cell_size: float | None = None
+    ) -> None:
+        """Create an index from a planet list.
+
+        Args:
+            planets: The planets, e.g. the output of `planets.get_all()`.
+            cell_size: Side of a grid cell in map units. Defaults to a size
+                that puts about two planets in each cell of the initial
+                planets' bounding box.
+        """
+        planets = list(planets)
+        if cell_size is None:
+            cell_size = self._default_cell_size(planets)
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._indices = array("q")
+        self._xs = array("d")
+        self._ys = array("d")
+        self._rows: dict[int, int] = {}
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        # Range of cell coordinates ever occupied, which bounds nearest().
+        self._low = self._high = (0, 0)
+        self.update(planets)
+
+    @staticmethod
+    def _default_cell_size(planets: list[PlanetLike]) -> float:
+        if len(planets) < 2:
+            return 1.0
+        xs = [p.position.x for p in planets]
+        ys = [p.position.y for p in planets]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys))
+        cells_per_side = math.ceil(math.sqrt(len(planets) / 2))
+        return extent / cells_per_side if extent > 0 else 1.0
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __contains__(self, index: object) -> bool:
+        return index in self._rows
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def update(self, planets: Iterable[PlanetLike]) -> bool:
+        """Apply a new planet list to the index.
+
+        Planets not seen before are added and moved planets are re-bucketed.
+        Planets missing from `planets` keep their previous position.
+
+        Args:
+            planets: The planets, e.g. the planets of a new snapshot.
+
+        Returns:
+            True if any planet was added or moved.
+        """
+        changed = False
+        for planet in planets:
+            x, y = planet.position.x, planet.position.y
+            row = self._rows.get(planet.index)
+            if row is None:
+                row = self._rows[planet.index] = len(self._indices)
+                self._indices.append(planet.index)
+                self._xs.append(x)
+                self._ys.append(y)
+            elif self._xs[row] == x and self._ys[row] == y:
+                continue
+            else:
+                old = self._cell(self._xs[row], self._ys[row])
+                self._cells[old].remove(row)
+                if not self._cells[old]:
+                    del self._cells[old]
+                self._xs[row], self._ys[row] = x, y
+            cell = self._cell(x, y)
+            if not self._cells:
+                self._low = self._high = cell
+            self._low = (min(self._low[0], cell[0]), min(self._low[1], cell[1]))
+            self._high = (max(self._high[0], cell[0]), max(self._high[1], cell[1]))
+            self._cells.setdefault(cell, []).append(row)
+            changed = True
+        return changed
+
+    def position(self, index: int) -> tuple[float, float]:
+        """Indexed `(x, y)` position of the planet with index `index`."""
+        row = self._rows[index]
+        return self._xs[row], self._ys[row]
+
+    def _rows_in_cells(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> Iterable[int]:
+        (low_x, low_y), (high_x, high_y) = (
+            self._cell(min_x, min_y),
+            self._cell(max_x, max_y),
+        )
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > len(self._cells):
+            # Larger than the occupied grid: cheaper to walk the occupied cells.
+            for (cx, cy), rows in self._cells.items():
+                if low_x <= cx <= high_x and low_y <= cy <= high_y:
+                    yield from rows
+            return
+        for cx in range(low_x, high_x + 1):
+            for cy in range(low_y, high_y + 1):
+                yield from self._cells.get((cx, cy), ())
+
+    def within_box(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> list[int]:
+        """Planets inside an axis-aligned box, borders included.
+
+        Returns:
+            Planet indices, sorted.
+        """
+        xs, ys = self._xs, self._ys
+        return sorted(
+            self._indices[row]
+            for row in self._rows_in_cells(min_x, min_y, max_x, max_y)
+            if min_x <= xs[row] <= max_x and min_y <= ys[row] <= max_y
+        )
+
+    def within_radius(self, x: float, y: float, radius: float) -> list[int]:
+        """Planets at most `radius` away from `(x, y)`.
+
+        Returns:
+            Planet indices, nearest first.
+        """
+        xs, ys = self._xs, self._ys
+        limit = radius * radius
+        found: list[tuple[float, int]] = []
+        for row in self._rows_in_cells(x - radius, y - radius, x + radius, y + radius):
+            distance = (xs[row] - x) ** 2 + (ys[row] - y) ** 2
+            if distance <= limit:
+                found.append((distance, self._indices[row]))
+        found.sort()
+        return [index for _, index in found]
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[int]:
+        """The `k` planets closest to `(x, y)`.
+
+        Returns:
+            Up to `k` planet indices, nearest first.
+        """
+        if k <= 0 or not self._cells:
+            return []
+        xs, ys, indices = self._xs, self._ys, self._indices
+        cx, cy = self._cell(x, y)
+        # Rings before the first one reaching the occupied range, and beyond
+        # the last one, hold no planets at all.
+        (low_x, low_y), (high_x, high_y) = self._low, self._high
+        first_ring = max(low_x - cx, cx - high_x, low_y - cy, cy - high_y, 0)
+        last_ring = max(cx - low_x, high_x - cx, cy - low_y, high_y - cy, 0)
+        best: list[tuple[float, int]] = []  # Max-heap of the k best, negated.
+        for ring in range(first_ring, last_ring + 1):
+            # Every cell of this ring is at least (ring - 1) cells away.
+            if len(best) == k:
+                bound = max(ring - 1, 0) * self.cell_size
+                if bound * bound > -best[0][0]:
+                    break
+            for cell in self._ring(cx, cy, ring):
+                for row in self._cells.get(cell, ()):
+                    distance = (xs[row] - x) ** 2 + (ys[row] - y) ** 2
+                    item = (-distance, -indices[row])
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+        return [-index for _, index in sorted(best, reverse=True)]
+
+    def _ring(self, cx: int, cy: int, ring: int) -> Iterable[tuple[int, int]]:
+        # The cells of the ring inside the occupied range, so that a query far
+        # from every planet doesn't walk rings of empty cells.
+        (low_x, low_y), (high_x, high_y) = self._low, self._high
+        if ring == 0:
+            yield cx, cy
+            return
+        xs = range(max(cx - ring, low_x), min(cx + ring, high_x) + 1)
+        for y in (cy - ring, cy + ring):
+            if low_y <= y <= high_y:
+                for x in xs:
+                    yield x, y
+        ys = range(max(cy - ring + 1, low_y), min(cy + ring - 1, high_y) + 1)
+        for x in (cx - ring, cx + ring):
+            if low_x <= x <= high_x:
+                for y in ys:
+                    yield x, y
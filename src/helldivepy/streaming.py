@@ -0,0 +1,64 @@
+import codecs
+import json
+import re
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayDecoder:
+    """Incrementally decode the elements of a top-level JSON array.
+
+    Feed it the response body chunk by chunk; every call returns the elements
+    completed so far. Only the current, unfinished element is buffered, so
+    memory stays flat no matter how long the array is. Elements are expected to
+    be objects or arrays, as in every list endpoint of the API.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._started = False
+        self._after_item = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Consume `chunk` and return every element it completed."""
+        text = self._text + self._utf8.decode(chunk)
+        pos = 0
+        items: list[Any] = []
+        while not self._done:
+            pos = _WHITESPACE.match(text, pos).end()  # type: ignore[union-attr]
+            if pos >= len(text):
+                break
+            char = text[pos]
+            if not self._started:
+                if char != "[":
+                    raise ValueError(f"Expected a JSON array, got {char!r}")
+                self._started = True
+                pos += 1
+            elif char == "]":
+                self._done = True
+                pos += 1
+            elif char == "," and self._after_item:
+                self._after_item = False
+                pos += 1
+            else:
+                try:
+                    item, pos = self._decoder.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    break  # The element continues in the next chunk.
+                items.append(item)
+                self._after_item = True
+        self._text = text[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array was received.
+
+        Raises:
+            ValueError: If the body ended before the closing bracket.
+        """
+        if not self._done:
+            raise ValueError("Truncated JSON array")
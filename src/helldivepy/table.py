@@ -0,0 +1,232 @@
+"""Column-oriented view of the galaxy's planets, for analytics."""
+
+from __future__ import annotations
+
+import heapq
+import json
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Self
+
+from helldivepy.enums import Factions
+from helldivepy.models import PlanetLike
+from helldivepy.raw import RawPlanet
+
+FACTIONS: tuple[Factions, ...] = tuple(Factions)
+"""Faction for each owner code stored in `PlanetTable.owner`."""
+_CODES = {faction: code for code, faction in enumerate(FACTIONS)}
+_RAW_CODES = {faction.value: code for faction, code in _CODES.items()}
+# NumPy is only imported once a helper needs it, not with the package.
+_HAS_NUMPY = find_spec("numpy") is not None
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+def _liberation(health: int, max_health: int) -> float:
+    return 100.0 * (1 - health / max_health) if max_health else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetTable:
+    """Planets stored as one contiguous typed array per field.
+
+    Row `i` of every column describes the same planet. Owners are stored as
+    small integer codes; `FACTIONS[code]` gives the faction back. The helpers
+    run over the columns instead of walking model objects: vectorized with
+    NumPy when it is installed (`pip install helldivepy[numpy]`), with
+    builtins otherwise. `to_numpy()` exposes the columns to NumPy without
+    copying.
+    """
+
+    index: array[int]
+    """ArrowHead planet indices."""
+    health: array[int]
+    max_health: array[int]
+    regen_per_second: array[float]
+    x: array[float]
+    """Map x coordinates."""
+    y: array[float]
+    """Map y coordinates."""
+    owner: array[int]
+    """Current owner faction codes, see `FACTIONS`."""
+    initial_owner: array[int]
+    """Initial owner faction codes, see `FACTIONS`."""
+    players: array[int]
+    """Current player counts."""
+    disabled: array[int]
+    """1 for inactive planets, 0 otherwise."""
+    _rows: dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        rows = {index: row for row, index in enumerate(self.index)}
+        object.__setattr__(self, "_rows", rows)
+
+    @staticmethod
+    def _columns() -> dict[str, array[Any]]:
+        return {
+            "index": array("q"),
+            "health": array("q"),
+            "max_health": array("q"),
+            "regen_per_second": array("d"),
+            "x": array("d"),
+            "y": array("d"),
+            "owner": array("b"),
+            "initial_owner": array("b"),
+            "players": array("q"),
+            "disabled": array("b"),
+        }
+
+    @classmethod
+    def from_planets(cls, planets: Iterable[PlanetLike]) -> Self:
+        """Build a table from `Planet` (or `LazyPlanet`) instances.
+
+        Args:
+            planets: The planets, e.g. the output of `planets.get_all()`.
+        """
+        columns = cls._columns()
+        for planet in planets:
+            columns["index"].append(planet.index)
+            columns["health"].append(planet.health)
+            columns["max_health"].append(planet.max_health)
+            columns["regen_per_second"].append(planet.regen_per_second)
+            columns["x"].append(planet.position.x)
+            columns["y"].append(planet.position.y)
+            columns["owner"].append(_CODES[planet.current_owner])
+            columns["initial_owner"].append(_CODES[planet.initial_owner])
+            columns["players"].append(planet.statistics.player_count)
+            columns["disabled"].append(planet.disabled)
+        return cls(**columns)
+
+    @classmethod
+    def from_raw(cls, planets: Iterable[RawPlanet]) -> Self:
+        """Build a table straight from decoded JSON, without building models.
+
+        Args:
+            planets: Raw planet payloads, e.g. the output of
+                `planets.get_all_raw()`.
+        """
+        columns = cls._columns()
+        for planet in planets:
+            columns["index"].append(planet["index"])
+            columns["health"].append(planet["health"])
+            columns["max_health"].append(planet["maxHealth"])
+            columns["regen_per_second"].append(planet["regenPerSecond"])
+            columns["x"].append(planet["position"]["x"])
+            columns["y"].append(planet["position"]["y"])
+            columns["owner"].append(_RAW_CODES[planet["currentOwner"]])
+            columns["initial_owner"].append(_RAW_CODES[planet["initialOwner"]])
+            columns["players"].append(planet["statistics"]["playerCount"])
+            columns["disabled"].append(planet["disabled"])
+        return cls(**columns)
+
+    @classmethod
+    def from_json(cls, body: bytes | str) -> Self:
+        """Build a table from a `/v1/planets` response body.
+
+        Args:
+            body: The JSON body, e.g. the output of `planets.get_all_bytes()`.
+        """
+        return cls.from_raw(json.loads(body))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def row(self, index: int) -> int | None:
+        """Row number of the planet with ArrowHead index `index`, if present."""
+        return self._rows.get(index)
+
+    def liberation(self) -> array[float]:
+        """Liberation percentage of every planet, from 0 to 100."""
+        if not _HAS_NUMPY:
+            return array("d", map(_liberation, self.health, self.max_health))
+        import numpy as np
+
+        health, max_health = self._view("health"), self._view("max_health")
+        # Planets without max health keep a ratio of 1, i.e. 0% liberated.
+        ratio = np.ones(len(self))
+        np.divide(health, max_health, out=ratio, where=max_health != 0)
+        return array("d", (100.0 * (1 - ratio)).tobytes())
+
+    def owned_by(self, faction: Factions) -> list[int]:
+        """Row numbers of the planets currently owned by `faction`."""
+        code = _CODES[faction]
+        if not _HAS_NUMPY:
+            return [row for row, owner in enumerate(self.owner) if owner == code]
+        import numpy as np
+
+        return np.flatnonzero(self._view("owner") == code).tolist()
+
+    def sum_by_faction(self, column: str = "players") -> dict[Factions, float]:
+        """Sum a numeric column per current owner.
+
+        Args:
+            column: Name of the column to sum, e.g. `"players"` or
+                `"regen_per_second"`.
+
+        Returns:
+            The total for each faction, including factions owning no planet.
+        """
+        values = self._column(column)
+        if not _HAS_NUMPY:
+            totals = [0] * len(FACTIONS)
+            for owner, value in zip(self.owner, values, strict=True):
+                totals[owner] += value
+            return dict(zip(FACTIONS, totals, strict=True))
+        import numpy as np
+
+        dtype = np.float64 if values.typecode == "d" else np.int64
+        sums = np.zeros(len(FACTIONS), dtype=dtype)
+        np.add.at(sums, self._view("owner"), self._view(column))
+        return dict(zip(FACTIONS, sums.tolist(), strict=True))
+
+    def top(self, n: int, by: str = "players") -> list[int]:
+        """Row numbers of the `n` planets with the largest values in a column.
+
+        Args:
+            n: Number of rows to return.
+            by: Name of the column to rank by.
+
+        Returns:
+            Row numbers, largest value first; ties keep row order.
+        """
+        column = self._column(by)
+        if not _HAS_NUMPY:
+            return heapq.nlargest(n, range(len(column)), key=column.__getitem__)
+        import numpy as np
+
+        # A stable ascending sort of the reversed column, read backwards, is
+        # descending with ties still in row order.
+        rows = np.argsort(self._view(by)[::-1], kind="stable")[::-1][: max(n, 0)]
+        return (len(column) - 1 - rows).tolist()
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Expose every column as a NumPy array sharing the table's memory.
+
+        Requires NumPy (`pip install helldivepy[numpy]`).
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "PlanetTable.to_numpy() requires NumPy: pip install helldivepy[numpy]"
+            )
+        return {f.name: self._view(f.name) for f in fields(self) if f.init}
+
+    def _column(self, name: str) -> array[Any]:
+        if name not in _COLUMNS:
+            raise ValueError(f"Unknown column: {name!r}")
+        return getattr(self, name)
+
+    def _view(self, name: str) -> npt.NDArray[Any]:
+        # A zero-copy NumPy array over a column.
+        import numpy as np
+
+        column = self._column(name)
+        return np.frombuffer(column, dtype=column.typecode)
+
+
+_COLUMNS = frozenset(f.name for f in fields(PlanetTable) if f.init)
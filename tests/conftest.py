@@ -1,7 +1,16 @@
 import copy
+import json
+import platform
+import sys
+from collections.abc import Callable
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, cast
 
 import pytest
 
+from helldivepy.models import Assignment, Planet, War
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -10,16 +19,99 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Run tests that make real HTTP calls to the Helldivers 2 API.",
     )
+    parser.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Run benchmarks on galaxy-sized synthetic payloads.",
+    )
+    parser.addoption(
+        "--bench-json",
+        metavar="PATH",
+        default=None,
+        help="Write benchmark results to PATH as JSON.",
+    )
+    parser.addoption(
+        "--bench-baseline",
+        metavar="PATH",
+        default=None,
+        help="Fail benchmarks that got slower than in this --bench-json file.",
+    )
+    parser.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="Slowdown allowed against --bench-baseline (default: 0.25, i.e. 25%%).",
+    )
 
 
 def pytest_collection_modifyitems(
     config: pytest.Config, items: list[pytest.Item]
 ) -> None:
-    if not config.getoption("--live"):
-        skip = pytest.mark.skip(reason="Pass --live to run live API tests.")
-        for item in items:
-            if item.get_closest_marker("live"):
-                item.add_marker(skip)
+    for marker, option in (("live", "--live"), ("bench", "--bench")):
+        if not config.getoption(option):
+            skip = pytest.mark.skip(reason=f"Pass {option} to run {marker} tests.")
+            for item in items:
+                if item.get_closest_marker(marker):
+                    item.add_marker(skip)
+
+
+_BENCH_RESULTS = pytest.StashKey[list[dict[str, Any]]]()
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> Callable[..., None]:
+    """Record a benchmark result: `bench(name, seconds, **metrics)`.
+
+    `seconds` is compared against `--bench-baseline`; other metrics (sizes,
+    counts, peak memory) are only reported.
+    """
+    config = request.config
+    results = config.stash.setdefault(_BENCH_RESULTS, [])
+    baseline: dict[str, float] = {}
+    if path := config.getoption("--bench-baseline"):
+        baseline = {
+            result["name"]: result["seconds"]
+            for result in json.loads(Path(path).read_text())["results"]
+        }
+    tolerance = cast(float, config.getoption("--bench-tolerance"))
+    # `FixtureRequest.node` is unannotated; function-scoped requests get the item.
+    item = cast(pytest.Item, request.node)  # pyright: ignore[reportUnknownMemberType]
+    test = item.nodeid
+
+    def record(name: str, seconds: float, **metrics: float) -> None:
+        results.append(
+            {
+                "name": name,
+                "test": test,
+                "seconds": seconds,
+                "metrics": metrics,
+            }
+        )
+        previous = baseline.get(name)
+        if previous is not None and seconds > previous * (1 + tolerance):
+            pytest.fail(
+                f"{name}: {seconds * 1e3:.3f} ms, "
+                f"{seconds / previous - 1:+.0%} against the baseline's "
+                f"{previous * 1e3:.3f} ms"
+            )
+
+    return record
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    path = session.config.getoption("--bench-json")
+    no_results: list[dict[str, Any]] = []
+    results = session.config.stash.get(_BENCH_RESULTS, no_results)
+    if path and results:
+        report = {
+            "helldivepy": version("helldivepy"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        Path(path).write_text(json.dumps(report, indent=2) + "\n")
 
 
 STATISTICS = {
@@ -293,3 +385,61 @@ def raw_spacestation() -> dict:  # type: ignore[type-arg]
 @pytest.fixture
 def raw_steam_news() -> dict:  # type: ignore[type-arg]
     return copy.deepcopy(STEAM_NEWS)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Replace `time.sleep` and `asyncio.sleep`, recording the requested delays."""
+    recorded: list[float] = []
+
+    async def fake_async_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr("time.sleep", recorded.append)
+    monkeypatch.setattr("asyncio.sleep", fake_async_sleep)
+    return recorded
+
+
+@pytest.fixture
+def make_planet() -> Callable[..., Planet]:
+    """Build a `Planet` from `PLANET`: `make_planet(index=1, health=10)`.
+
+    Keyword arguments replace fields by their JSON name; `statistics` is
+    merged into the planet's statistics instead of replacing them.
+    """
+
+    def make(**changes: Any) -> Planet:
+        raw: dict[str, Any] = copy.deepcopy(PLANET)
+        statistics: dict[str, Any] = changes.pop("statistics", {})
+        raw.update(changes, statistics={**raw["statistics"], **statistics})
+        return Planet.model_validate(raw)
+
+    return make
+
+
+@pytest.fixture
+def make_assignment() -> Callable[..., Assignment]:
+    """Build an `Assignment` from `ASSIGNMENT` with some fields replaced."""
+
+    def make(**changes: Any) -> Assignment:
+        # Task validation rewrites its input, so never validate the constant.
+        return Assignment.model_validate({**copy.deepcopy(ASSIGNMENT), **changes})
+
+    return make
+
+
+@pytest.fixture
+def make_war() -> Callable[..., War]:
+    """Build a `War` from `WAR`: `make_war(now=datetime(...))`.
+
+    Keyword arguments replace fields by their JSON name; `statistics` is
+    merged into the war's statistics instead of replacing them.
+    """
+
+    def make(**changes: Any) -> War:
+        raw: dict[str, Any] = copy.deepcopy(WAR)
+        statistics: dict[str, Any] = changes.pop("statistics", {})
+        raw.update(changes, statistics={**raw["statistics"], **statistics})
+        return War.model_validate(raw)
+
+    return make
@@ -0,0 +1,399 @@
+"""Benchmarks on galaxy-sized synthetic payloads.
+
+Run with: uv run pytest --bench -s
+Each benchmark prints the best-of-N time per call and records it through the
+`bench` fixture. Add `--bench-json results.json` to save the results, and
+`--bench-baseline results.json` on a later run to fail every benchmark that
+got more than `--bench-tolerance` (25% by default) slower.
+"""
+
+import copy
+import json
+import pickle
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import BaseModel, TypeAdapter
+
+from helldivepy.client import HelldiveAPIClient
+from helldivepy.diff import Change, diff_planets
+from helldivepy.enums import Factions
+from helldivepy.history import History
+from helldivepy.hooks import Instrumentation
+from helldivepy.models import (
+    Assignment,
+    Campaign,
+    Dispatch,
+    Event,
+    Planet,
+    Region,
+    SpaceStation,
+    Statistics,
+    SteamNews,
+    War,
+)
+from helldivepy.spatial import SpatialIndex
+from helldivepy.table import PlanetTable
+
+PLANET_COUNT = 260
+REGIONS_PER_PLANET = 8
+CAMPAIGN_COUNT = 60
+DISPATCH_COUNT = 5000
+STEAM_NEWS_COUNT = 1000
+
+
+@pytest.fixture
+def galaxy_planets(
+    raw_planet: dict[str, Any], raw_region: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Synthetic /v1/planets payload of `PLANET_COUNT` planets."""
+    planets: list[dict[str, Any]] = []
+    for index in range(PLANET_COUNT):
+        planet = copy.deepcopy(raw_planet)
+        planet["index"] = index
+        planet["waypoints"] = [(index + 1) % PLANET_COUNT, (index + 7) % PLANET_COUNT]
+        planet["regions"] = [{**raw_region, "id": i} for i in range(REGIONS_PER_PLANET)]
+        planets.append(planet)
+    return planets
+
+
+@pytest.fixture
+def galaxy_payloads(
+    galaxy_planets: list[dict[str, Any]],
+    raw_war: dict[str, Any],
+    raw_campaign: dict[str, Any],
+    raw_assignment: dict[str, Any],
+    raw_dispatch: dict[str, Any],
+    raw_steam_news: dict[str, Any],
+    raw_spacestation: dict[str, Any],
+) -> dict[str, Any]:
+    """Synthetic body of every list endpoint, keyed by URL path."""
+    return {
+        "/api/v1/war": raw_war,
+        "/api/v1/planets": galaxy_planets,
+        "/api/v1/campaigns": [
+            {**raw_campaign, "id": i, "planet": galaxy_planets[i]}
+            for i in range(CAMPAIGN_COUNT)
+        ],
+        "/api/v1/assignments": [{**raw_assignment, "id": i} for i in range(3)],
+        "/api/v2/dispatches": [
+            {**raw_dispatch, "id": i} for i in range(DISPATCH_COUNT, 0, -1)
+        ],
+        "/api/v1/steam": [
+            {**raw_steam_news, "id": str(i)} for i in range(STEAM_NEWS_COUNT)
+        ],
+        "/api/v2/space-stations": [raw_spacestation],
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5, number: int = 3) -> float:
+    """Best wall time of a single `fn()` call, in seconds."""
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+@pytest.mark.bench
+def test_list_validation_typeadapter_vs_loop(
+    bench: Callable[..., None], galaxy_planets: list[dict[str, Any]]
+) -> None:
+    body = json.dumps(galaxy_planets).encode()
+    adapter = TypeAdapter(list[Planet])
+
+    def before() -> list[Planet]:
+        return [Planet.model_validate(p) for p in json.loads(body)]
+
+    def after() -> list[Planet]:
+        return adapter.validate_json(body)
+
+    assert before() == after()
+    loop, native = best_of(before), best_of(after)
+    print(
+        f"\n{PLANET_COUNT} planets ({len(body) / 1024:.0f} KiB): "
+        f"json.loads + model_validate loop {loop * 1e3:.1f} ms, "
+        f"TypeAdapter.validate_json {native * 1e3:.1f} ms ({loop / native:.2f}x)"
+    )
+    bench("planets.validate_json", native, loop_seconds=loop)
+
+
+@pytest.mark.bench
+def test_faction_players_table_vs_models(
+    bench: Callable[..., None], galaxy_planets: list[dict[str, Any]]
+) -> None:
+    planets = TypeAdapter(list[Planet]).validate_python(galaxy_planets)
+    table = PlanetTable.from_planets(planets)
+
+    def before() -> dict[Factions, int]:
+        totals = dict.fromkeys(Factions, 0)
+        for planet in planets:
+            totals[planet.current_owner] += planet.statistics.player_count
+        return totals
+
+    def after() -> dict[Factions, float]:
+        return table.sum_by_faction("players")
+
+    assert before() == after()
+    loop, columnar = best_of(before), best_of(after)
+    print(
+        f"\n{PLANET_COUNT} planets: players per faction over models "
+        f"{loop * 1e6:.0f} us, PlanetTable {columnar * 1e6:.0f} us "
+        f"({loop / columnar:.2f}x)"
+    )
+    bench("table.sum_by_faction", columnar, loop_seconds=loop)
+
+
+@pytest.mark.bench
+def test_diff_unchanged_planets(
+    bench: Callable[..., None], galaxy_planets: list[dict[str, Any]]
+) -> None:
+    body = json.dumps(galaxy_planets).encode()
+    adapter = TypeAdapter(list[Planet])
+    # Two polls: equal planets, but fresh instances every time.
+    old, new = adapter.validate_json(body), adapter.validate_json(body)
+
+    def before() -> int:
+        return sum(a != b for a, b in zip(old, new, strict=True))
+
+    def after() -> list[Change]:
+        return diff_planets(old, new)
+
+    assert before() == 0
+    assert after() == []
+    compare, diff = best_of(before), best_of(after)
+    validate = best_of(lambda: adapter.validate_json(body))
+    print(
+        f"\n{PLANET_COUNT} unchanged planets: model comparison "
+        f"{compare * 1e3:.2f} ms, diff_planets {diff * 1e3:.2f} ms "
+        f"({compare / diff:.2f}x), validation {validate * 1e3:.1f} ms"
+    )
+    bench("diff.planets", diff, compare_seconds=compare)
+
+
+@pytest.mark.bench
+def test_nearest_spatial_index_vs_scan(
+    bench: Callable[..., None], galaxy_planets: list[dict[str, Any]]
+) -> None:
+    planets = TypeAdapter(list[Planet]).validate_python(galaxy_planets)
+    for planet in planets:
+        planet.position = planet.position.model_copy(
+            update={"x": (planet.index % 16) / 8 - 1, "y": (planet.index // 16) / 8 - 1}
+        )
+    index = SpatialIndex(planets)
+
+    def before() -> list[int]:
+        ranked = sorted(
+            planets,
+            key=lambda p: (p.position.x - 0.1) ** 2 + (p.position.y + 0.2) ** 2,
+        )
+        return [p.index for p in ranked[:5]]
+
+    def after() -> list[int]:
+        return index.nearest(0.1, -0.2, 5)
+
+    assert sorted(before()) == sorted(after())
+    scan, grid = best_of(before), best_of(after)
+    print(
+        f"\n{PLANET_COUNT} planets: 5 nearest by linear scan {scan * 1e6:.0f} us, "
+        f"SpatialIndex {grid * 1e6:.0f} us ({scan / grid:.2f}x)"
+    )
+    bench("spatial.nearest", grid, scan_seconds=scan)
+
+
+@pytest.mark.bench
+def test_history_vs_pickled_planet_lists(
+    tmp_path: Path,
+    bench: Callable[..., None],
+    galaxy_planets: list[dict[str, Any]],
+    raw_war: dict[str, Any],
+) -> None:
+    samples = 240  # Four hours, once a minute.
+    planets = TypeAdapter(list[Planet]).validate_python(galaxy_planets)
+    war = War.model_validate(raw_war)
+    history = History(tmp_path / "history")
+    pickles: list[bytes] = []
+    for minute in range(samples):
+        # A handful of contested planets change every minute.
+        for planet in planets[:20]:
+            planet.health -= 100
+            planet.statistics.player_count = minute
+        now = war.now + timedelta(minutes=minute)
+        history.record(war.model_copy(update={"now": now}), planets)
+        pickles.append(pickle.dumps(planets))
+
+    def before() -> list[int]:
+        return [
+            next(p.health for p in pickle.loads(body) if p.index == 10)
+            for body in pickles
+        ]
+
+    def after() -> list[int]:
+        return list(history.planet(10, ["health"])["health"])
+
+    assert before() == after()
+    pickled = sum(map(len, pickles))
+    stored = sum(f.stat().st_size for f in (tmp_path / "history").iterdir())
+    scan, columnar = best_of(before, repeat=3, number=1), best_of(after)
+    print(
+        f"\n{samples} samples of {PLANET_COUNT} planets: pickled lists "
+        f"{pickled / 2**20:.1f} MiB, History {stored / 2**20:.2f} MiB; "
+        f"one planet's health: unpickle {scan * 1e3:.0f} ms, "
+        f"History {columnar * 1e3:.1f} ms ({scan / columnar:.0f}x)"
+    )
+    bench(
+        "history.planet",
+        columnar,
+        unpickle_seconds=scan,
+        stored_bytes=stored,
+        pickled_bytes=pickled,
+    )
+
+
+@pytest.fixture
+def galaxy_planet(galaxy_planets: list[dict[str, Any]]) -> dict[str, Any]:
+    return galaxy_planets[0]
+
+
+MODELS: list[tuple[type[BaseModel], str]] = [
+    (Statistics, "raw_statistics"),
+    (Region, "raw_region"),
+    (Event, "raw_event"),
+    (Planet, "galaxy_planet"),
+    (Campaign, "raw_campaign"),
+    (Assignment, "raw_assignment"),
+    (Dispatch, "raw_dispatch"),
+    (SteamNews, "raw_steam_news"),
+    (SpaceStation, "raw_spacestation"),
+    (War, "raw_war"),
+]
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize(
+    ("model", "fixture"), MODELS, ids=[model.__name__ for model, _ in MODELS]
+)
+def test_model_validation(
+    request: pytest.FixtureRequest,
+    bench: Callable[..., None],
+    model: type[BaseModel],
+    fixture: str,
+) -> None:
+    # From JSON, as the modules do: `Task` validation rewrites its input, so a
+    # dict payload could only be validated once.
+    body = json.dumps(request.getfixturevalue(fixture)).encode()
+    model.model_validate_json(body)
+    seconds = best_of(lambda: model.model_validate_json(body), number=200)
+    print(f"\n{model.__name__}.model_validate_json: {seconds * 1e6:.1f} us")
+    bench(f"validate.{model.__name__}", seconds, body_bytes=len(body))
+
+
+@pytest.fixture
+def galaxy_client(galaxy_payloads: dict[str, Any]) -> HelldiveAPIClient:
+    bodies = {
+        path: json.dumps(payload).encode() for path, payload in galaxy_payloads.items()
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies[request.url.path])
+
+    return HelldiveAPIClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize(
+    "module",
+    [
+        "war",
+        "planets",
+        "campaigns",
+        "assignments",
+        "dispatches",
+        "steam",
+        "space_stations",
+    ],
+)
+def test_module_throughput(
+    bench: Callable[..., None], galaxy_client: HelldiveAPIClient, module: str
+) -> None:
+    target = getattr(galaxy_client, module)
+    call: Callable[[], Any] = target.get if module == "war" else target.get_all
+    result = call()
+    count = 1 if module == "war" else len(result)
+    seconds = best_of(call)
+
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(
+        f"\n{module}: {count} items in {seconds * 1e3:.2f} ms, "
+        f"peak memory {peak / 1024:.0f} KiB"
+    )
+    bench(f"module.{module}", seconds, items=count, peak_bytes=peak)
+
+
+@pytest.mark.bench
+@pytest.mark.parametrize("module", ["planets", "campaigns"])
+def test_lazy_vs_full_models(
+    bench: Callable[..., None], galaxy_client: HelldiveAPIClient, module: str
+) -> None:
+    target = getattr(galaxy_client, module)
+    full: list[BaseModel] = target.get_all()
+    lazy: list[BaseModel] = target.get_all_lazy()
+    fields = set(type(lazy[0]).model_fields)
+    assert [item.model_dump(include=fields) for item in full] == [
+        item.model_dump() for item in lazy
+    ]
+    full_time, lazy_time = best_of(target.get_all), best_of(target.get_all_lazy)
+    print(
+        f"\n{module}: {len(full)} items, get_all() {full_time * 1e3:.2f} ms, "
+        f"get_all_lazy() {lazy_time * 1e3:.2f} ms ({full_time / lazy_time:.2f}x)"
+    )
+    bench(f"lazy.{module}", lazy_time, full_seconds=full_time)
+
+
+@pytest.mark.bench
+def test_instrumentation_overhead(
+    bench: Callable[..., None], galaxy_client: HelldiveAPIClient
+) -> None:
+    instrumented = HelldiveAPIClient(
+        http_client=galaxy_client.client,
+        instrumentation=Instrumentation(lambda stats: None),
+    )
+    plain_time = best_of(galaxy_client.planets.get_all)
+    instrumented_time = best_of(instrumented.planets.get_all)
+    print(
+        f"\nplanets.get_all(): {plain_time * 1e3:.2f} ms plain, "
+        f"{instrumented_time * 1e3:.2f} ms instrumented "
+        f"({instrumented_time / plain_time - 1:+.1%})"
+    )
+    bench("instrumentation.planets", instrumented_time, plain_seconds=plain_time)
+
+
+@pytest.mark.bench
+def test_import_time(bench: Callable[..., None]) -> None:
+    script = (
+        "import time; start = time.perf_counter(); import helldivepy; "
+        "print(time.perf_counter() - start)"
+    )
+    times = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(5)
+    ]
+    seconds = min(times)
+    print(f"\nimport helldivepy: {seconds * 1e3:.0f} ms")
+    bench("import", seconds)
@@ -0,0 +1,301 @@
+"""Tests for the response cache."""
+
+import asyncio
+import multiprocessing
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.cache import ResponseCache, SQLiteCache, default_cache_dir
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.models import Planet, War
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+class TestResponseCache:
+    def test_ttl_for_longest_prefix_wins(self) -> None:
+        cache = ResponseCache(ttl=5, ttls={"/v1": 10, "/v1/steam": 300})
+        assert cache.ttl_for("/v1/steam/1") == 300
+        assert cache.ttl_for("/v1/war") == 10
+        assert cache.ttl_for("/v2/dispatches") == 5
+
+    def test_lru_eviction(self) -> None:
+        cache = ResponseCache(maxsize=2)
+        for path in ("/a", "/b"):
+            cache.store(path, httpx.Response(200, json=[]))
+        cache.get("/a")
+        cache.store("/c", httpx.Response(200, json=[]))
+        assert len(cache) == 2
+        assert cache.get("/b") is None
+        assert cache.get("/a") is not None
+
+    def test_conditional_headers(self) -> None:
+        cache = ResponseCache()
+        entry = cache.store(
+            "/a",
+            httpx.Response(
+                200, json=[], headers={"ETag": '"v1"', "Last-Modified": "yesterday"}
+            ),
+        )
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "yesterday",
+        }
+
+
+class TestCachedModules:
+    def test_fresh_entry_skips_request(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=60))
+        first = client.war.get()
+        second = client.war.get()
+        assert route.call_count == 1
+        assert isinstance(first, War)
+        assert first is second
+
+    def test_stale_entry_revalidates_with_etag(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            side_effect=[
+                httpx.Response(200, json=[raw_planet], headers={"ETag": '"abc"'}),
+                httpx.Response(304),
+            ]
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=0))
+        first = client.planets.get_all()
+        second = client.planets.get_all()
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["If-None-Match"] == '"abc"'
+        assert isinstance(second[0], Planet)
+        assert first[0] is second[0]
+
+    def test_identical_body_reuses_validated_models(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet])
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=0))
+        assert client.planets.get_all()[0] is client.planets.get_all()[0]
+
+    def test_changed_body_is_revalidated(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            side_effect=[
+                httpx.Response(200, json=[raw_planet]),
+                httpx.Response(200, json=[{**raw_planet, "health": 1}]),
+            ]
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=0))
+        assert client.planets.get_all()[0].health == 750000
+        assert client.planets.get_all()[0].health == 1
+
+    def test_results_can_be_modified(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet] * 3)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=60))
+        client.planets.get_all().pop()
+        client.planets.get_all_raw()[0]["health"] = -1
+        assert len(client.planets.get_all()) == 3
+        assert client.planets.get_all_raw()[0]["health"] == 750000
+        assert route.call_count == 1
+
+    def test_shared_between_base_urls(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        local = "http://localhost:8080/api"
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        respx_mock.get(f"{local}/v1/war").mock(
+            return_value=httpx.Response(
+                200, json={**raw_war, "clientVersion": "STAGING"}
+            )
+        )
+        cache = ResponseCache(ttl=60)
+        prod = HelldiveAPIClient(cache=cache).war.get()
+        staging = HelldiveAPIClient(cache=cache, base_url=local).war.get()
+        assert prod.client_version == raw_war["clientVersion"]
+        assert staging.client_version == "STAGING"
+        assert len(cache) == 2
+
+    def test_ttls_match_paths(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=0, ttls={"/v1/war": 60}))
+        client.war.get()
+        client.war.get()
+        assert route.call_count == 1
+
+    def test_404_is_not_cached(self, respx_mock: respx.MockRouter) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/planets/999").mock(
+            return_value=httpx.Response(404)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=60))
+        assert client.planets.get(999) is None
+        assert client.planets.get(999) is None
+        assert route.call_count == 2
+
+    def test_non_404_errors_still_raise(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets/1").mock(
+            return_value=httpx.Response(500)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache())
+        with pytest.raises(httpx.HTTPStatusError):
+            client.planets.get(1)
+
+    def test_async_client_uses_cache(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+
+        async def run() -> tuple[War, War]:
+            async with AsyncHelldiveAPIClient(cache=ResponseCache(ttl=60)) as client:
+                return await client.war.get(), await client.war.get()
+
+        first, second = asyncio.run(run())
+        assert route.call_count == 1
+        assert first is second
+
+
+def _store_from_other_process(path: str) -> None:
+    cache = SQLiteCache(path, ttl=60)
+    cache.store("/v1/war", httpx.Response(200, json={"from": "child"}))
+    cache.close()
+
+
+class TestSQLiteCache:
+    def test_new_instance_starts_warm(
+        self,
+        tmp_path: Path,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war, headers={"ETag": '"w"'})
+        )
+        path = tmp_path / "cache.sqlite3"
+        first = SQLiteCache(path, ttl=60)
+        HelldiveAPIClient(cache=first).war.get()
+        first.close()
+
+        second = SQLiteCache(path, ttl=60)
+        war = HelldiveAPIClient(cache=second).war.get()
+        assert route.call_count == 1
+        assert isinstance(war, War)
+        entry = second.get(f"{BASE_URL}/v1/war")
+        assert entry is not None
+        assert entry.etag == '"w"'
+
+    def test_expired_entry_is_revalidated(
+        self,
+        tmp_path: Path,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            side_effect=[
+                httpx.Response(200, json=raw_war, headers={"ETag": '"w"'}),
+                httpx.Response(304),
+            ]
+        )
+        path = tmp_path / "cache.sqlite3"
+        HelldiveAPIClient(cache=SQLiteCache(path, ttl=0)).war.get()
+        war = HelldiveAPIClient(cache=SQLiteCache(path, ttl=0)).war.get()
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["If-None-Match"] == '"w"'
+        assert isinstance(war, War)
+
+    def test_shared_between_base_urls(
+        self,
+        tmp_path: Path,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        local = "http://localhost:8080/api"
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        respx_mock.get(f"{local}/v1/war").mock(
+            return_value=httpx.Response(
+                200, json={**raw_war, "clientVersion": "STAGING"}
+            )
+        )
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path, ttl=60)
+        HelldiveAPIClient(cache=cache).war.get()
+        HelldiveAPIClient(cache=cache, base_url=local).war.get()
+        cache.close()
+
+        # A new instance reads both entries from disk.
+        cache = SQLiteCache(path, ttl=60)
+        prod = HelldiveAPIClient(cache=cache).war.get()
+        staging = HelldiveAPIClient(cache=cache, base_url=local).war.get()
+        assert prod.client_version == raw_war["clientVersion"]
+        assert staging.client_version == "STAGING"
+        assert respx_mock.calls.call_count == 2
+
+    def test_shared_between_processes(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path, ttl=60)
+        assert cache.get("/v1/war") is None
+        process = multiprocessing.get_context("spawn").Process(
+            target=_store_from_other_process, args=(str(path),)
+        )
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+        entry = cache.get("/v1/war")
+        assert entry is not None
+        assert entry.fresh
+        assert entry.result() == {"from": "child"}
+
+    def test_clear(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path)
+        cache.store("/a", httpx.Response(200, json=[]))
+        cache.clear()
+        assert cache.get("/a") is None
+        assert SQLiteCache(path).get("/a") is None
+
+    def test_default_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "helldivepy"
+        cache = SQLiteCache()
+        assert cache.path == tmp_path / "helldivepy" / "cache.sqlite3"
+        assert cache.path.exists()
@@ -1,15 +1,28 @@
 """Tests for HelldiveAPIClient."""
 
+import asyncio
+from typing import cast
+
 import httpx
 
-from helldivepy.client import HelldiveAPIClient
-from helldivepy.modules.assignments import AssignmentsModule
-from helldivepy.modules.campaigns import CampaignModule
-from helldivepy.modules.dispatches import DispatchesModule
-from helldivepy.modules.planets import PlanetModule
-from helldivepy.modules.space_stations import SpaceStationsModule
-from helldivepy.modules.steam import SteamModule
-from helldivepy.modules.war import WarModule
+from helldivepy.client import DEFAULT_LIMITS, AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.modules.assignments import AssignmentsModule, AsyncAssignmentsModule
+from helldivepy.modules.campaigns import AsyncCampaignModule, CampaignModule
+from helldivepy.modules.dispatches import AsyncDispatchesModule, DispatchesModule
+from helldivepy.modules.planets import AsyncPlanetModule, PlanetModule
+from helldivepy.modules.space_stations import (
+    AsyncSpaceStationsModule,
+    SpaceStationsModule,
+)
+from helldivepy.modules.steam import AsyncSteamModule, SteamModule
+from helldivepy.modules.war import AsyncWarModule, WarModule
+
+
+def pool_limits(client: httpx.Client) -> tuple[int, int]:
+    # httpx has no public view of the limits it built the connection pool with.
+    transport = cast(httpx.HTTPTransport, client._transport)  # pyright: ignore[reportPrivateUsage]
+    pool = transport._pool  # pyright: ignore[reportPrivateUsage]
+    return pool._max_connections, pool._max_keepalive_connections  # pyright: ignore[reportPrivateUsage]
 
 
 class TestHelldiveAPIClient:
@@ -49,3 +62,94 @@ class TestHelldiveAPIClient:
         with HelldiveAPIClient() as c:
             assert not c.client.is_closed
         assert c.client.is_closed
+
+
+class TestAsyncHelldiveAPIClient:
+    def test_default_base_url(self) -> None:
+        c = AsyncHelldiveAPIClient()
+        assert c.base_url == "https://api.helldivers2.dev/api"
+
+    def test_custom_headers(self) -> None:
+        c = AsyncHelldiveAPIClient(client="myapp", contact="contact@example.com")
+        assert c.headers["X-Super-Client"] == "myapp"
+        assert c.headers["X-Super-Contact"] == "contact@example.com"
+
+    def test_all_modules_auto_registered(self) -> None:
+        c = AsyncHelldiveAPIClient()
+        assert isinstance(c.war, AsyncWarModule)
+        assert isinstance(c.dispatches, AsyncDispatchesModule)
+        assert isinstance(c.planets, AsyncPlanetModule)
+        assert isinstance(c.assignments, AsyncAssignmentsModule)
+        assert isinstance(c.campaigns, AsyncCampaignModule)
+        assert isinstance(c.space_stations, AsyncSpaceStationsModule)
+        assert isinstance(c.steam, AsyncSteamModule)
+
+    def test_httpx_async_client_created(self) -> None:
+        c = AsyncHelldiveAPIClient()
+        assert isinstance(c.client, httpx.AsyncClient)
+
+    def test_async_context_manager_closes_client(self) -> None:
+        async def run() -> AsyncHelldiveAPIClient:
+            async with AsyncHelldiveAPIClient() as c:
+                assert not c.client.is_closed
+            return c
+
+        assert asyncio.run(run()).client.is_closed
+
+
+class TestHTTPConfiguration:
+    def test_custom_transport(
+        self,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=raw_war)
+
+        with HelldiveAPIClient(transport=httpx.MockTransport(handler)) as c:
+            c.war.get()
+        assert seen[0].url.path == "/api/v1/war"
+
+    def test_timeout_and_limits(self) -> None:
+        timeout = httpx.Timeout(10.0, connect=2.0, pool=1.0)
+        limits = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+        with HelldiveAPIClient(timeout=timeout, limits=limits) as c:
+            assert c.client.timeout == timeout
+            assert pool_limits(c.client) == (4, 2)
+        with HelldiveAPIClient() as c:
+            assert pool_limits(c.client) == (
+                DEFAULT_LIMITS.max_connections,
+                DEFAULT_LIMITS.max_keepalive_connections,
+            )
+
+    def test_injected_client_is_used_and_not_closed(self) -> None:
+        http_client = httpx.Client()
+        with HelldiveAPIClient(http_client=http_client) as c:
+            assert c.client is http_client
+        assert not http_client.is_closed
+        http_client.close()
+
+    def test_async_custom_transport(
+        self,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200, json=raw_war))
+
+        async def run() -> str:
+            async with AsyncHelldiveAPIClient(transport=transport) as c:
+                return (await c.war.get()).client_version
+
+        assert asyncio.run(run()) == "1.0.0"
+
+    def test_async_injected_client_is_not_closed(self) -> None:
+        http_client = httpx.AsyncClient()
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient(http_client=http_client) as c:
+                assert c.client is http_client
+            assert not http_client.is_closed
+            await http_client.aclose()
+
+        asyncio.run(run())
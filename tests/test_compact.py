@@ -0,0 +1,71 @@
+"""Tests for the compact model representations."""
+
+import dataclasses
+
+import pytest
+
+from helldivepy.compact import CompactPosition, CompactRegion, CompactStatistics
+from helldivepy.enums import RegionSize
+from helldivepy.models import Position, Region, Statistics
+
+
+class TestCompactRegion:
+    def test_round_trip(
+        self,
+        raw_region: dict,  # type: ignore[type-arg]
+    ) -> None:
+        region = Region.model_validate(raw_region)
+        compact = CompactRegion.from_model(region)
+        assert compact.size == RegionSize.City
+        restored = compact.to_model()
+        assert isinstance(restored, Region)
+        assert restored == region
+        assert restored.model_dump(by_alias=True) == region.model_dump(by_alias=True)
+
+    def test_round_trip_keeps_unset_optional_fields(
+        self,
+        raw_region_nullable: dict[str, object],
+    ) -> None:
+        payload = {k: v for k, v in raw_region_nullable.items() if v is not None}
+        region = Region.model_validate(payload)
+        restored = CompactRegion.from_model(region).to_model()
+        assert restored == region
+        assert restored.model_fields_set == region.model_fields_set
+
+    def test_is_frozen_without_instance_dict(
+        self,
+        raw_region: dict,  # type: ignore[type-arg]
+    ) -> None:
+        compact = CompactRegion.from_model(Region.model_validate(raw_region))
+        assert not hasattr(compact, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            compact.health = 0  # type: ignore[misc]
+
+    def test_hashable_and_comparable(
+        self,
+        raw_region: dict,  # type: ignore[type-arg]
+    ) -> None:
+        region = Region.model_validate(raw_region)
+        a, b = CompactRegion.from_model(region), CompactRegion.from_model(region)
+        assert a == b
+        assert len({a, b}) == 1
+
+
+class TestCompactPosition:
+    def test_round_trip(self) -> None:
+        position = Position(x=0.25, y=-0.5)
+        compact = CompactPosition.from_model(position)
+        assert (compact.x, compact.y) == (0.25, -0.5)
+        assert compact.to_model() == position
+
+
+class TestCompactStatistics:
+    def test_round_trip(
+        self,
+        raw_statistics: dict,  # type: ignore[type-arg]
+    ) -> None:
+        statistics = Statistics.model_validate(raw_statistics)
+        compact = CompactStatistics.from_model(statistics)
+        assert compact.player_count == statistics.player_count
+        assert compact.to_model() == statistics
+        assert not hasattr(compact, "__dict__")
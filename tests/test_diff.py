@@ -0,0 +1,171 @@
+"""Tests for the snapshot diff engine."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from helldivepy.diff import (
+    AssignmentEnded,
+    AssignmentIssued,
+    CampaignEnded,
+    CampaignStarted,
+    DispatchPublished,
+    EventEnded,
+    EventStarted,
+    PlanetAdded,
+    PlanetHealthChanged,
+    PlanetOwnerChanged,
+    PlanetRemoved,
+    RegionAvailabilityChanged,
+    TaskProgressChanged,
+    diff_assignments,
+    diff_campaigns,
+    diff_dispatches,
+    diff_planets,
+    diff_snapshots,
+)
+from helldivepy.enums import Factions
+from helldivepy.models import Assignment, Campaign, Dispatch, Planet, War
+from helldivepy.snapshot import GalaxySnapshot
+
+
+class TestDiffPlanets:
+    def test_unchanged_planets_produce_nothing(
+        self,
+        make_planet: Callable[..., Planet],
+    ) -> None:
+        same = make_planet()
+        assert diff_planets([same], [same]) == []
+        assert diff_planets([make_planet()], [make_planet()]) == []
+
+    def test_only_fingerprints_are_compared(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        make_planet: Callable[..., Planet],
+    ) -> None:
+        def fail(self: Planet, other: object) -> bool:
+            raise AssertionError("models compared field by field")
+
+        monkeypatch.setattr(Planet, "__eq__", fail)
+        old, new = make_planet(), make_planet(regenPerSecond=9.0)
+        assert diff_planets([old], [new]) == []
+
+    def test_owner_and_health(self, make_planet: Callable[..., Planet]) -> None:
+        changes = diff_planets(
+            [make_planet()], [make_planet(currentOwner="Humans", health=1000000)]
+        )
+        assert changes == [
+            PlanetOwnerChanged(42, Factions.Terminids, Factions.Humans),
+            PlanetHealthChanged(42, 750000, 1000000),
+        ]
+        assert changes[1].delta == 250000  # type: ignore[attr-defined]
+
+    def test_event_started_and_ended(
+        self,
+        make_planet: Callable[..., Planet],
+        raw_event: dict[str, Any],
+    ) -> None:
+        with_event = make_planet(event=raw_event)
+        assert diff_planets([make_planet()], [with_event]) == [
+            EventStarted(42, with_event.event)  # type: ignore[arg-type]
+        ]
+        assert diff_planets([with_event], [make_planet()]) == [
+            EventEnded(42, with_event.event)  # type: ignore[arg-type]
+        ]
+
+    def test_event_replaced(
+        self,
+        make_planet: Callable[..., Planet],
+        raw_event: dict[str, Any],
+    ) -> None:
+        old = make_planet(event=raw_event)
+        new = make_planet(event={**raw_event, "id": 100})
+        changes = diff_planets([old], [new])
+        assert [type(c) for c in changes] == [EventEnded, EventStarted]
+
+    def test_region_availability(
+        self,
+        make_planet: Callable[..., Planet],
+        raw_region: dict[str, Any],
+    ) -> None:
+        closed = {**raw_region, "isAvailable": False}
+        changes = diff_planets(
+            [make_planet(regions=[closed])],
+            [make_planet(regions=[raw_region, {**closed, "id": 2}])],
+        )
+        assert changes == [RegionAvailabilityChanged(42, 1, True)]
+
+    def test_planets_matched_by_index(self, make_planet: Callable[..., Planet]) -> None:
+        changes = diff_planets(
+            [make_planet(index=1), make_planet(index=2)],
+            [make_planet(index=2, health=1), make_planet(index=1)],
+        )
+        assert changes == [PlanetHealthChanged(2, 750000, 1)]
+
+    def test_planets_added_and_removed(
+        self, make_planet: Callable[..., Planet]
+    ) -> None:
+        kept, removed = make_planet(index=1), make_planet(index=2)
+        added = make_planet(index=3)
+        assert diff_planets([kept, removed], [kept, added]) == [
+            PlanetRemoved(removed),
+            PlanetAdded(added),
+        ]
+
+
+class TestDiffOthers:
+    def test_campaigns(self, raw_campaign: dict[str, Any]) -> None:
+        old = Campaign.model_validate(raw_campaign)
+        new = Campaign.model_validate({**raw_campaign, "id": 6})
+        assert diff_campaigns([old], [new]) == [
+            CampaignEnded(old),
+            CampaignStarted(new),
+        ]
+        assert diff_campaigns([old], [Campaign.model_validate(raw_campaign)]) == []
+
+    def test_assignments(self, make_assignment: Callable[..., Assignment]) -> None:
+        old = make_assignment()
+        new = make_assignment(progress=[60000, 0])
+        assert diff_assignments([old], [new]) == [
+            TaskProgressChanged(9001, 0, 50000, 60000)
+        ]
+        issued = make_assignment(id=9002)
+        assert diff_assignments([old], [issued]) == [
+            AssignmentEnded(old),
+            AssignmentIssued(issued),
+        ]
+
+    def test_dispatches(self, raw_dispatch: dict[str, Any]) -> None:
+        old = Dispatch.model_validate(raw_dispatch)
+        new = Dispatch.model_validate({**raw_dispatch, "id": 1000})
+        assert diff_dispatches([old], [new, old]) == [DispatchPublished(new)]
+        assert diff_dispatches([old, new], [new]) == []
+
+
+class TestDiffSnapshots:
+    def test_combines_planets_campaigns_and_assignments(
+        self,
+        make_planet: Callable[..., Planet],
+        make_assignment: Callable[..., Assignment],
+        raw_campaign: dict[str, Any],
+        raw_war: dict[str, Any],
+    ) -> None:
+        war = War.model_validate(raw_war)
+        old = GalaxySnapshot.build(
+            war,
+            [make_planet()],
+            [Campaign.model_validate(raw_campaign)],
+            [make_assignment()],
+            [],
+        )
+        new_campaign = Campaign.model_validate({**raw_campaign, "id": 6})
+        new = GalaxySnapshot.build(
+            war, [make_planet(health=1)], [new_campaign], old.assignments, []
+        )
+        changes = diff_snapshots(old, new)
+        assert [type(c) for c in changes] == [
+            PlanetHealthChanged,
+            CampaignEnded,
+            CampaignStarted,
+        ]
@@ -0,0 +1,256 @@
+"""Tests for the progress and ETA estimator."""
+
+import random
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from helldivepy.estimate import ProgressEstimator
+from helldivepy.models import Assignment, Planet, War
+
+START = datetime(2026, 3, 10, 12, tzinfo=UTC)
+
+
+def at(minute: float) -> datetime:
+    return START + timedelta(minutes=minute)
+
+
+class TestPlanets:
+    def test_linear_liberation(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        # 1% of max health (10000) per minute, from 25% liberated.
+        for minute in range(10):
+            estimator.update(
+                make_war(now=at(minute)),
+                [make_planet(health=750000 - 10000 * minute, regenPerSecond=0.0)],
+            )
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        assert estimate.samples == 10
+        assert estimate.progress == pytest.approx(34.0)
+        assert estimate.rate == pytest.approx(60.0)
+        assert estimate.eta == START + timedelta(minutes=9 + 66)
+        assert estimate.earliest == estimate.latest == estimate.eta
+        assert estimate.deadline is None
+        assert estimate.on_track is None
+
+    def test_regeneration_is_projected(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        # Players push 2000 health/s, the planet regenerates 1000 health/s.
+        for minute in range(10):
+            estimator.update(
+                make_war(now=at(minute)),
+                [
+                    make_planet(
+                        health=750000 - 1000 * 60 * minute, regenPerSecond=1000.0
+                    )
+                ],
+            )
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        assert estimate.rate == pytest.approx(100 * 1000 * 3600 / 1000000)
+
+    def test_impact_multiplier_change(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        health = 750000.0
+        for minute in range(20):
+            multiplier = 1.0 if minute < 10 else 2.0
+            estimator.update(
+                make_war(now=at(minute), impactMultiplier=multiplier),
+                [make_planet(health=health, regenPerSecond=0.0)],
+            )
+            health -= 5000 * multiplier
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        # 0.5% per minute at the current multiplier, not the window average.
+        assert estimate.rate == pytest.approx(60.0, rel=1e-3)
+
+    def test_not_progressing(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        for minute in range(5):
+            estimator.update(
+                make_war(now=at(minute)),
+                [make_planet(health=750000 + 1000 * minute, regenPerSecond=0.0)],
+            )
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        assert estimate.rate < 0
+        assert estimate.eta is None
+
+    def test_human_planets_and_captures(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        estimator.update(
+            make_war(now=at(0)), [make_planet(health=750000, regenPerSecond=0.0)]
+        )
+        estimator.update(
+            make_war(now=at(1)), [make_planet(health=740000, regenPerSecond=0.0)]
+        )
+        estimator.update(
+            make_war(now=at(2)),
+            [make_planet(health=700000, currentOwner="Automaton", regenPerSecond=0.0)],
+        )
+        assert estimator.planet(42) is None
+        estimator.update(
+            make_war(now=at(3)),
+            [make_planet(health=1000000, currentOwner="Humans", regenPerSecond=0.0)],
+        )
+        assert estimator.planets() == {}
+
+    def test_noisy_band(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        rng = random.Random(7)
+        estimator = ProgressEstimator(confidence=0.95)
+        for minute in range(30):
+            noise = rng.gauss(0, 2000)
+            estimator.update(
+                make_war(now=at(minute)),
+                [
+                    make_planet(
+                        health=round(750000 - 5000 * minute + noise), regenPerSecond=0.0
+                    )
+                ],
+            )
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        assert estimate.earliest is not None
+        assert estimate.latest is not None
+        assert estimate.earliest < estimate.eta < estimate.latest  # type: ignore[operator]
+        assert estimate.rate == pytest.approx(30.0, rel=0.05)
+
+
+class TestEventsAndTasks:
+    def test_event_against_end_time(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+        raw_event: dict[str, Any],
+    ) -> None:
+        estimator = ProgressEstimator()
+        for minute in range(3):
+            event = {**raw_event, "health": 300000 - 50000 * minute}
+            estimator.update(
+                make_war(now=at(minute)),
+                [
+                    make_planet(
+                        health=1000000,
+                        currentOwner="Humans",
+                        event=event,
+                        regenPerSecond=0.0,
+                    )
+                ],
+            )
+        estimate = estimator.event(99)
+        assert estimate is not None
+        assert estimate.progress == pytest.approx(60.0)
+        assert estimate.rate == pytest.approx(600.0)
+        assert estimate.deadline == datetime(2026, 3, 17, 12, tzinfo=UTC)
+        assert estimate.on_track
+        assert list(estimator.events()) == [99]
+
+    def test_task_against_expiration(
+        self,
+        make_war: Callable[..., War],
+        make_assignment: Callable[..., Assignment],
+    ) -> None:
+        estimator = ProgressEstimator()
+        # The kill task has a goal of 100000: 1% per hour.
+        for hour in range(3):
+            estimator.update(
+                make_war(now=at(60 * hour)),
+                assignments=[make_assignment(progress=[1000 * hour, 0])],
+            )
+        estimate = estimator.task(9001, 0)
+        assert estimate is not None
+        assert estimate.rate == pytest.approx(1.0)
+        assert estimate.deadline == datetime(2026, 3, 16, 16, 38, 53, 254825, UTC)
+        assert estimate.eta == START + timedelta(hours=2 + 98)
+        assert estimate.on_track
+        # The first sample left the one-hour window, the last two always stay.
+        assert estimate.samples == 2
+        assert list(estimator.tasks()) == [(9001, 0), (9001, 1)]
+
+    def test_ended_items_are_dropped(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+        make_assignment: Callable[..., Assignment],
+        raw_event: dict[str, Any],
+    ) -> None:
+        estimator = ProgressEstimator()
+        estimator.update(
+            make_war(now=at(0)),
+            [make_planet(health=1000000, event=raw_event, regenPerSecond=0.0)],
+            [make_assignment(progress=[0, 0])],
+        )
+        estimator.update(
+            make_war(now=at(1)), [make_planet(health=1000000, regenPerSecond=0.0)], []
+        )
+        assert estimator.event(99) is None
+        assert estimator.task(9001, 0) is None
+
+
+class TestUpdates:
+    def test_stale_updates_are_ignored(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator()
+        assert estimator.update(
+            make_war(now=at(1)), [make_planet(health=750000, regenPerSecond=0.0)]
+        )
+        assert not estimator.update(
+            make_war(now=at(1)), [make_planet(health=0, regenPerSecond=0.0)]
+        )
+        assert not estimator.update(
+            make_war(now=at(0)), [make_planet(health=0, regenPerSecond=0.0)]
+        )
+        assert estimator.planet(42) is None
+
+    def test_window(
+        self,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        estimator = ProgressEstimator(window=300)
+        for minute in range(20):
+            estimator.update(
+                make_war(now=at(minute)),
+                [make_planet(health=750000 - 1000 * minute**2, regenPerSecond=0.0)],
+            )
+        estimate = estimator.planet(42)
+        assert estimate is not None
+        assert estimate.samples == 6
+        # Fitted over minutes 14 to 19 only: the slope at minute 16.5.
+        assert estimate.rate == pytest.approx(100 * 1000 * 2 * 16.5 * 60 / 1000000)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError, match="window"):
+            ProgressEstimator(window=0)
+        with pytest.raises(ValueError, match="confidence"):
+            ProgressEstimator(confidence=1)
@@ -0,0 +1,118 @@
+"""Tests for the supply-line graph."""
+
+from collections.abc import Callable
+
+import pytest
+
+from helldivepy.enums import Factions
+from helldivepy.graph import GalaxyGraph
+from helldivepy.models import Planet
+
+# 0 - 1 - 2 - 3     5 (isolated)
+#     |       |
+#     4 ------+
+LINKS = {0: [1], 1: [2, 4], 2: [3], 3: [4], 4: [], 5: []}
+OWNERS = {
+    0: Factions.Humans,
+    1: Factions.Humans,
+    2: Factions.Terminids,
+    3: Factions.Humans,
+    4: Factions.Humans,
+    5: Factions.Automaton,
+}
+
+
+@pytest.fixture
+def make_galaxy(make_planet: Callable[..., Planet]) -> Callable[..., list[Planet]]:
+    def make(
+        owners: dict[int, Factions] = OWNERS,
+        attacking: dict[int, list[int]] | None = None,
+        links: dict[int, list[int]] = LINKS,
+    ) -> list[Planet]:
+        return [
+            make_planet(
+                index=index,
+                waypoints=waypoints,
+                currentOwner=owners[index],
+                attacking=(attacking or {}).get(index, []),
+            )
+            for index, waypoints in links.items()
+        ]
+
+    return make
+
+
+@pytest.fixture
+def graph(make_galaxy: Callable[..., list[Planet]]) -> GalaxyGraph:
+    return GalaxyGraph(make_galaxy(attacking={2: [1, 3], 5: [3]}))
+
+
+class TestQueries:
+    def test_neighbors_are_undirected(self, graph: GalaxyGraph) -> None:
+        assert graph.neighbors(1) == [0, 2, 4]
+        assert graph.neighbors(4) == [1, 3]
+        assert graph.neighbors(5) == []
+        assert len(graph) == 6
+        assert 5 in graph
+        assert 99 not in graph
+
+    def test_path(self, graph: GalaxyGraph) -> None:
+        assert graph.path(0, 3) in ([0, 1, 2, 3], [0, 1, 4, 3])
+        assert graph.path(2, 2) == [2]
+        assert graph.path(0, 5) is None
+
+    def test_path_through_owner(self, graph: GalaxyGraph) -> None:
+        assert graph.path(0, 3, owner=Factions.Humans) == [0, 1, 4, 3]
+        assert graph.path(0, 2, owner=Factions.Humans) is None
+
+    def test_path_unknown_planet_raises(self, graph: GalaxyGraph) -> None:
+        with pytest.raises(KeyError, match="99"):
+            graph.path(0, 99)
+
+    def test_neighborhood(self, graph: GalaxyGraph) -> None:
+        assert graph.neighborhood(0, 0) == {0: 0}
+        assert graph.neighborhood(0, 2) == {0: 0, 1: 1, 2: 2, 4: 2}
+        assert graph.neighborhood(0, 10) == {0: 0, 1: 1, 2: 2, 4: 2, 3: 3}
+
+    def test_components(self, graph: GalaxyGraph) -> None:
+        assert graph.components(Factions.Humans) == [[0, 1, 3, 4]]
+        assert graph.components(Factions.Terminids) == [[2]]
+        assert graph.components(Factions.Illuminate) == []
+
+    def test_attacks(self, graph: GalaxyGraph) -> None:
+        assert graph.attacking(2) == [1, 3]
+        assert graph.attackers(3) == [2, 5]
+        assert graph.attackers(0) == []
+        assert graph.under_attack(Factions.Terminids) == [1, 3]
+        assert graph.under_attack(Factions.Automaton) == [3]
+        assert graph.under_attack(Factions.Humans) == []
+
+
+class TestUpdate:
+    def test_owner_change_only(
+        self, graph: GalaxyGraph, make_galaxy: Callable[..., list[Planet]]
+    ) -> None:
+        supply = graph._supply  # pyright: ignore[reportPrivateUsage]
+        owners = {**OWNERS, 4: Factions.Terminids}
+        changed = graph.update(make_galaxy(owners, attacking={2: [1, 3], 5: [3]}))
+        assert changed is False
+        assert graph._supply is supply  # pyright: ignore[reportPrivateUsage]
+        assert graph.owner(4) == Factions.Terminids
+        assert graph.components(Factions.Humans) == [[0, 1], [3]]
+
+    def test_new_attack(
+        self, graph: GalaxyGraph, make_galaxy: Callable[..., list[Planet]]
+    ) -> None:
+        assert graph.update(make_galaxy(attacking={4: [0]})) is True
+        assert graph.attackers(0) == [4]
+        assert graph.attackers(3) == []
+
+    def test_new_supply_line_and_planet(
+        self, graph: GalaxyGraph, make_galaxy: Callable[..., list[Planet]]
+    ) -> None:
+        links = {**LINKS, 5: [3], 6: [5]}
+        owners = {**OWNERS, 6: Factions.Automaton}
+        assert graph.update(make_galaxy(owners, links=links)) is True
+        assert graph.neighbors(5) == [3, 6]
+        assert graph.path(6, 0) is not None
+        assert graph.components(Factions.Automaton) == [[5, 6]]
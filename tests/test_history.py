@@ -0,0 +1,247 @@
+"""Tests for the time-series history store."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from helldivepy.history import History
+from helldivepy.models import Planet, War
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def at(minute: int) -> datetime:
+    return START + timedelta(minutes=minute)
+
+
+@pytest.fixture
+def record(
+    make_planet: Callable[..., Planet],
+    make_war: Callable[..., War],
+) -> Callable[[History, int], None]:
+    """Record `samples` minutes of two planets into a history."""
+
+    def make(history: History, samples: int) -> None:
+        for minute in range(samples):
+            history.record(
+                make_war(now=at(minute), statistics={"playerCount": 1000 + minute}),
+                [
+                    make_planet(
+                        index=1,
+                        health=1000000 - 100 * minute,
+                        statistics={"playerCount": minute},
+                    ),
+                    make_planet(index=2, health=500000, regenPerSecond=0.5 + minute),
+                ],
+            )
+
+    return make
+
+
+class TestRecord:
+    def test_round_trip(
+        self,
+        tmp_path: Path,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=4)
+        record(history, 10)
+        assert len(history) == 10
+        assert history.planet_indices() == [1, 2]
+
+        series = history.planet(1)
+        assert len(series) == 10
+        assert list(series["health"]) == [1000000 - 100 * m for m in range(10)]
+        assert list(series["players"]) == list(range(10))
+        assert series.datetimes()[3] == START + timedelta(minutes=3)
+        assert list(history.planet(2, ["regen_per_second"])["regen_per_second"]) == [
+            0.5 + m for m in range(10)
+        ]
+        assert list(history.war(["players"])["players"]) == [
+            1000 + m for m in range(10)
+        ]
+
+    def test_float_sign_changes(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=8)
+        regens = [-1.5, 2.25, -0.0, 1e300, -1e-300, 0.5]
+        for minute, regen in enumerate(regens):
+            history.record(
+                make_war(now=at(minute)),
+                [make_planet(index=1, health=10, regenPerSecond=regen)],
+            )
+        assert list(history.planet(1)["regen_per_second"]) == regens
+
+    def test_only_requested_columns(
+        self,
+        tmp_path: Path,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path)
+        record(history, 3)
+        series = history.planet(1, ["health"])
+        assert list(series.columns) == ["health"]
+
+    def test_stale_samples_are_skipped(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path)
+        assert history.record(make_war(now=at(5)), [make_planet(index=1, health=10)])
+        assert not history.record(
+            make_war(now=at(5)), [make_planet(index=1, health=20)]
+        )
+        assert not history.record(
+            make_war(now=at(4)), [make_planet(index=1, health=20)]
+        )
+        assert list(history.planet(1)["health"]) == [10]
+
+    def test_missing_planets_keep_their_values(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=2)
+        history.record(make_war(now=at(0)), [make_planet(index=1, health=10)])
+        history.record(make_war(now=at(1)), [make_planet(index=2, health=20)])
+        history.record(
+            make_war(now=at(2)),
+            [make_planet(index=1, health=30), make_planet(index=2, health=40)],
+        )
+        history.record(make_war(now=at(3)), [])
+        assert list(history.planet(1)["health"]) == [10, 10, 30, 30]
+        assert list(history.planet(2)["health"]) == [20, 40, 40]
+
+    def test_unknown_planet_or_column(
+        self,
+        tmp_path: Path,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path)
+        record(history, 1)
+        with pytest.raises(KeyError):
+            history.planet(99)
+        with pytest.raises(ValueError, match="Unknown column"):
+            history.planet(1, ["name"])
+        with pytest.raises(ValueError, match="Unknown column"):
+            history.war(["health"])
+
+    def test_small_on_disk(
+        self,
+        tmp_path: Path,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path)
+        record(history, 200)
+        size = sum(f.stat().st_size for f in tmp_path.iterdir())
+        # Far below one pickled `Planet` list per sample.
+        assert size < 200 * 200
+
+
+class TestQuery:
+    @pytest.mark.parametrize("keyframe_interval", [1, 3, 64])
+    def test_time_range(
+        self,
+        tmp_path: Path,
+        keyframe_interval: int,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=keyframe_interval)
+        record(history, 10)
+        series = history.planet(
+            1,
+            ["health"],
+            start=START + timedelta(minutes=4),
+            end=START + timedelta(minutes=7),
+        )
+        assert list(series["health"]) == [1000000 - 100 * m for m in range(4, 8)]
+        assert series.datetimes() == [START + timedelta(minutes=m) for m in range(4, 8)]
+
+    def test_empty_range(
+        self,
+        tmp_path: Path,
+        record: Callable[[History, int], None],
+    ) -> None:
+        history = History(tmp_path)
+        record(history, 3)
+        series = history.war(start=START + timedelta(days=1))
+        assert len(series) == 0
+        assert len(History(tmp_path / "empty").war()) == 0
+
+
+class TestPersistence:
+    def test_reopen_and_append(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=4)
+        for minute in range(6):
+            history.record(
+                make_war(now=at(minute)), [make_planet(index=1, health=100 - minute)]
+            )
+        reopened = History(tmp_path, keyframe_interval=16)
+        assert reopened.keyframe_interval == 4
+        for minute in range(6, 10):
+            reopened.record(
+                make_war(now=at(minute)), [make_planet(index=1, health=100 - minute)]
+            )
+        assert list(History(tmp_path).planet(1)["health"]) == [
+            100 - m for m in range(10)
+        ]
+
+    def test_reopen_on_keyframe_boundary(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=2)
+        history.record(
+            make_war(now=at(0)),
+            [make_planet(index=1, health=100), make_planet(index=2, health=200)],
+        )
+        history.record(
+            make_war(now=at(1)),
+            [make_planet(index=1, health=110), make_planet(index=2, health=210)],
+        )
+        reopened = History(tmp_path)
+        reopened.record(make_war(now=at(2)), [make_planet(index=1, health=120)])
+        assert list(reopened.planet(1)["health"]) == [100, 110, 120]
+        assert list(reopened.planet(2)["health"]) == [200, 210, 210]
+
+    def test_interrupted_record_is_discarded(
+        self,
+        tmp_path: Path,
+        make_planet: Callable[..., Planet],
+        make_war: Callable[..., War],
+    ) -> None:
+        history = History(tmp_path, keyframe_interval=4)
+        for minute in range(5):
+            history.record(
+                make_war(now=at(minute)), [make_planet(index=1, health=100 - minute)]
+            )
+        # Column data of a sample whose time was never written.
+        with open(tmp_path / "planet.health.bin", "ab") as file:
+            file.write(b"\x01garbage")
+        reopened = History(tmp_path)
+        assert len(reopened) == 5
+        reopened.record(make_war(now=at(5)), [make_planet(index=1, health=42)])
+        assert list(reopened.planet(1)["health"]) == [100, 99, 98, 97, 96, 42]
+
+    def test_rejects_unknown_format(self, tmp_path: Path) -> None:
+        (tmp_path / "meta.json").write_text('{"version": 99}')
+        with pytest.raises(ValueError, match="Unsupported"):
+            History(tmp_path)
+        with pytest.raises(ValueError, match="positive"):
+            History(tmp_path / "other", keyframe_interval=0)
@@ -0,0 +1,353 @@
+"""Tests for Instrumentation hooks and OpenTelemetryHook."""
+
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.cache import ResponseCache
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.hooks import (
+    Instrumentation,
+    OpenTelemetryHook,
+    RequestStats,
+    trace_extension,
+)
+from helldivepy.ratelimit import RateLimiter
+from helldivepy.retry import RetryPolicy
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+def recording() -> tuple[Instrumentation, list[RequestStats]]:
+    recorded: list[RequestStats] = []
+    return Instrumentation(recorded.append), recorded
+
+
+class FakeSpan:
+    def __init__(
+        self, name: str, start_time: int | None, attributes: dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.start_time = start_time
+        self.attributes = dict(attributes)
+        self.exceptions: list[BaseException] = []
+        self.end_time: int | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self, end_time: int | None = None) -> None:
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    def start_span(
+        self, name: str, *, start_time: int | None = None, attributes: Any = None
+    ) -> FakeSpan:
+        span = FakeSpan(name, start_time, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+class TestRequestStats:
+    def test_uncached_call(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(instrumentation=instrumentation)
+        before = time.time()
+        war = client.war.get()
+        assert war.client_version == raw_war["clientVersion"]
+        (stats,) = recorded
+        assert stats.path == "/v1/war"
+        assert before <= stats.started_at <= time.time()
+        assert stats.status_code == 200
+        assert stats.attempts == 1
+        assert stats.cache is None
+        assert not stats.streamed
+        assert stats.error is None
+        assert stats.response_bytes == len(httpx.Response(200, json=raw_war).content)
+        assert stats.validate > 0
+        assert stats.decode == 0
+        phases = stats.ttfb + stats.download + stats.validate
+        assert 0 < phases <= stats.duration
+
+    def test_raw_results_are_decoded(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        instrumentation, recorded = recording()
+        HelldiveAPIClient(instrumentation=instrumentation).war.get_raw()
+        (stats,) = recorded
+        assert stats.decode > 0
+        assert stats.validate == 0
+
+    def test_bytes(self, respx_mock: respx.MockRouter, raw_war: dict[str, Any]) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        instrumentation, recorded = recording()
+        body = HelldiveAPIClient(instrumentation=instrumentation).war.get_bytes()
+        (stats,) = recorded
+        assert stats.response_bytes == len(body)
+        assert stats.decode == stats.validate == 0
+
+    def test_cache_outcomes(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war")
+        route.side_effect = [
+            httpx.Response(200, json=raw_war, headers={"ETag": '"v1"'}),
+            httpx.Response(304, headers={"ETag": '"v1"'}),
+        ]
+        instrumentation, recorded = recording()
+        cache = ResponseCache(ttl=60)
+        client = HelldiveAPIClient(cache=cache, instrumentation=instrumentation)
+        client.war.get()
+        client.war.get()
+        entry = cache.get(f"{BASE_URL}/v1/war")
+        assert entry is not None
+        entry.expires_at = 0
+        client.war.get()
+        assert [s.cache for s in recorded] == ["miss", "hit", "revalidated"]
+        assert [s.attempts for s in recorded] == [1, 0, 1]
+        assert [s.status_code for s in recorded] == [200, None, 304]
+        size = recorded[0].response_bytes
+        assert size > 0
+        assert [s.response_bytes for s in recorded] == [size] * 3
+        assert recorded[1].ttfb == recorded[1].download == 0
+
+    def test_retries(
+        self,
+        respx_mock: respx.MockRouter,
+        sleeps: list[float],
+        raw_war: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").side_effect = [
+            httpx.ConnectError("boom"),
+            httpx.Response(503),
+            httpx.Response(200, json=raw_war),
+        ]
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(
+            retry=RetryPolicy(max_attempts=3), instrumentation=instrumentation
+        )
+        client.war.get()
+        (stats,) = recorded
+        # The dropped connection never received headers.
+        assert stats.attempts == 2
+        assert stats.status_code == 200
+        assert stats.retry_wait >= 0
+        assert len(sleeps) == 2
+
+    def test_rate_limit_wait(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(
+            rate_limiter=RateLimiter(requests=1, per=0.05),
+            instrumentation=instrumentation,
+        )
+        client.war.get()
+        client.war.get()
+        assert recorded[0].rate_limit_wait < 0.04
+        assert recorded[1].rate_limit_wait >= 0.04
+        assert recorded[1].duration >= recorded[1].rate_limit_wait
+
+    def test_errors_are_recorded(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(return_value=httpx.Response(500))
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(instrumentation=instrumentation)
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            client.war.get()
+        (stats,) = recorded
+        assert stats.error is excinfo.value
+        assert stats.status_code == 500
+
+    def test_streamed(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict[str, Any],
+    ) -> None:
+        response = httpx.Response(200, json=[raw_planet] * 3)
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(return_value=response)
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(instrumentation=instrumentation)
+        planets = client.planets.iter_all()
+        next(planets)
+        assert recorded == []
+        assert len(list(planets)) == 2
+        (stats,) = recorded
+        assert stats.streamed
+        assert stats.attempts == 1
+        assert stats.status_code == 200
+        assert stats.response_bytes == len(response.content)
+        assert stats.decode > 0
+        assert stats.validate > 0
+        assert stats.error is None
+
+    def test_closed_stream_is_reported(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet] * 3)
+        )
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(instrumentation=instrumentation)
+        planets = client.planets.iter_all()
+        next(planets)
+        planets.close()
+        (stats,) = recorded
+        assert stats.error is None
+
+    def test_failed_stream(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(return_value=httpx.Response(503))
+        instrumentation, recorded = recording()
+        client = HelldiveAPIClient(instrumentation=instrumentation)
+        with pytest.raises(httpx.HTTPStatusError):
+            list(client.planets.iter_all())
+        (stats,) = recorded
+        assert isinstance(stats.error, httpx.HTTPStatusError)
+        assert stats.status_code == 503
+
+    def test_async(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+        raw_planet: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet] * 2)
+        )
+        instrumentation, recorded = recording()
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient(
+                cache=ResponseCache(ttl=60), instrumentation=instrumentation
+            ) as client:
+                await asyncio.gather(client.war.get(), client.planets.get_all())
+                await client.war.get()
+                assert len([p async for p in client.planets.iter_all()]) == 2
+
+        asyncio.run(run())
+        by_call = [(s.path, s.cache, s.streamed) for s in recorded]
+        assert sorted(by_call[:2]) == [
+            ("/v1/planets", "miss", False),
+            ("/v1/war", "miss", False),
+        ]
+        assert by_call[2:] == [("/v1/war", "hit", False), ("/v1/planets", None, True)]
+        assert all(s.validate > 0 for s in recorded)
+        assert [s.attempts for s in recorded] == [1, 1, 0, 1]
+
+    def test_send_options(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/old").mock(
+            return_value=httpx.Response(301, headers={"Location": "/api/v1/war"})
+        )
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        instrumentation, recorded = recording()
+        # Options `build_request()` does not take must still reach `send()`.
+        war = HelldiveAPIClient(instrumentation=instrumentation).war
+        assert war._get("/v1/old", follow_redirects=True) == raw_war  # pyright: ignore[reportPrivateUsage]
+
+        async def run() -> Any:
+            async with AsyncHelldiveAPIClient(instrumentation=instrumentation) as c:
+                return await c.war._get("/v1/old", follow_redirects=True)  # pyright: ignore[reportPrivateUsage]
+
+        assert asyncio.run(run()) == raw_war
+        assert [s.status_code for s in recorded] == [200, 200]
+
+    def test_no_instrumentation(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        client = HelldiveAPIClient()
+        assert client.instrumentation is None
+        client.war.get()
+        assert "trace" not in route.calls.last.request.extensions
+
+
+class TestTraceExtension:
+    def test_sums_connection_setup(self) -> None:
+        stats = RequestStats("/v1/war", time.time())
+        trace = trace_extension(stats)
+        trace("connection.connect_tcp.started", {})
+        time.sleep(0.01)
+        trace("connection.connect_tcp.complete", {})
+        trace("connection.start_tls.started", {})
+        trace("connection.start_tls.complete", {})
+        trace("http11.send_request_headers.started", {})
+        time.sleep(0.01)
+        trace("http11.send_request_headers.complete", {})
+        assert 0.01 <= stats.connect < 0.02
+
+
+class TestOpenTelemetryHook:
+    def test_span(self, respx_mock: respx.MockRouter, raw_war: dict[str, Any]) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        tracer = FakeTracer()
+        instrumentation = Instrumentation(OpenTelemetryHook(tracer))
+        HelldiveAPIClient(instrumentation=instrumentation).war.get()
+        (span,) = tracer.spans
+        assert span.name == "GET /v1/war"
+        assert span.start_time is not None
+        assert span.end_time is not None and span.end_time >= span.start_time
+        assert span.attributes["url.path"] == "/v1/war"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["helldivepy.attempts"] == 1
+        assert span.attributes["helldivepy.validate"] > 0
+        assert "helldivepy.cache" not in span.attributes
+        assert span.exceptions == []
+
+    def test_error(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(return_value=httpx.Response(404))
+        tracer = FakeTracer()
+        instrumentation = Instrumentation()
+        instrumentation.add_hook(OpenTelemetryHook(tracer))
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            HelldiveAPIClient(instrumentation=instrumentation).war.get()
+        (span,) = tracer.spans
+        assert span.attributes["error.type"] == "HTTPStatusError"
+        assert span.exceptions == [excinfo.value]
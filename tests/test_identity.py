@@ -0,0 +1,83 @@
+"""Tests for IdentityMap planet/biome/hazard interning."""
+
+import httpx
+import respx
+
+from helldivepy.client import HelldiveAPIClient
+from helldivepy.identity import IdentityMap
+from helldivepy.models import Planet
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+class TestIdentityMap:
+    def test_equal_planets_are_interned(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        identity_map = IdentityMap()
+        first = identity_map.planet(Planet.model_validate(raw_planet))
+        second = identity_map.planet(Planet.model_validate(raw_planet))
+        assert first is second
+        assert identity_map.get(42) is first
+
+    def test_changed_planet_replaces_canonical_instance(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        identity_map = IdentityMap()
+        first = identity_map.planet(Planet.model_validate(raw_planet))
+        changed = identity_map.planet(
+            Planet.model_validate({**raw_planet, "health": 1})
+        )
+        assert changed is not first
+        assert identity_map.get(42) is changed
+        assert changed.biome is first.biome
+        assert changed.hazards[0] is first.hazards[0]
+
+    def test_biomes_shared_across_planets(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        identity_map = IdentityMap()
+        a = identity_map.planet(Planet.model_validate(raw_planet))
+        b = identity_map.planet(Planet.model_validate({**raw_planet, "index": 7}))
+        assert a is not b
+        assert a.biome is b.biome
+
+    def test_client_interns_across_modules(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+        raw_campaign: dict,  # type: ignore[type-arg]
+        raw_spacestation: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet])
+        )
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, json=[raw_campaign])
+        )
+        respx_mock.get(f"{BASE_URL}/v2/space-stations").mock(
+            return_value=httpx.Response(200, json=[raw_spacestation])
+        )
+        client = HelldiveAPIClient(identity_map=IdentityMap())
+        planet = client.planets.get_all()[0]
+        assert client.campaigns.get_all()[0].planet is planet
+        # The station's planet has different regions, so it is not interned...
+        station_planet = client.space_stations.get_all()[0].planet
+        assert station_planet is not planet
+        # ...but still shares the biome.
+        assert station_planet.biome is planet.biome
+
+    def test_disabled_by_default(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet])
+        )
+        client = HelldiveAPIClient()
+        assert client.identity_map is None
+        assert client.planets.get_all()[0] is not client.planets.get_all()[0]
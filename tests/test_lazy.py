@@ -0,0 +1,178 @@
+"""Tests for lazily validated models."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+from pydantic import TypeAdapter, ValidationError
+
+from helldivepy.cache import ResponseCache
+from helldivepy.client import HelldiveAPIClient
+from helldivepy.enums import CampaignType, Factions
+from helldivepy.lazy import LazyCampaign, LazyPlanet, lazy_context, validate_json
+from helldivepy.models import Campaign, Planet, Region
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+class TestLazyPlanet:
+    def test_top_level_fields(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        planet = LazyPlanet.model_validate(raw_planet)
+        assert planet.index == 42
+        assert planet.current_owner == Factions.Terminids
+        assert planet.waypoints == [10, 20]
+
+    def test_nested_fields_validated_on_access_and_cached(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+        raw_region: dict,  # type: ignore[type-arg]
+    ) -> None:
+        planet = LazyPlanet.model_validate({**raw_planet, "regions": [raw_region]})
+        assert planet.regions[0].name == "TEST REGION"
+        assert isinstance(planet.regions[0], Region)
+        assert planet.regions is planet.regions
+        assert planet.statistics.player_count == 5000
+        assert planet.position.x == 0.5
+        assert planet.biome.name == "Scorched"
+        assert planet.hazards[0].name == "Fire Tornadoes"
+        assert planet.event is None
+
+    def test_nested_errors_surface_on_access(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        planet = LazyPlanet.model_validate({**raw_planet, "position": {"x": "?"}})
+        with pytest.raises(ValidationError):
+            _ = planet.position
+
+    def test_to_planet_matches_eager_model(
+        self,
+        raw_planet_with_event: dict,  # type: ignore[type-arg]
+    ) -> None:
+        planet = LazyPlanet.model_validate(raw_planet_with_event)
+        assert planet.to_planet() == Planet.model_validate(raw_planet_with_event)
+        assert planet.event
+        assert planet.event.id == 99
+
+    def test_json_body_decoded_once_on_first_nested_access(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        raw_planet: dict,  # type: ignore[type-arg]
+        raw_region: dict,  # type: ignore[type-arg]
+    ) -> None:
+        body = json.dumps(
+            [raw_planet, {**raw_planet, "index": 7, "regions": [raw_region]}]
+        )
+        decoded: list[Any] = []
+        decode = json.loads
+
+        def loads(content: str | bytes) -> Any:
+            decoded.append(content)
+            return decode(content)
+
+        planets = validate_json(TypeAdapter(list[LazyPlanet]), body)
+        monkeypatch.setattr("helldivepy.lazy.json.loads", loads)
+        assert [p.index for p in planets] == [42, 7]
+        assert decoded == []
+        assert planets[1].regions[0].name == "TEST REGION"
+        assert planets[0].regions == []
+        assert planets[0].statistics.player_count == 5000
+        assert decoded == [body]
+
+    def test_validated_without_payload(
+        self,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        adapter = TypeAdapter(list[LazyPlanet])
+        with pytest.raises(ValidationError, match="lazy_context"):
+            adapter.validate_python([raw_planet])
+        (planet,) = adapter.validate_python(
+            [raw_planet], context=lazy_context([raw_planet])
+        )
+        assert planet.position.x == 0.5
+        assert planet.to_planet() == Planet.model_validate(raw_planet)
+
+    def test_equality_ignores_payload(
+        self,
+        raw_planet: dict[str, Any],
+    ) -> None:
+        body = json.dumps(raw_planet)
+        planet = LazyPlanet.model_validate_json(body)
+        assert planet == LazyPlanet.model_validate_json(body)
+        assert planet == LazyPlanet.model_validate(raw_planet)
+        _ = planet.statistics
+        assert planet == LazyPlanet.model_validate(raw_planet)
+        changed: dict[str, Any] = {
+            **raw_planet,
+            "statistics": {**raw_planet["statistics"], "playerCount": 1},
+        }
+        assert planet != LazyPlanet.model_validate(changed)
+
+    def test_constructed_directly(
+        self,
+        raw_planet: dict[str, Any],
+    ) -> None:
+        planet = LazyPlanet(**raw_planet)
+        assert planet.position.x == 0.5
+        assert planet == LazyPlanet.model_validate(raw_planet)
+        constructed = LazyPlanet.model_construct(**raw_planet)
+        assert constructed.statistics.player_count == 5000
+
+    def test_rejects_nested_containers(
+        self,
+        raw_planet: dict[str, Any],
+    ) -> None:
+        payload: dict[str, Any] = {"a": raw_planet}
+        adapter = TypeAdapter(dict[str, LazyPlanet])
+        planets = adapter.validate_python(payload, context=lazy_context(payload))
+        with pytest.raises(ValueError, match="top-level list"):
+            _ = planets["a"].position
+
+
+class TestLazyCampaign:
+    def test_fields_and_lazy_planet(
+        self,
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        campaign = LazyCampaign.model_validate(raw_campaign)
+        assert campaign.type == CampaignType.LIBERATION
+        assert isinstance(campaign.planet, LazyPlanet)
+        assert campaign.planet.name == "HELLMIRE"
+        assert campaign.to_campaign() == Campaign.model_validate(raw_campaign)
+
+
+class TestLazyModules:
+    def test_get_all_lazy(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet])
+        )
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, json=[raw_campaign])
+        )
+        client = HelldiveAPIClient()
+        assert isinstance(client.planets.get_all_lazy()[0], LazyPlanet)
+        assert client.campaigns.get_all_lazy()[0].planet.index == 42
+
+    def test_cached(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, json=[raw_campaign, raw_campaign])
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=60))
+        first = client.campaigns.get_all_lazy()
+        assert client.campaigns.get_all_lazy()[0] is first[0]
+        assert [c.planet.name for c in first] == ["HELLMIRE"] * 2
+        assert first[1].to_campaign() == Campaign.model_validate(raw_campaign)
@@ -1,10 +1,13 @@
 """Tests for helldivepy modules using respx HTTP mocking."""
 
+import asyncio
+from collections.abc import Awaitable
+
 import httpx
 import pytest
 import respx
 
-from helldivepy.client import HelldiveAPIClient
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
 from helldivepy.models import (
     Assignment,
     Campaign,
@@ -435,3 +438,174 @@ class TestSteamModule:
         )
         with pytest.raises(httpx.HTTPStatusError):
             client.steam.get("123456")
+
+
+# ---------------------------------------------------------------------------
+# Async modules
+# ---------------------------------------------------------------------------
+
+
+class TestAsyncModules:
+    def test_war_get(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+
+        async def run() -> War:
+            async with AsyncHelldiveAPIClient() as client:
+                return await client.war.get()
+
+        result = asyncio.run(run())
+        assert isinstance(result, War)
+        assert route.calls.last.request.headers["X-Super-Client"] == "helldivepy"
+
+    @pytest.mark.parametrize(
+        ("attr", "path", "fixture", "model"),
+        [
+            ("planets", "/v1/planets", "raw_planet", Planet),
+            ("campaigns", "/v1/campaigns", "raw_campaign", Campaign),
+            ("assignments", "/v1/assignments", "raw_assignment", Assignment),
+            ("dispatches", "/v2/dispatches", "raw_dispatch", Dispatch),
+            ("space_stations", "/v2/space-stations", "raw_spacestation", SpaceStation),
+            ("steam", "/v1/steam", "raw_steam_news", SteamNews),
+        ],
+    )
+    def test_get_all_and_get(
+        self,
+        respx_mock: respx.MockRouter,
+        request: pytest.FixtureRequest,
+        attr: str,
+        path: str,
+        fixture: str,
+        model: type,
+    ) -> None:
+        raw = request.getfixturevalue(fixture)
+        respx_mock.get(f"{BASE_URL}{path}").mock(
+            return_value=httpx.Response(200, json=[raw])
+        )
+        respx_mock.get(f"{BASE_URL}{path}/1").mock(
+            return_value=httpx.Response(200, json=raw)
+        )
+        respx_mock.get(f"{BASE_URL}{path}/999").mock(return_value=httpx.Response(404))
+
+        async def run() -> tuple[object, object, object]:
+            async with AsyncHelldiveAPIClient() as client:
+                module = getattr(client, attr)
+                calls: list[Awaitable[object]] = [
+                    module.get_all(),
+                    module.get(1),
+                    module.get(999),
+                ]
+                all_items, one, missing = await asyncio.gather(*calls)
+                return all_items, one, missing
+
+        all_items, one, missing = asyncio.run(run())
+        assert isinstance(all_items, list)
+        assert isinstance(all_items[0], model)
+        assert isinstance(one, model)
+        assert missing is None
+
+    def test_get_reraises_non_404_errors(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets/1").mock(
+            return_value=httpx.Response(503)
+        )
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient() as client:
+                await client.planets.get(1)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+    def test_get_events(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet_with_event: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planet-events").mock(
+            return_value=httpx.Response(200, json=[raw_planet_with_event])
+        )
+
+        async def run() -> list[Planet]:
+            async with AsyncHelldiveAPIClient() as client:
+                return await client.planets.get_events()
+
+        result = asyncio.run(run())
+        assert result[0].event
+        assert result[0].event.id == 99
+
+
+# ---------------------------------------------------------------------------
+# get_many
+# ---------------------------------------------------------------------------
+
+
+class TestGetMany:
+    def test_fans_out_in_input_order(
+        self,
+        client: HelldiveAPIClient,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        for index in (1, 2):
+            respx_mock.get(f"{BASE_URL}/v1/planets/{index}").mock(
+                return_value=httpx.Response(200, json={**raw_planet, "index": index})
+            )
+        missing = respx_mock.get(f"{BASE_URL}/v1/planets/999").mock(
+            return_value=httpx.Response(404)
+        )
+        result = client.planets.get_many([2, 999, 1, 2])
+        assert [p.index if p else None for p in result] == [2, None, 1, 2]
+        assert missing.call_count == 1
+
+    def test_switches_to_get_all_above_threshold(
+        self,
+        client: HelldiveAPIClient,
+        respx_mock: respx.MockRouter,
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, json=[raw_campaign])
+        )
+        result = client.campaigns.get_many([7, 5], bulk_threshold=2)
+        assert route.call_count == 1
+        assert result[0] is None
+        assert isinstance(result[1], Campaign)
+
+    def test_empty_input(self, client: HelldiveAPIClient) -> None:
+        assert client.steam.get_many([]) == []
+
+    def test_reraises_non_404_errors(
+        self, client: HelldiveAPIClient, respx_mock: respx.MockRouter
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v2/dispatches/1").mock(
+            return_value=httpx.Response(500)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            client.dispatches.get_many([1])
+
+    def test_async_fans_out_in_input_order(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_assignment: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/assignments/9001").mock(
+            return_value=httpx.Response(200, json=raw_assignment)
+        )
+        respx_mock.get(f"{BASE_URL}/v1/assignments/1").mock(
+            return_value=httpx.Response(404)
+        )
+
+        async def run() -> list[Assignment | None]:
+            async with AsyncHelldiveAPIClient() as client:
+                return await client.assignments.get_many(
+                    [1, 9001], max_concurrency=1, bulk_threshold=None
+                )
+
+        result = asyncio.run(run())
+        assert result[0] is None
+        assert isinstance(result[1], Assignment)
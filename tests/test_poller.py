@@ -0,0 +1,283 @@
+"""Tests for the change poller."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.poller import AsyncPoller, Poller, Update
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+def mock_sequence(
+    respx_mock: respx.MockRouter, path: str, bodies: list[object]
+) -> respx.Route:
+    return respx_mock.get(f"{BASE_URL}{path}").mock(
+        side_effect=[httpx.Response(200, json=body) for body in bodies]
+    )
+
+
+@pytest.fixture
+def second_dispatch(raw_dispatch: dict[str, Any]) -> dict[str, Any]:
+    return {**raw_dispatch, "id": 2, "message": "Second"}
+
+
+class TestChanges:
+    def test_first_poll_emits_everything(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+    ) -> None:
+        mock_sequence(respx_mock, "/v2/dispatches", [[raw_dispatch]])
+        poller = HelldiveAPIClient().poller({"dispatches": 60})
+        update = poller.poll("dispatches")
+        assert update is not None
+        assert update.resource == "dispatches"
+        assert [d.id for d in update.changed] == [1]
+        assert update.removed == ()
+
+    def test_emits_only_changes(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+        second_dispatch: dict[str, Any],
+    ) -> None:
+        edited = {**raw_dispatch, "message": "Edited"}
+        mock_sequence(
+            respx_mock,
+            "/v2/dispatches",
+            [
+                [raw_dispatch],
+                [raw_dispatch],
+                [edited, second_dispatch],
+                [second_dispatch],
+            ],
+        )
+        poller = HelldiveAPIClient().poller({"dispatches": 60})
+        poller.poll("dispatches")
+        assert poller.poll("dispatches") is None
+        update = poller.poll("dispatches")
+        assert update is not None
+        assert [d.id for d in update.changed] == [1, 2]
+        update = poller.poll("dispatches")
+        assert update is not None
+        assert update.changed == ()
+        assert [d.message for d in update.removed] == ["Edited"]
+
+    def test_war_ignores_server_time(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict[str, Any],
+    ) -> None:
+        later = {**raw_war, "now": "2030-01-01T00:00:00Z"}
+        mock_sequence(respx_mock, "/v1/war", [raw_war, later])
+        poller = HelldiveAPIClient().poller({"war": 10})
+        assert poller.poll("war") is not None
+        assert poller.poll("war") is None
+
+    def test_unknown_resource(self) -> None:
+        with pytest.raises(ValueError, match="bogus"):
+            HelldiveAPIClient().poller({"bogus": 1})
+        poller = HelldiveAPIClient().poller({"war": 10})
+        assert poller.resources == ["war"]
+        with pytest.raises(ValueError, match="not polled"):
+            poller.on("planets", print)
+
+
+class TestSchedule:
+    def test_backs_off_while_unchanged(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+        second_dispatch: dict[str, Any],
+    ) -> None:
+        mock_sequence(
+            respx_mock,
+            "/v2/dispatches",
+            [
+                [raw_dispatch],
+                [raw_dispatch],
+                [raw_dispatch],
+                [raw_dispatch],
+                [second_dispatch],
+            ],
+        )
+        poller = Poller(
+            HelldiveAPIClient(),
+            {"dispatches": 10},
+            min_interval=5,
+            max_interval=30,
+            backoff=2,
+        )
+        expected = [10, 20, 30, 30, 10]
+        for interval in expected:
+            poller.poll("dispatches")
+            assert poller.next_poll("dispatches") == pytest.approx(interval, abs=0.5)
+
+    def test_failed_poll_backs_off(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            return_value=httpx.Response(503)
+        )
+        poller = HelldiveAPIClient().poller({"dispatches": 10}, backoff=2)
+        for interval in (20, 40):
+            with pytest.raises(httpx.HTTPStatusError):
+                poller.poll("dispatches")
+            assert poller.next_poll("dispatches") == pytest.approx(interval, abs=0.5)
+
+    def test_min_interval_applies_to_base(self) -> None:
+        poller = HelldiveAPIClient().poller({"planets": 1}, min_interval=5)
+        schedule = poller._schedules["planets"]  # pyright: ignore[reportPrivateUsage]
+        assert schedule.interval == 5
+
+    def test_tightens_around_event_end(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_event: dict[str, Any],
+        raw_planet: dict[str, Any],
+    ) -> None:
+        end = datetime.now(UTC) + timedelta(seconds=30)
+        event = {**raw_event, "endTime": end.isoformat()}
+        mock_sequence(respx_mock, "/v1/planets", [[{**raw_planet, "event": event}]])
+        poller = HelldiveAPIClient().poller({"planets": 120})
+        poller.poll("planets")
+        assert poller.next_poll("planets") == pytest.approx(31, abs=1)
+
+    def test_past_deadlines_are_ignored(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_event: dict[str, Any],
+        raw_planet: dict[str, Any],
+    ) -> None:
+        mock_sequence(respx_mock, "/v1/planets", [[{**raw_planet, "event": raw_event}]])
+        poller = HelldiveAPIClient().poller({"planets": 120})
+        poller.poll("planets")
+        assert poller.next_poll("planets") == pytest.approx(120, abs=1)
+
+
+class TestRun:
+    def test_iterates_until_stopped(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+        second_dispatch: dict[str, Any],
+    ) -> None:
+        mock_sequence(
+            respx_mock,
+            "/v2/dispatches",
+            [[raw_dispatch], [raw_dispatch], [raw_dispatch, second_dispatch]],
+        )
+        poller = HelldiveAPIClient().poller({"dispatches": 0}, min_interval=0)
+        updates: list[Update] = []
+        for update in poller:
+            updates.append(update)
+            if len(updates) == 2:
+                poller.stop()
+        assert [[d.id for d in u.changed] for u in updates] == [[1], [2]]
+
+    def test_run_dispatches_callbacks(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+    ) -> None:
+        mock_sequence(respx_mock, "/v2/dispatches", [[raw_dispatch]])
+        poller = HelldiveAPIClient().poller({"dispatches": 0}, min_interval=0)
+        seen: list[Update] = []
+
+        def callback(update: Update) -> None:
+            seen.append(update)
+            poller.stop()
+
+        poller.on("dispatches", callback)
+        poller.run()
+        assert len(seen) == 1
+
+    def test_failed_poll_keeps_polling(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+        second_dispatch: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            side_effect=[
+                httpx.Response(200, json=[raw_dispatch]),
+                httpx.Response(503),
+                httpx.ConnectError("boom"),
+                httpx.Response(200, json=[raw_dispatch, second_dispatch]),
+            ]
+        )
+        poller = HelldiveAPIClient().poller({"dispatches": 0}, min_interval=0)
+        errors: list[tuple[str, httpx.HTTPError]] = []
+        poller.on_error(lambda resource, error: errors.append((resource, error)))
+        updates: list[Update] = []
+        for update in poller:
+            updates.append(update)
+            if len(updates) == 2:
+                poller.stop()
+        assert [[d.id for d in u.changed] for u in updates] == [[1], [2]]
+        assert [resource for resource, _ in errors] == ["dispatches"] * 2
+        assert isinstance(errors[0][1], httpx.HTTPStatusError)
+        assert isinstance(errors[1][1], httpx.ConnectError)
+
+    def test_async_failed_poll_keeps_polling(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            side_effect=[
+                httpx.Response(503),
+                httpx.Response(200, json=[raw_dispatch]),
+            ]
+        )
+        errors: list[str] = []
+
+        async def run() -> list[Update]:
+            async with AsyncHelldiveAPIClient() as client:
+                poller = client.poller({"dispatches": 0}, min_interval=0)
+
+                async def on_error(resource: str, error: httpx.HTTPError) -> None:
+                    errors.append(resource)
+
+                poller.on_error(on_error)
+                async for update in poller:
+                    poller.stop()
+                    return [update]
+            return []
+
+        updates = asyncio.run(run())
+        assert [[d.id for d in u.changed] for u in updates] == [[1]]
+        assert errors == ["dispatches"]
+
+    def test_async_poller(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict[str, Any],
+        second_dispatch: dict[str, Any],
+    ) -> None:
+        mock_sequence(
+            respx_mock,
+            "/v2/dispatches",
+            [[raw_dispatch], [raw_dispatch, second_dispatch]],
+        )
+        seen: list[Update] = []
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient() as client:
+                poller = client.poller({"dispatches": 0}, min_interval=0)
+                assert isinstance(poller, AsyncPoller)
+
+                async def callback(update: Update) -> None:
+                    seen.append(update)
+                    if len(seen) == 2:
+                        poller.stop()
+
+                poller.on("dispatches", callback)
+                await poller.run()
+
+        asyncio.run(run())
+        assert [[d.id for d in u.changed] for u in seen] == [[1], [2]]
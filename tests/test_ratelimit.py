@@ -0,0 +1,78 @@
+"""Tests for the client-side RateLimiter."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.ratelimit import RateLimiter
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+class TestRateLimiter:
+    def test_burst_then_waits(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=5, per=10.0, burst=2)
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(2.0, abs=0.05)
+        assert sleeps == [pytest.approx(2.0, abs=0.05)]
+
+    def test_waiters_are_spaced_out(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=1, per=1.0)
+        limiter.acquire()
+        waits = [limiter.acquire() for _ in range(3)]
+        assert waits == [pytest.approx(n, abs=0.05) for n in (1, 2, 3)]
+
+    def test_shared_between_threads(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=10, per=1.0)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Ten go immediately, the other ten are queued 0.1s apart.
+        assert len(sleeps) == 10
+        assert max(sleeps) == pytest.approx(1.0, abs=0.05)
+
+    def test_remaining_header_drains_bucket(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=5, per=10.0)
+        limiter.update(httpx.Response(200, headers={"X-RateLimit-Remaining": "0"}))
+        assert limiter.acquire() == pytest.approx(2.0, abs=0.05)
+
+    def test_retry_after_pauses_callers(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=5, per=10.0)
+        limiter.update(httpx.Response(429, headers={"Retry-After": "6"}))
+        assert limiter.acquire() == pytest.approx(6.0, abs=0.05)
+
+    def test_async_acquire(self, sleeps: list[float]) -> None:
+        limiter = RateLimiter(requests=1, per=1.0)
+
+        async def run() -> list[float]:
+            return list(await asyncio.gather(*(limiter.acquire_async() for _ in "ab")))
+
+        assert asyncio.run(run()) == [0, pytest.approx(1.0, abs=0.05)]
+
+
+class TestRateLimitedModules:
+    def test_sync_and_async_clients_share_limiter(
+        self,
+        respx_mock: respx.MockRouter,
+        sleeps: list[float],
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        limiter = RateLimiter(requests=1, per=1.0)
+        HelldiveAPIClient(rate_limiter=limiter).war.get()
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient(rate_limiter=limiter) as client:
+                await client.war.get()
+
+        asyncio.run(run())
+        assert sleeps == [pytest.approx(1.0, abs=0.05)]
@@ -0,0 +1,113 @@
+"""Tests for the raw (unvalidated) and bytes passthrough APIs."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from helldivepy import raw
+from helldivepy.cache import ResponseCache
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+@pytest.mark.parametrize(
+    ("typed_dict", "fixture"),
+    [
+        (raw.RawStatistics, "raw_statistics"),
+        (raw.RawWar, "raw_war"),
+        (raw.RawDispatch, "raw_dispatch"),
+        (raw.RawRegion, "raw_region"),
+        (raw.RawEvent, "raw_event"),
+        (raw.RawPlanet, "raw_planet"),
+        (raw.RawCampaign, "raw_campaign"),
+        (raw.RawTask, "raw_kill_task"),
+        (raw.RawAssignment, "raw_assignment"),
+        (raw.RawCost, "raw_cost"),
+        (raw.RawTacticalAction, "raw_tactical_action"),
+        (raw.RawSpaceStation, "raw_spacestation"),
+        (raw.RawSteamNews, "raw_steam_news"),
+    ],
+)
+def test_typed_dict_keys_match_payloads(
+    request: pytest.FixtureRequest, typed_dict: type, fixture: str
+) -> None:
+    payload: dict[str, object] = request.getfixturevalue(fixture)
+    assert set(typed_dict.__annotations__) == set(payload)
+
+
+class TestRawModules:
+    def test_get_all_raw_returns_dicts(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, json=[raw_planet])
+        )
+        assert HelldiveAPIClient().planets.get_all_raw() == [raw_planet]
+
+    def test_get_raw_returns_none_on_404(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/steam/999").mock(
+            return_value=httpx.Response(404)
+        )
+        assert HelldiveAPIClient().steam.get_raw("999") is None
+
+    def test_war_get_raw(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        assert HelldiveAPIClient().war.get_raw()["clientVersion"] == "1.0.0"
+
+    def test_get_all_bytes_is_the_body(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_dispatch: dict,  # type: ignore[type-arg]
+    ) -> None:
+        body = json.dumps([raw_dispatch]).encode()
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+        assert HelldiveAPIClient().dispatches.get_all_bytes() == body
+
+    def test_bytes_served_from_cache(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            return_value=httpx.Response(200, json=raw_war)
+        )
+        client = HelldiveAPIClient(cache=ResponseCache(ttl=60))
+        war = client.war.get()
+        assert json.loads(client.war.get_bytes()) == raw_war
+        assert client.war.get_raw()["now"] == raw_war["now"]
+        assert war.client_version == "1.0.0"
+        assert route.call_count == 1
+
+    def test_async_raw(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, json=[raw_campaign])
+        )
+
+        async def run() -> tuple[list[raw.RawCampaign], bytes]:
+            async with AsyncHelldiveAPIClient() as client:
+                return (
+                    await client.campaigns.get_all_raw(),
+                    await client.campaigns.get_all_bytes(),
+                )
+
+        items, body = asyncio.run(run())
+        assert items == [raw_campaign]
+        assert json.loads(body) == [raw_campaign]
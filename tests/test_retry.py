@@ -0,0 +1,118 @@
+"""Tests for RetryPolicy and retrying module requests."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.models import War
+from helldivepy.retry import RetryPolicy
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+class TestRetryPolicy:
+    def test_should_retry_statuses_until_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=3)
+        assert policy.should_retry(1, httpx.Response(429))
+        assert policy.should_retry(2, httpx.Response(503))
+        assert not policy.should_retry(3, httpx.Response(503))
+        assert not policy.should_retry(1, httpx.Response(404))
+        assert not policy.should_retry(1, httpx.Response(200))
+
+    def test_should_retry_network_errors(self) -> None:
+        error = httpx.ConnectError("boom")
+        assert RetryPolicy().should_retry(1, error=error)
+        assert not RetryPolicy(retry_network_errors=False).should_retry(1, error=error)
+
+    def test_delay_is_capped_full_jitter(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=4.0)
+        for attempt in range(1, 10):
+            assert 0 <= policy.delay(attempt) <= min(4.0, 2 ** (attempt - 1))
+
+    def test_delay_honors_retry_after(self) -> None:
+        policy = RetryPolicy(backoff_base=0.01)
+        response = httpx.Response(429, headers={"Retry-After": "7"})
+        assert policy.delay(1, response) == 7
+
+    def test_delay_honors_rate_limit_reset(self) -> None:
+        policy = RetryPolicy(backoff_base=0.01)
+        response = httpx.Response(
+            429, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+        )
+        assert policy.delay(1, response) == 3
+
+
+class TestRetryingModules:
+    def test_retries_rate_limited_request(
+        self,
+        respx_mock: respx.MockRouter,
+        sleeps: list[float],
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "2"}),
+                httpx.Response(200, json=raw_war),
+            ]
+        )
+        client = HelldiveAPIClient(retry=RetryPolicy())
+        assert isinstance(client.war.get(), War)
+        assert route.call_count == 2
+        assert sleeps == [2]
+
+    def test_gives_up_after_max_attempts(
+        self, respx_mock: respx.MockRouter, sleeps: list[float]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/planets/1").mock(
+            return_value=httpx.Response(503)
+        )
+        client = HelldiveAPIClient(retry=RetryPolicy(max_attempts=3))
+        with pytest.raises(httpx.HTTPStatusError):
+            client.planets.get(1)
+        assert route.call_count == 3
+        assert len(sleeps) == 2
+
+    def test_404_is_not_retried(
+        self, respx_mock: respx.MockRouter, sleeps: list[float]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/planets/999").mock(
+            return_value=httpx.Response(404)
+        )
+        client = HelldiveAPIClient(retry=RetryPolicy())
+        assert client.planets.get(999) is None
+        assert route.call_count == 1
+        assert sleeps == []
+
+    def test_retries_network_errors(
+        self,
+        respx_mock: respx.MockRouter,
+        sleeps: list[float],
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            side_effect=[httpx.ConnectError("boom"), httpx.Response(200, json=raw_war)]
+        )
+        client = HelldiveAPIClient(retry=RetryPolicy())
+        assert isinstance(client.war.get(), War)
+        assert len(sleeps) == 1
+
+    def test_async_retries(
+        self,
+        respx_mock: respx.MockRouter,
+        sleeps: list[float],
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(
+            side_effect=[httpx.Response(502), httpx.Response(200, json=raw_war)]
+        )
+
+        async def run() -> War:
+            async with AsyncHelldiveAPIClient(retry=RetryPolicy()) as client:
+                return await client.war.get()
+
+        assert isinstance(asyncio.run(run()), War)
+        assert route.call_count == 2
+        assert len(sleeps) == 1
@@ -0,0 +1,269 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.cache import ResponseCache, SQLiteCache
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.models import War
+from helldivepy.singleflight import SingleFlight
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+def run_concurrently(count: int, fn: object) -> list[object]:
+    results: list[object] = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(i: int) -> None:
+        barrier.wait()
+        results[i] = fn()  # type: ignore[operator]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight:
+    def test_do_coalesces_concurrent_calls(self) -> None:
+        flight = SingleFlight()
+        calls: list[int] = []
+
+        def slow() -> int:
+            calls.append(1)
+            time.sleep(0.2)
+            return 42
+
+        results = run_concurrently(8, lambda: flight.do("key", slow))
+        assert results == [42] * 8
+        assert len(calls) == 1
+        assert flight.do("key", lambda: 7) == 7
+
+    def test_do_shares_errors(self) -> None:
+        flight = SingleFlight()
+
+        def failing() -> None:
+            time.sleep(0.1)
+            raise RuntimeError("boom")
+
+        def call() -> object:
+            try:
+                flight.do("key", failing)
+            except RuntimeError as e:
+                return str(e)
+            return None
+
+        assert run_concurrently(4, call) == ["boom"] * 4
+
+    def test_do_async_coalesces(self) -> None:
+        flight = SingleFlight()
+        calls: list[int] = []
+
+        async def slow() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def run() -> list[int]:
+            return await asyncio.gather(*(flight.do_async("k", slow) for _ in range(5)))
+
+        assert asyncio.run(run()) == [42] * 5
+        assert len(calls) == 1
+
+    def test_do_async_survives_leader_cancellation(self) -> None:
+        flight = SingleFlight()
+        calls: list[int] = []
+
+        async def slow() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def run() -> int:
+            leader = asyncio.create_task(flight.do_async("k", slow))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do_async("k", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(run()) == 42
+        assert len(calls) == 1
+
+    def test_do_async_cancels_call_without_callers(self) -> None:
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def slow() -> int:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return 42
+
+        async def fast() -> int:
+            return 7
+
+        async def run() -> int:
+            callers = [asyncio.create_task(flight.do_async("k", slow)) for _ in "ab"]
+            await asyncio.sleep(0)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.wait_for(cancelled.wait(), 1)
+            return await flight.do_async("k", fast)
+
+        assert asyncio.run(run()) == 7
+
+    def test_do_async_does_not_join_a_cancelled_call(self) -> None:
+        flight = SingleFlight()
+
+        async def slow() -> int:
+            await asyncio.sleep(10)
+            return 42
+
+        async def fast() -> int:
+            return 7
+
+        async def run() -> int:
+            caller = asyncio.create_task(flight.do_async("k", slow))
+            await asyncio.sleep(0)
+            caller.cancel()
+            await asyncio.sleep(0)
+            return await flight.do_async("k", fast)
+
+        assert asyncio.run(run()) == 7
+
+    def test_lock_without_dir_is_noop(self) -> None:
+        with SingleFlight().lock("key"):
+            pass
+
+
+class TestCoalescedModules:
+    def test_uncached_requests_share_one_call(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            return httpx.Response(200, json=raw_war)
+
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(side_effect=slow)
+        client = HelldiveAPIClient(single_flight=SingleFlight())
+        results = run_concurrently(6, client.war.get)
+        assert route.call_count == 1
+        assert all(r == results[0] for r in results)
+
+    def test_cached_requests_share_one_refresh(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            return httpx.Response(200, json=raw_war)
+
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(side_effect=slow)
+        client = HelldiveAPIClient(
+            cache=ResponseCache(ttl=60), single_flight=SingleFlight()
+        )
+        results = run_concurrently(6, client.war.get)
+        assert route.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_shared_between_cached_and_uncached_clients(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        def slow(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            return httpx.Response(200, json=raw_war)
+
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(side_effect=slow)
+        flight = SingleFlight()
+        cached = HelldiveAPIClient(cache=ResponseCache(ttl=60), single_flight=flight)
+        uncached = HelldiveAPIClient(single_flight=flight)
+        calls = [cached.war.get, uncached.war.get_raw] * 3
+        results = run_concurrently(len(calls), lambda: calls.pop()())
+        assert all(isinstance(r, War | dict) for r in results)
+
+    def test_errors_are_shared_and_not_cached(
+        self, respx_mock: respx.MockRouter
+    ) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/war").mock(return_value=httpx.Response(503))
+        client = HelldiveAPIClient(single_flight=SingleFlight())
+        with pytest.raises(httpx.HTTPStatusError):
+            client.war.get()
+
+    def test_async_requests_share_one_call(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_war: dict,  # type: ignore[type-arg]
+    ) -> None:
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=raw_war)
+
+        route = respx_mock.get(f"{BASE_URL}/v1/war").mock(side_effect=slow)
+
+        async def run() -> None:
+            async with AsyncHelldiveAPIClient(single_flight=SingleFlight()) as client:
+                await asyncio.gather(*(client.war.get() for _ in range(5)))
+
+        asyncio.run(run())
+        assert route.call_count == 1
+
+
+def _worker(cache_path: str, lock_dir: str, log: str, body: bytes) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        with open(log, "a") as file:
+            file.write("request\n")
+        time.sleep(0.3)
+        return httpx.Response(200, content=body)
+
+    client = HelldiveAPIClient(
+        cache=SQLiteCache(cache_path, ttl=60),
+        single_flight=SingleFlight(lock_dir),
+        transport=httpx.MockTransport(handler),
+    )
+    assert client.war.get_raw() is not None
+
+
+class TestCrossProcess:
+    def test_one_process_refreshes(self, tmp_path: Path) -> None:
+        log = tmp_path / "requests.log"
+        body = b'{"now": "2026-01-01T00:00:00Z"}'
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(
+                target=_worker,
+                args=(
+                    str(tmp_path / "cache.sqlite3"),
+                    str(tmp_path / "locks"),
+                    str(log),
+                    body,
+                ),
+            )
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+        assert [p.exitcode for p in processes] == [0] * len(processes)
+        assert log.read_text().count("request") == 1
@@ -0,0 +1,72 @@
+"""Tests for GalaxySnapshot and client.snapshot()."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.snapshot import GalaxySnapshot
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+@pytest.fixture
+def galaxy(
+    respx_mock: respx.MockRouter,
+    raw_war: dict,  # type: ignore[type-arg]
+    raw_planet: dict,  # type: ignore[type-arg]
+    raw_campaign: dict,  # type: ignore[type-arg]
+    raw_assignment: dict,  # type: ignore[type-arg]
+    raw_spacestation: dict,  # type: ignore[type-arg]
+) -> respx.MockRouter:
+    bodies: dict[str, object] = {
+        "/v1/war": raw_war,
+        "/v1/planets": [raw_planet],
+        "/v1/campaigns": [raw_campaign],
+        "/v1/assignments": [raw_assignment],
+        "/v2/space-stations": [raw_spacestation],
+    }
+    for path, body in bodies.items():
+        respx_mock.get(f"{BASE_URL}{path}").mock(
+            return_value=httpx.Response(200, json=body)
+        )
+    return respx_mock
+
+
+def check(snapshot: GalaxySnapshot) -> None:
+    assert snapshot.timestamp == snapshot.war.now
+    planet = snapshot.planet(42)
+    assert planet is snapshot.planets[0]
+    assert snapshot.campaigns[0].planet is planet
+    assert snapshot.space_stations[0].planet is planet
+    assert len(snapshot.assignments) == 1
+    assert snapshot.planet(1) is None
+
+
+class TestSnapshot:
+    def test_sync_snapshot(self, galaxy: respx.MockRouter) -> None:
+        check(HelldiveAPIClient().snapshot())
+        assert galaxy.calls.call_count == 5
+
+    def test_async_snapshot(self, galaxy: respx.MockRouter) -> None:
+        async def run() -> GalaxySnapshot:
+            async with AsyncHelldiveAPIClient() as client:
+                return await client.snapshot()
+
+        check(asyncio.run(run()))
+
+    def test_snapshot_is_immutable(self, galaxy: respx.MockRouter) -> None:
+        snapshot = HelldiveAPIClient().snapshot()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.planets = ()  # type: ignore[misc]
+
+    def test_build_does_not_mutate_inputs(self, galaxy: respx.MockRouter) -> None:
+        client = HelldiveAPIClient()
+        planets = client.planets.get_all()
+        campaigns = client.campaigns.get_all()
+        snapshot = GalaxySnapshot.build(client.war.get(), planets, campaigns, [], [])
+        assert snapshot.campaigns[0].planet is planets[0]
+        assert campaigns[0].planet is not planets[0]
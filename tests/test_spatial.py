@@ -0,0 +1,110 @@
+"""Tests for the planet spatial index."""
+
+import math
+import random
+from collections.abc import Callable
+
+import pytest
+
+from helldivepy.models import Planet
+from helldivepy.spatial import SpatialIndex
+
+
+def brute_nearest(planets: list[Planet], x: float, y: float, k: int) -> list[int]:
+    ranked = sorted(
+        planets,
+        key=lambda p: (math.dist((p.position.x, p.position.y), (x, y)), p.index),
+    )
+    return [p.index for p in ranked[:k]]
+
+
+@pytest.fixture
+def random_planets(make_planet: Callable[..., Planet]) -> Callable[..., list[Planet]]:
+    def make(count: int, seed: int = 0) -> list[Planet]:
+        rng = random.Random(seed)
+        return [
+            make_planet(
+                index=i, position={"x": rng.uniform(-1, 1), "y": rng.uniform(-1, 1)}
+            )
+            for i in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def planets(random_planets: Callable[..., list[Planet]]) -> list[Planet]:
+    return random_planets(300)
+
+
+class TestQueries:
+    def test_nearest_matches_brute_force(self, planets: list[Planet]) -> None:
+        index = SpatialIndex(planets)
+        rng = random.Random(1)
+        for _ in range(50):
+            x, y = rng.uniform(-1.5, 1.5), rng.uniform(-1.5, 1.5)
+            for k in (1, 5, 20):
+                assert index.nearest(x, y, k) == brute_nearest(planets, x, y, k)
+
+    def test_nearest_far_outside_grid(self, planets: list[Planet]) -> None:
+        index = SpatialIndex(planets)
+        assert index.nearest(50.0, -50.0, 3) == brute_nearest(planets, 50, -50, 3)
+
+    def test_nearest_far_away_with_small_cells(self, planets: list[Planet]) -> None:
+        # Millions of rings separate the query from the planets: only the
+        # occupied cells may be visited.
+        index = SpatialIndex(planets, cell_size=0.01)
+        for x, y in [(1e4, 1e4), (-1e4, 0.5), (0.0, -1e4)]:
+            assert index.nearest(x, y, 5) == brute_nearest(planets, x, y, 5)
+
+    def test_nearest_more_than_available(
+        self, random_planets: Callable[..., list[Planet]]
+    ) -> None:
+        index = SpatialIndex(random_planets(3))
+        assert sorted(index.nearest(0, 0, 10)) == [0, 1, 2]
+        assert index.nearest(0, 0, 0) == []
+        assert SpatialIndex().nearest(0, 0) == []
+
+    def test_within_radius(self, planets: list[Planet]) -> None:
+        index = SpatialIndex(planets)
+        x, y, radius = 0.1, -0.2, 0.3
+        expected = [
+            p.index
+            for p in planets
+            if math.dist((p.position.x, p.position.y), (x, y)) <= radius
+        ]
+        found = index.within_radius(x, y, radius)
+        assert sorted(found) == sorted(expected)
+        distances = [math.dist(index.position(i), (x, y)) for i in found]
+        assert distances == sorted(distances)
+
+    def test_within_box(self, planets: list[Planet]) -> None:
+        index = SpatialIndex(planets)
+        expected = sorted(
+            p.index
+            for p in planets
+            if -0.5 <= p.position.x <= 0.25 and 0 <= p.position.y <= 0.75
+        )
+        assert index.within_box(-0.5, 0, 0.25, 0.75) == expected
+        assert len(index.within_box(-10, -10, 10, 10)) == len(planets)
+
+    def test_invalid_cell_size(self) -> None:
+        with pytest.raises(ValueError, match="cell_size"):
+            SpatialIndex(cell_size=0)
+
+
+class TestUpdate:
+    def test_moves_and_adds_planets(
+        self, planets: list[Planet], make_planet: Callable[..., Planet]
+    ) -> None:
+        index = SpatialIndex(planets)
+        assert index.update(planets) is False
+        moved = make_planet(index=0, position={"x": 5.0, "y": 5.0})
+        added = make_planet(index=1000, position={"x": -5.0, "y": -5.0})
+        assert index.update([moved, added]) is True
+        assert len(index) == 301
+        assert 1000 in index
+        assert index.position(0) == (5.0, 5.0)
+        assert index.nearest(4.9, 4.9) == [0]
+        assert index.nearest(-4.9, -4.9) == [1000]
+        assert 0 not in index.within_box(-1, -1, 1, 1)
@@ -0,0 +1,210 @@
+"""Tests for JSONArrayDecoder and the streaming iter_all()/iter_new() APIs."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from helldivepy.client import AsyncHelldiveAPIClient, HelldiveAPIClient
+from helldivepy.models import Campaign, Planet
+from helldivepy.streaming import JSONArrayDecoder
+
+BASE_URL = "https://api.helldivers2.dev/api"
+
+
+def decode_in_chunks(body: bytes, size: int) -> list[object]:
+    decoder = JSONArrayDecoder()
+    items: list[object] = []
+    for i in range(0, len(body), size):
+        items.extend(decoder.feed(body[i : i + size]))
+    decoder.close()
+    return items
+
+
+class TestJSONArrayDecoder:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+    def test_any_chunk_size(self, size: int) -> None:
+        data: list[object] = [
+            {"a": 'x,]}\\"', "b": [1, {"c": None}]},
+            {"name": "ÆGIR ☄"},
+            [],
+        ]
+        body = json.dumps(data, indent=2, ensure_ascii=False).encode()
+        assert decode_in_chunks(body, size) == data
+
+    def test_empty_array(self) -> None:
+        assert decode_in_chunks(b" [ ] ", 1) == []
+
+    def test_truncated_body_raises(self) -> None:
+        decoder = JSONArrayDecoder()
+        decoder.feed(b'[{"a": 1}, {"b"')
+        with pytest.raises(ValueError):
+            decoder.close()
+
+    def test_non_array_raises(self) -> None:
+        with pytest.raises(ValueError):
+            JSONArrayDecoder().feed(b'{"a": 1}')
+
+
+class TestIterAll:
+    def test_planets_iter_all(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_planet: dict,  # type: ignore[type-arg]
+    ) -> None:
+        body = json.dumps([{**raw_planet, "index": i} for i in range(5)]).encode()
+
+        def chunks() -> Iterator[bytes]:
+            for i in range(0, len(body), 100):
+                yield body[i : i + 100]
+
+        respx_mock.get(f"{BASE_URL}/v1/planets").mock(
+            return_value=httpx.Response(200, content=chunks())
+        )
+        planets = HelldiveAPIClient().planets.iter_all()
+        first = next(planets)
+        assert isinstance(first, Planet)
+        assert [first.index, *(p.index for p in planets)] == [0, 1, 2, 3, 4]
+
+    def test_iter_all_raises_http_errors(self, respx_mock: respx.MockRouter) -> None:
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(503)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            list(HelldiveAPIClient().campaigns.iter_all())
+
+    def test_async_campaigns_iter_all(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_campaign: dict,  # type: ignore[type-arg]
+    ) -> None:
+        body = json.dumps([raw_campaign, raw_campaign]).encode()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for i in range(0, len(body), 256):
+                yield body[i : i + 256]
+
+        respx_mock.get(f"{BASE_URL}/v1/campaigns").mock(
+            return_value=httpx.Response(200, content=chunks())
+        )
+
+        async def run() -> list[Campaign]:
+            async with AsyncHelldiveAPIClient() as client:
+                return [c async for c in client.campaigns.iter_all()]
+
+        campaigns = asyncio.run(run())
+        assert len(campaigns) == 2
+        assert all(isinstance(c, Campaign) for c in campaigns)
+
+
+def dispatch_chunks(
+    dispatch: dict[str, Any], ids: list[int], read: list[int]
+) -> Iterator[bytes]:
+    """One chunk per copy of `dispatch`; records the IDs actually read."""
+    yield b"["
+    for position, dispatch_id in enumerate(ids):
+        read.append(dispatch_id)
+        separator = b"," if position else b""
+        yield separator + json.dumps({**dispatch, "id": dispatch_id}).encode()
+    yield b"]"
+
+
+class TestIncremental:
+    def test_dispatches_get_since_stops_at_seen_id(
+        self, respx_mock: respx.MockRouter, raw_dispatch: dict[str, Any]
+    ) -> None:
+        read: list[int] = []
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            return_value=httpx.Response(
+                200, content=dispatch_chunks(raw_dispatch, [9, 8, 7, 6, 5, 4, 3], read)
+            )
+        )
+        dispatches = HelldiveAPIClient().dispatches.get_since(7)
+        assert [d.id for d in dispatches] == [9, 8]
+        assert read == [9, 8, 7]
+
+    def test_dispatches_iter_new_keeps_cursor(
+        self, respx_mock: respx.MockRouter, raw_dispatch: dict[str, Any]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v2/dispatches")
+        route.side_effect = [
+            httpx.Response(200, content=dispatch_chunks(raw_dispatch, ids, []))
+            for ids in ([2, 1], [4, 3, 2, 1], [4, 3, 2, 1], [5, 4])
+        ]
+        module = HelldiveAPIClient().dispatches
+        assert [d.id for d in module.iter_new()] == [2, 1]
+        assert module.cursor == 2
+        assert [d.id for d in module.iter_new()] == [4, 3]
+        assert [d.id for d in module.iter_new()] == []
+        assert module.cursor == 4
+        new = module.iter_new()
+        assert next(new).id == 5
+        new.close()
+        assert module.cursor == 4
+
+    def test_steam_get_since_and_iter_new(
+        self,
+        respx_mock: respx.MockRouter,
+        raw_steam_news: dict[str, object],
+    ) -> None:
+        newer = {**raw_steam_news, "id": "2", "publishedAt": "2026-03-18T00:00:00Z"}
+        respx_mock.get(f"{BASE_URL}/v1/steam").mock(
+            return_value=httpx.Response(200, json=[newer, raw_steam_news])
+        )
+        module = HelldiveAPIClient().steam
+        seen = datetime(2026, 3, 17, 14, 18, 19, tzinfo=UTC)
+        assert [n.id for n in module.get_since(seen)] == ["2"]
+        module.cursor = seen
+        assert [n.id for n in module.iter_new()] == ["2"]
+        assert module.cursor == datetime(2026, 3, 18, tzinfo=UTC)
+        assert list(module.iter_new()) == []
+
+    def test_async_dispatches(
+        self, respx_mock: respx.MockRouter, raw_dispatch: dict[str, Any]
+    ) -> None:
+        route = respx_mock.get(f"{BASE_URL}/v2/dispatches")
+        route.side_effect = [
+            httpx.Response(200, json=[{**raw_dispatch, "id": i} for i in ids])
+            for ids in ([3, 2, 1], [4, 3, 2, 1])
+        ]
+
+        async def run() -> tuple[list[int], list[int], int | None]:
+            async with AsyncHelldiveAPIClient() as client:
+                since = await client.dispatches.get_since(1)
+                client.dispatches.cursor = 3
+                new = [d.id async for d in client.dispatches.iter_new()]
+                return [d.id for d in since], new, client.dispatches.cursor
+
+        assert asyncio.run(run()) == ([3, 2], [4], 4)
+
+    def test_async_iter_new_closes_stream_when_closed_early(
+        self, respx_mock: respx.MockRouter, raw_dispatch: dict[str, Any]
+    ) -> None:
+        closed: list[bool] = []
+
+        class Stream(httpx.AsyncByteStream):
+            async def __aiter__(self) -> AsyncIterator[bytes]:
+                for chunk in dispatch_chunks(raw_dispatch, [3, 2, 1], []):
+                    yield chunk
+
+            async def aclose(self) -> None:
+                closed.append(True)
+
+        respx_mock.get(f"{BASE_URL}/v2/dispatches").mock(
+            return_value=httpx.Response(200, stream=Stream())
+        )
+
+        async def run() -> int:
+            async with AsyncHelldiveAPIClient() as client:
+                new = client.dispatches.iter_new()
+                first = await anext(new)
+                await new.aclose()
+                assert closed
+                return first.id
+
+        assert asyncio.run(run()) == 3
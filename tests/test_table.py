@@ -0,0 +1,143 @@
+"""Tests for the columnar planet table."""
+
+import copy
+import json
+from typing import Any
+
+import pytest
+
+from helldivepy.enums import Factions
+from helldivepy.lazy import LazyPlanet
+from helldivepy.models import Planet
+from helldivepy.table import FACTIONS, PlanetTable
+
+
+@pytest.fixture
+def raw_planets(
+    raw_planet: dict[str, Any],
+) -> list[dict[str, Any]]:
+    planets: list[dict[str, Any]] = []
+    for index, (owner, health, players) in enumerate(
+        [
+            ("Terminids", 250000, 1000),
+            ("Automaton", 1000000, 3000),
+            ("Humans", 1000000, 10),
+            ("Terminids", 0, 500),
+        ]
+    ):
+        planet = copy.deepcopy(raw_planet)
+        planet["index"] = index
+        planet["currentOwner"] = owner
+        planet["health"] = health
+        planet["maxHealth"] = 1000000
+        planet["statistics"]["playerCount"] = players
+        planets.append(planet)
+    return planets
+
+
+class TestBuild:
+    def test_from_raw(
+        self,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        table = PlanetTable.from_raw(raw_planets)  # type: ignore[arg-type]
+        assert len(table) == 4
+        assert list(table.index) == [0, 1, 2, 3]
+        assert list(table.players) == [1000, 3000, 10, 500]
+        assert FACTIONS[table.owner[1]] == Factions.Automaton
+        assert table.x[0] == raw_planets[0]["position"]["x"]
+
+    def test_from_planets_matches_from_raw(
+        self,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        planets = [Planet.model_validate(p) for p in raw_planets]
+        assert PlanetTable.from_planets(planets) == PlanetTable.from_raw(
+            raw_planets  # type: ignore[arg-type]
+        )
+
+    def test_from_lazy_planets(
+        self,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        planets = [LazyPlanet.model_validate(p) for p in raw_planets]
+        assert PlanetTable.from_planets(planets) == PlanetTable.from_raw(
+            raw_planets  # type: ignore[arg-type]
+        )
+
+    def test_from_json(
+        self,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        body = json.dumps(raw_planets).encode()
+        assert PlanetTable.from_json(body) == PlanetTable.from_raw(
+            raw_planets  # type: ignore[arg-type]
+        )
+
+
+class TestHelpers:
+    @pytest.fixture(params=["numpy", "builtins"])
+    def table(
+        self,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+        raw_planets: list[dict[str, Any]],
+    ) -> PlanetTable:
+        if request.param == "numpy":
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr("helldivepy.table._HAS_NUMPY", False)
+        return PlanetTable.from_raw(raw_planets)  # type: ignore[arg-type]
+
+    def test_liberation(self, table: PlanetTable) -> None:
+        assert list(table.liberation()) == [75.0, 0.0, 0.0, 100.0]
+
+    def test_owned_by(self, table: PlanetTable) -> None:
+        assert table.owned_by(Factions.Terminids) == [0, 3]
+        assert table.owned_by(Factions.Illuminate) == []
+
+    def test_sum_by_faction(self, table: PlanetTable) -> None:
+        assert table.sum_by_faction() == {
+            Factions.Humans: 10,
+            Factions.Terminids: 1500,
+            Factions.Automaton: 3000,
+            Factions.Illuminate: 0,
+        }
+
+    def test_sum_by_unknown_column_raises(self, table: PlanetTable) -> None:
+        with pytest.raises(ValueError, match="Unknown column"):
+            table.sum_by_faction("bogus")
+
+    def test_top(self, table: PlanetTable) -> None:
+        assert table.top(2) == [1, 0]
+        assert table.top(1, by="health") == [1]
+        assert table.top(10, by="max_health") == [0, 1, 2, 3]
+        assert table.top(0) == []
+
+    def test_row(self, table: PlanetTable) -> None:
+        assert table.row(2) == 2
+        assert table.row(99) is None
+
+
+class TestToNumpy:
+    def test_shares_memory(
+        self,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        np = pytest.importorskip("numpy")
+        table = PlanetTable.from_raw(raw_planets)  # type: ignore[arg-type]
+        arrays = table.to_numpy()
+        assert arrays["players"].sum() == 4510
+        assert arrays["x"].dtype == np.float64
+        table.players[0] = 0
+        assert arrays["players"][0] == 0
+
+    def test_requires_numpy(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        raw_planets: list[dict[str, Any]],
+    ) -> None:
+        monkeypatch.setattr("helldivepy.table._HAS_NUMPY", False)
+        table = PlanetTable.from_raw(raw_planets)  # type: ignore[arg-type]
+        with pytest.raises(ImportError, match="helldivepy\\[numpy\\]"):
+            table.to_numpy()